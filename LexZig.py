@@ -1,12 +1,25 @@
+import os
+import sys
 from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from functools import lru_cache
+from io import StringIO
+from itertools import repeat
+from pprint import pformat
+from shutil import get_terminal_size
+from typing import (cast, Any, Iterator, List, Optional, TextIO, Tuple,
+                    TYPE_CHECKING)
 
-from sys import platform
-if platform == "linux" or platform == "linux2":
-    import readline
+from lexzig.lexer import Lexer, print_diagnostics
+from lexzig.parse_cache import (
+    DEFAULT_DIR, DEFAULT_MAX_BYTES, ParseCache, ParseResult
+)
+from lexzig.parser import Parser, ParserError, shared_parser
 
-from rich.console import Console
-
-from lexzig.parser import Parser, ParserError
+# rich and readline are only imported for terminals and the repl, since
+# importing them takes longer than analysing a small file.
+if TYPE_CHECKING:
+    from rich.console import Console
 
 REPL_BANNER = """Welcome to the LexZig repl!
 
@@ -14,8 +27,33 @@ Enter commands to see the result.
 Enter 'q' to quit.
 """
 
-console = Console()
-error_console = Console(stderr=True)
+# What a program is printed for: the width of the console, its color system
+# and whether it is a terminal.
+Display = Tuple[int, Optional[str], bool]
+
+
+@lru_cache(maxsize=None)
+def console(stderr: bool = False) -> 'Console':
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
+
+def uses_rich(stream: TextIO) -> bool:
+    """
+    Whether what is printed to the stream goes through rich. Terminals get
+    colors, as does anything with FORCE_COLOR set. Everything else is
+    printed as plain text, with programs laid out by pprint.
+
+    Windows consoles are left to rich, which sizes them differently.
+    """
+    if 'FORCE_COLOR' in os.environ or sys.platform == 'win32':
+        return True
+
+    try:
+        return stream.isatty()
+    except ValueError:
+        return False
 
 
 def report_error(parser_error: ParserError) -> None:
@@ -24,29 +62,174 @@ def report_error(parser_error: ParserError) -> None:
     else:
         lineinfo = ""
 
-    error_console.print(
+    if not uses_rich(sys.stderr):
+        sys.stderr.write(f"ERROR: {lineinfo}{parser_error}\n")
+        return
+
+    console(stderr=True).print(
         f"[bold red]ERROR:[/] {lineinfo}" +
         str(parser_error)
     )
 
 
-def analyze_file(filename: str) -> None:
-    parser = Parser()
-    with open(filename) as f:
+def find_files(paths: List[str]) -> List[str]:
+    """
+    Expand directories into the Zig files in them, in a stable order.
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+
+        for root, directories, names in os.walk(path):
+            directories.sort()
+            files.extend(os.path.join(root, name)
+                         for name in sorted(names) if name.endswith('.zig'))
+
+    return files
+
+
+def warm_up() -> None:
+    """
+    Load the lexer and parser tables before the first file comes in.
+    """
+    Lexer()
+    shared_parser()
+
+
+def parse_file(filename: str) -> ParseResult:
+    output = StringIO()
+
+    # What the lexer and parser find wrong is printed, so keep it to be
+    # cached along with the result.
+    with redirect_stdout(output):
         try:
-            console.print(parser.parse(f.read()))
+            lexer = Lexer()
+            program = shared_parser().parse_tokens(
+                print_diagnostics(lexer, lexer.iter_file(filename)),
+                engine='descent')
         except ParserError as parser_error:
-            report_error(parser_error)
+            return ParseResult(None, parser_error, output.getvalue())
+
+    return ParseResult(program, output=output.getvalue())
+
+
+def analyze_file(filename: str, cache: Optional[ParseCache],
+                 display: Display) -> ParseResult:
+    """
+    Parse a file and render its program, unless the cache has them already.
+    """
+    # Only reading the file is reported as such. The cache skips what it
+    # cannot write.
+    try:
+        result = None
+        if cache is not None:
+            key = cache.key(filename)
+            result = cache.get(key)
+
+        parsed = result is None
+        if result is None:
+            result = parse_file(filename)
+    except OSError as os_error:
+        return ParseResult(None, ParserError(
+            f'Cannot read {filename}: {os_error.strerror}'))
+
+    if cache is not None and parsed and result.error is not None:
+        cache.put(key, result)
+
+    rendering = ':'.join(map(str, display))
+    if result.error is None and rendering not in result.rendered:
+        result.rendered[rendering] = render(result.program, display)
+        if cache is not None:
+            cache.put(key, result)
+
+    return result
+
+
+def render(program: Any, display: Display) -> str:
+    """
+    Render a program for a display, with rich only if it is a terminal.
+    """
+    width, color_system, is_terminal = display
+    if not is_terminal:
+        return pformat(program, width=width) + '\n'
+
+    from rich.console import Console
+
+    renderer = Console(width=width, color_system=cast(Any, color_system),
+                       force_terminal=is_terminal)
+    with renderer.capture() as capture:
+        renderer.print(program)
+    return capture.get()
+
+
+def analyze_files(files: List[str], jobs: int, cache: Optional[ParseCache],
+                  display: Display) -> Iterator[ParseResult]:
+    """
+    Analyse files in as many worker processes as jobs, yielding the results
+    in the order of the files.
+    """
+    if jobs == 1 or len(files) == 1:
+        for filename in files:
+            yield analyze_file(filename, cache, display)
+        return
+
+    # Files are handed out a few at a time, so that many small files do not
+    # cost a round trip each.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(files) // (jobs * 8))
+    with ProcessPoolExecutor(jobs, initializer=warm_up) as pool:
+        yield from pool.map(analyze_file, files, repeat(cache),
+                            repeat(display), chunksize=chunksize)
+
+
+def show_result(result: ParseResult, display: Display) -> None:
+    sys.stdout.write(result.output)
+    if result.error is not None:
+        report_error(result.error)
+    else:
+        sys.stdout.write(result.rendered[':'.join(map(str, display))])
+
+
+def get_display() -> Display:
+    """
+    Return what programs are printed for on the standard output.
+    """
+    if not uses_rich(sys.stdout):
+        return (get_terminal_size().columns, None, False)
+
+    return (console().width, console().color_system, console().is_terminal)
+
+
+def show_heading(filename: str, display: Display) -> None:
+    """
+    Print the name of a file before its result, in bold on terminals.
+    """
+    if uses_rich(sys.stdout):
+        console().print(filename, style='bold', markup=False)
+    else:
+        sys.stdout.write(filename + '\n')
 
 
 def repl() -> None:
+    if sys.platform.startswith('linux'):
+        # Gives the prompt line editing and history.
+        import readline
+
     parser = Parser()
-    console.print(REPL_BANNER, style="bold")
+    repl_console = console()
+    repl_console.print(REPL_BANNER, style="bold")
 
-    while (line := console.input(":high_voltage: ")) != 'q':
+    while (line := repl_console.input(":high_voltage: ")) != 'q':
         try:
-            result = parser.parse(line)
-            console.print(result)
+            lexer = Lexer()
+            tokens = lexer.lex(line)
+            for diagnostic in lexer.diagnostics:
+                print(diagnostic.message)
+            result = parser.parse_tokens(tokens)
+            repl_console.print(result)
         except ParserError as parser_error:
             report_error(parser_error)
 
@@ -57,15 +240,41 @@ def main() -> None:
         description='Lexical and syntactical analysis for a subset of the Zig programming language.',
     )
 
-    parser.add_argument('filename', help='The file to analyze.', nargs='?')
+    parser.add_argument('paths', help='The files, or directories of .zig files, to analyze.', nargs='*')
     parser.add_argument(
         '--repl', help='Start the repl. This is the default if not filename is provided.', action='store_true')
+    parser.add_argument(
+        '-j', '--jobs', help='How many files to analyze at once. Defaults to 1, and 0 means one per core.', type=int, default=1)
+    parser.add_argument(
+        '--no-cache', help='Parse the file even if it was parsed before, without caching the result.', action='store_true')
+    parser.add_argument(
+        '--clear-cache', help='Remove every cached result before starting.', action='store_true')
+    parser.add_argument(
+        '--cache-dir', help=f'Where parse results are cached. Defaults to {DEFAULT_DIR}.', default=DEFAULT_DIR)
+    parser.add_argument(
+        '--cache-size', help='Maximum size of the cache in bytes.', type=int, default=DEFAULT_MAX_BYTES)
 
     args = parser.parse_args()
 
-    if args.filename:
-        analyze_file(args.filename)
-    else:
+    cache = ParseCache(args.cache_dir, args.cache_size)
+    if args.clear_cache:
+        cache.clear()
+
+    if args.paths:
+        files = find_files(args.paths)
+        jobs = args.jobs or os.cpu_count() or 1
+        display = get_display()
+
+        results = analyze_files(files, jobs, None if args.no_cache else cache,
+                                display)
+        for filename, result in zip(files, results):
+            if len(files) > 1:
+                show_heading(filename, display)
+            show_result(result, display)
+
+        if not args.no_cache:
+            cache.trim()
+    elif not args.clear_cache or args.repl:
         repl()
 
 
@@ -0,0 +1,48 @@
+"""
+Measure the memory taken by the AST of a large generated program.
+
+    python -m benchmarks.ast_memory [--statements 20000]
+"""
+import argparse
+import tracemalloc
+
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser
+
+STATEMENT = '''pub fn f(a: i32) i32 {
+    const b = .{ .x = a + 1, .y = "s" };
+    while (a < 10) : (a += 1) {}
+    return switch (b.x) { 1...3 => 2, else => a * 2 };
+}
+'''
+
+
+def count_nodes(node: object) -> int:
+    if isinstance(node, list):
+        return sum(count_nodes(item) for item in node)
+    if hasattr(node, '__dataclass_fields__'):
+        return 1 + sum(count_nodes(getattr(node, name))
+                       for name in node.__dataclass_fields__)
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--statements', type=int, default=20000)
+    args = parser.parse_args()
+
+    tokens = Lexer().lex(STATEMENT * args.statements)
+    zig_parser = Parser()
+
+    tracemalloc.start()
+    program = zig_parser.parse_tokens(tokens)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nodes = count_nodes(program)
+    print(f'{nodes} nodes: {size / 2 ** 20:.2f} MiB, '
+          f'{size / nodes:.1f} bytes per node')
+
+
+if __name__ == '__main__':
+    main()
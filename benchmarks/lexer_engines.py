@@ -0,0 +1,40 @@
+"""
+Compare the throughput of the lexer engines on the benchmark workloads.
+
+    python -m benchmarks.lexer_engines [--scale 1] [--repeat 5]
+"""
+import argparse
+import time
+
+from benchmarks.workloads import SIZES, WORKLOADS
+from lexzig.lexer import ENGINES, Lexer
+
+
+def best_seconds(engine: str, source: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Lexer(engine=engine).lex(source)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, generate in WORKLOADS.items():
+        source = generate(max(1, int(SIZES[name] * args.scale)))
+        tokens = len(Lexer().lex(source))
+
+        rates = {engine: tokens / best_seconds(engine, source, args.repeat)
+                 for engine in ENGINES}
+        print(f'{name:22}' + ''.join(
+            f'{engine:>6} {rate:10.0f} tokens/s' for engine, rate in rates.items()) +
+            f'   x{rates["fast"] / rates["ply"]:.2f}')
+
+
+if __name__ == '__main__':
+    main()
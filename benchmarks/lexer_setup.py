@@ -0,0 +1,37 @@
+"""
+Measure what it costs to get a lexer ready for a new input.
+
+    python -m benchmarks.lexer_setup
+"""
+import timeit
+
+import ply.lex as pylex  # type: ignore
+
+from lexzig.lexer import Lexer
+
+ROUNDS = 200
+
+
+def build_from_rules() -> None:
+    """
+    What every parse used to pay: reflect on the rules and compile the
+    master regular expression.
+    """
+    pylex.lex(module=Lexer()).input('')
+
+
+def clone_template() -> None:
+    Lexer().input('')
+
+
+def main() -> None:
+    clone_template()
+
+    for name, setup in [('build from rules', build_from_rules),
+                        ('clone template', clone_template)]:
+        seconds = timeit.timeit(setup, number=ROUNDS) / ROUNDS
+        print(f'{name:>20}: {seconds * 1e6:10.1f} us per lexer')
+
+
+if __name__ == '__main__':
+    main()
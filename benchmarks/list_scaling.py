@@ -0,0 +1,47 @@
+"""
+Check that parsing long sequences scales linearly with their length.
+
+    python -m benchmarks.list_scaling [--max-exponent 6]
+
+The time per element should stay roughly flat as the sizes grow.
+"""
+import argparse
+import time
+from typing import Callable, Dict
+
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser
+
+SHAPES: Dict[str, Callable[[int], str]] = {
+    'statements': lambda n: 'x;\n' * n,
+    'array elements': lambda n: 'const a = .{' + '1, ' * n + '};',
+    'function arguments': lambda n: 'f(' + 'x, ' * n + ');',
+    'struct fields': lambda n: 'const S = struct {' + 'x: i32, ' * n + '};',
+    'initializer pairs': lambda n: 'const s = .{' + '.x = 1, ' * n + '};',
+    'switch branches': lambda n: 'switch (x) {' + '1 => 2, ' * n + '};',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-exponent', type=int, default=6)
+    args = parser.parse_args()
+
+    zig_parser = Parser()
+
+    for shape, generate in SHAPES.items():
+        print(shape)
+        for exponent in range(3, args.max_exponent + 1):
+            n = 10 ** exponent
+            tokens = Lexer().lex(generate(n))
+
+            start = time.perf_counter()
+            zig_parser.parse_tokens(tokens)
+            seconds = time.perf_counter() - start
+
+            print(f'{n:>10} elements: {seconds:8.3f} s, '
+                  f'{seconds / n * 1e6:6.2f} us per element')
+
+
+if __name__ == '__main__':
+    main()
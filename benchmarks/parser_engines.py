@@ -0,0 +1,46 @@
+"""
+Compare the throughput of the parser engines on the benchmark workloads.
+
+    python -m benchmarks.parser_engines [--scale 1] [--repeat 5]
+
+The tokens are lexed once, so only the parsers are timed.
+"""
+import argparse
+import time
+from typing import List
+
+from ply.lex import LexToken  # type: ignore
+
+from benchmarks.workloads import SIZES, WORKLOADS
+from lexzig.lexer import Lexer
+from lexzig.parser import ENGINES, shared_parser
+
+
+def best_seconds(engine: str, tokens: List[LexToken], repeat: int) -> float:
+    parser = shared_parser()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse_tokens(tokens, engine=engine)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, generate in WORKLOADS.items():
+        tokens = Lexer().lex(generate(max(1, int(SIZES[name] * args.scale))))
+
+        rates = {engine: len(tokens) / best_seconds(engine, tokens, args.repeat)
+                 for engine in ENGINES}
+        print(f'{name:22}' + ''.join(
+            f'{engine:>8} {rate:10.0f} tokens/s' for engine, rate in rates.items()) +
+            f'   x{rates["descent"] / rates["lalr"]:.2f}')
+
+
+if __name__ == '__main__':
+    main()
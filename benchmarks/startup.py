@@ -0,0 +1,81 @@
+"""
+Time how long the CLI takes to start, against a budget.
+
+    python -m benchmarks.startup [--repeat 10] [--budget 80]
+
+Every command runs in a fresh interpreter, with its output piped as in
+scripts, and the best of the runs is reported. The CLI analyses a small
+file without the cache, and then again from it. Exits with an error if the
+CLI takes longer than the budget, in milliseconds, to analyse the file.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLI = os.path.join(ROOT, 'LexZig.py')
+
+SOURCE = '''const std = @import("std");
+
+fn add(a: i32, b: i32) i32 {
+    return a + b;
+}
+
+pub fn main() void {
+    var total = add(1, 2);
+    while (total < 10) : (total += 1) {}
+}
+'''
+
+
+def best_seconds(command: List[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, stdin=subprocess.DEVNULL,
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                       check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=80)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'small.zig')
+        with open(filename, 'w') as f:
+            f.write(SOURCE)
+        cache = ['--cache-dir', os.path.join(directory, 'cache')]
+
+        # Fill the cache for the cached run.
+        best_seconds([sys.executable, CLI, *cache, filename], 1)
+
+        commands = {
+            'python': [sys.executable, '-c', 'pass'],
+            'import lexzig': [sys.executable, '-c', 'import lexzig'],
+            'cli': [sys.executable, CLI, '--no-cache', filename],
+            'cli, cached': [sys.executable, CLI, *cache, filename],
+        }
+        times = {name: best_seconds(command, args.repeat)
+                 for name, command in commands.items()}
+
+    for name, seconds in times.items():
+        print(f'{name:14} {seconds * 1000:8.1f} ms')
+
+    if times['cli'] * 1000 > args.budget:
+        print(f'The CLI is over its budget of {args.budget:.0f} ms',
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
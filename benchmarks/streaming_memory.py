@@ -0,0 +1,50 @@
+"""
+Compare the peak memory of parsing a generated file at once and one
+statement at a time.
+
+    python -m benchmarks.streaming_memory [--max-exponent 5]
+
+The peak of the streaming parse should stay flat as the file grows.
+"""
+import argparse
+import tracemalloc
+from typing import Callable
+
+from lexzig.parser import Parser
+
+STATEMENT = 'pub fn f(a: i32) i32 {\n    const b = .{ .x = a, .y = 2 };\n    return b;\n}\n'
+
+
+def peak(run: Callable[[], None]) -> int:
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-exponent', type=int, default=5)
+    args = parser.parse_args()
+
+    zig_parser = Parser()
+
+    for exponent in range(2, args.max_exponent + 1):
+        n = 10 ** exponent
+        source = STATEMENT * n
+
+        def whole() -> None:
+            zig_parser.parse(source)
+
+        def streaming() -> None:
+            for _ in zig_parser.iter_parse(source):
+                pass
+
+        print(f'{n:>8} statements: '
+              f'parse {peak(whole) / 2 ** 20:8.2f} MiB, '
+              f'iter_parse {peak(streaming) / 2 ** 20:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
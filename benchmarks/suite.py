@@ -0,0 +1,177 @@
+"""
+Measure the lexer, parser and whole analysis on generated workloads.
+
+    python -m benchmarks.suite [--scale 1] [--repeat 5] [--workload NAME]
+                               [--output results.json]
+                               [--compare baseline.json] [--threshold 0.1]
+
+Every workload of benchmarks.workloads is measured for tokens per second
+lexed by Lexer.lex, statements and tokens per second parsed by Parser.parse,
+and the latency and peak memory of run_analysis. With --compare, results
+that got worse than the baseline by more than the threshold are reported,
+and the exit status is 1 when there are any.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.workloads import SIZES, WORKLOADS
+from lexzig import run_analysis
+from lexzig.lexer import LEXER_VERSION, Lexer
+from lexzig.parser import GRAMMAR_VERSION, shared_parser
+
+Results = Dict[str, Any]
+
+# The metrics of a workload, and whether a higher value is better.
+METRICS: Dict[str, bool] = {
+    'lex_tokens_per_second': True,
+    'parse_statements_per_second': True,
+    'parse_tokens_per_second': True,
+    'analysis_seconds': False,
+    'analysis_peak_bytes': False,
+}
+
+
+def median_seconds(func: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def measure(source: str, repeat: int) -> Results:
+    """
+    Measure one workload. Peak memory is taken in a run of its own, since
+    tracing allocations slows everything down.
+    """
+    parser = shared_parser()
+    tokens = len(Lexer().lex(source))
+    statements = len(parser.parse(source).stmts)
+
+    lex_seconds = median_seconds(lambda: Lexer().lex(source), repeat)
+    parse_seconds = median_seconds(lambda: parser.parse(source), repeat)
+    analysis_seconds = median_seconds(lambda: run_analysis(source), repeat)
+
+    tracemalloc.start()
+    run_analysis(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'bytes': len(source.encode()),
+        'tokens': tokens,
+        'statements': statements,
+        'lex_tokens_per_second': tokens / lex_seconds,
+        'parse_statements_per_second': statements / parse_seconds,
+        'parse_tokens_per_second': tokens / parse_seconds,
+        'analysis_seconds': analysis_seconds,
+        'analysis_peak_bytes': peak,
+    }
+
+
+def run(names: List[str], scale: float, repeat: int) -> Results:
+    # Build the tables before timing anything.
+    Lexer()
+    shared_parser()
+
+    workloads = {}
+    for name in names:
+        size = max(1, int(SIZES[name] * scale))
+        workloads[name] = {'size': size,
+                           **measure(WORKLOADS[name](size), repeat)}
+
+    return {
+        'python': platform.python_version(),
+        'lexer_version': LEXER_VERSION,
+        'grammar_version': GRAMMAR_VERSION,
+        'scale': scale,
+        'repeat': repeat,
+        'workloads': workloads,
+    }
+
+
+def compare(results: Results, baseline: Results,
+            threshold: float) -> List[str]:
+    """
+    Return a message for every metric that got worse than in the baseline
+    by more than threshold, a fraction of the baseline value.
+
+    Workloads are only compared when they were generated with the same size.
+    """
+    regressions = []
+
+    for name, current in results['workloads'].items():
+        previous = baseline['workloads'].get(name)
+        if previous is None or previous['size'] != current['size']:
+            continue
+
+        for metric, higher_is_better in METRICS.items():
+            if metric not in previous or not previous[metric]:
+                continue
+            change = (current[metric] - previous[metric]) / previous[metric]
+            if higher_is_better:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    f'{name} {metric}: {previous[metric]:.6g} -> '
+                    f'{current[metric]:.6g} ({change:+.1%} worse)')
+
+    return regressions
+
+
+def report(results: Results) -> None:
+    for name, workload in results['workloads'].items():
+        print(f'{name} (size {workload["size"]}, '
+              f'{workload["tokens"]} tokens, '
+              f'{workload["statements"]} statements)')
+        print(f'  lex:      {workload["lex_tokens_per_second"]:12.0f} tokens/s')
+        print(f'  parse:    {workload["parse_statements_per_second"]:12.1f} '
+              f'statements/s, {workload["parse_tokens_per_second"]:.0f} tokens/s')
+        print(f'  analysis: {workload["analysis_seconds"] * 1e3:12.2f} ms, '
+              f'{workload["analysis_peak_bytes"] / 2 ** 20:.2f} MiB peak')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', type=float, default=1,
+                        help='multiply the size of every workload')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs to take the median time of')
+    parser.add_argument('--workload', action='append', choices=WORKLOADS,
+                        help='only run this workload (repeatable)')
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='report regressions against these results')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='fraction a metric may get worse by')
+    args = parser.parse_args()
+
+    results = run(args.workload or list(WORKLOADS), args.scale, args.repeat)
+    report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            sys.exit(1)
+        print(f'No regressions against {args.compare}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Generate Zig programs of a given size in the shapes the benchmarks use.
+
+Every generator takes a size and returns source that lexzig parses without
+errors, so that the benchmarks measure the happy path.
+"""
+from typing import Callable, Dict
+
+FUNCTION = '''pub fn function{i}(a: i32, b: i32) i32 {{
+    var total: i32 = 0;
+    while (total < 10) : (total += 1) {{
+        std.debug.print("{{}}\\n", .{{total}});
+    }}
+    const point = Point{{ .x = a, .y = b }};
+    const best = if (a == b) point.x else try compute(a * b + {i}, total);
+    return best;
+}}
+'''
+
+
+def many_functions(size: int) -> str:
+    """
+    A file with size functions, like a large module.
+    """
+    return ('const std = @import("std");\n\n' +
+            '\n'.join(FUNCTION.format(i=i) for i in range(size)))
+
+
+def deep_expressions(size: int) -> str:
+    """
+    Statements holding an expression nested size levels deep. The grammar
+    has no parentheses for grouping, so the nesting is made of calls.
+    """
+    expression = 'x'
+    for i in range(size):
+        expression = f'f({expression} + {i}, y) * y'
+    return f'const a = {expression};\n' * 10
+
+
+def big_switch(size: int) -> str:
+    """
+    A switch with size branches of every kind.
+    """
+    branches = []
+    for i in range(size):
+        if i % 3 == 0:
+            branches.append(f'    {i * 10}...{i * 10 + 5} => {i},')
+        elif i % 3 == 1:
+            branches.append(f'    {i * 10}, {i * 10 + 1} => f({i}),')
+        else:
+            branches.append(f'    {i * 10} => "{i}",')
+    return ('pub fn main() void {\n'
+            '  var x = switch (y) {\n' + '\n'.join(branches) +
+            '\n    else => 0,\n  };\n}\n')
+
+
+def large_struct_literal(size: int) -> str:
+    """
+    A struct declaration and an instance of it with size fields.
+    """
+    fields = ''.join(f'    field{i}: i32,\n' for i in range(size))
+    values = ''.join(f'    .field{i} = {i},\n' for i in range(size))
+    return (f'const Big = struct {{\n{fields}}};\n'
+            f'const big = Big{{\n{values}}};\n')
+
+
+def long_array(size: int) -> str:
+    """
+    An anonymous array literal with size elements.
+    """
+    return ('const values = .{' +
+            ', '.join(str(i) if i % 2 else f'"s{i}"' for i in range(size)) +
+            '};\n')
+
+
+# Every workload and its size at scale 1.
+WORKLOADS: Dict[str, Callable[[int], str]] = {
+    'many_functions': many_functions,
+    'deep_expressions': deep_expressions,
+    'big_switch': big_switch,
+    'large_struct_literal': large_struct_literal,
+    'long_array': long_array,
+}
+
+SIZES: Dict[str, int] = {
+    'many_functions': 500,
+    'deep_expressions': 500,
+    'big_switch': 5000,
+    'large_struct_literal': 5000,
+    'long_array': 20000,
+}
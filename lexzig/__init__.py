@@ -1,14 +1,59 @@
-from ply.lex import LexToken  # type: ignore
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-from typing import Tuple, List
+if TYPE_CHECKING:
+    from ply.lex import LexToken  # type: ignore
 
-import lexzig.ast as ast
-from lexzig.parser import Parser
-from lexzig.lexer import Lexer
+    import lexzig.ast as ast
+    from lexzig.diagnostics import Diagnostic
+    from lexzig.parser import Parser, shared_parser
+    from lexzig.lexer import Lexer
 
+# What the package exports, by the module that defines it. They are imported
+# on first use, so that importing one module of the package does not load
+# the grammar and the node classes along with it.
+_EXPORTS = {
+    'ast': 'lexzig.ast',
+    'Parser': 'lexzig.parser',
+    'shared_parser': 'lexzig.parser',
+    'Lexer': 'lexzig.lexer',
+}
 
-def run_analysis(input: str) -> Tuple[List[LexToken], ast.Program]:
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = import_module(_EXPORTS[name])
+    value = module if name == 'ast' else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def run_analysis(input: str,
+                 diagnostics: Optional[List['Diagnostic']] = None
+                 ) -> Tuple[List['LexToken'], 'ast.Program']:
     """
     Analyse the given source code.
+
+    The source is lexed once and the same tokens are fed to the parser. What
+    the lexer and the parser find wrong is added to diagnostics in the order
+    it appears in the input or, without it, printed in that order.
     """
-    return Lexer().lex(input), Parser().parse(input)
+    from lexzig.lexer import Lexer
+    from lexzig.parser import shared_parser
+
+    lexer = Lexer()
+    syntax_errors: List['Diagnostic'] = []
+    try:
+        tokens = lexer.lex(input)
+        return tokens, shared_parser().parse_tokens(tokens,
+                                                    diagnostics=syntax_errors)
+    finally:
+        found = sorted(lexer.diagnostics + syntax_errors,
+                       key=lambda diagnostic: diagnostic.lexpos)
+        if diagnostics is None:
+            for diagnostic in found:
+                print(diagnostic.message)
+        else:
+            diagnostics += found
@@ -4,18 +4,80 @@ from typing import List, Optional, Any, Callable
 
 def ast_node(name: str) -> Callable[[Any], Any]:
     """
-    Attach the type of node to an ast node.
+    Attach the type of node to an ast node, before it is made a dataclass.
+
+    The type is a class constant. Nodes with fields list it as their last
+    one, so that it is part of their repr, equality and serialized form,
+    but it is not stored by the instances, which keep their fields in slots
+    instead of a __dict__. Their constructors still take it after the
+    fields, as long as it is the type of the node.
     """
 
-    def inner(self: Any) -> Any:
-        if hasattr(self, '__annotations__'):
-            self.__annotations__['type'] = str
-        setattr(self, 'type', name)
-        return self
+    def inner(cls: Any) -> Any:
+        annotations = cls.__dict__.get('__annotations__', {})
+        defaults = {key: cls.__dict__[key]
+                    for key in annotations if key in cls.__dict__}
+
+        # Slots cannot be added to a class after it is created, and they
+        # cannot share their names with the defaults of the fields.
+        namespace = {
+            key: value for key, value in cls.__dict__.items()
+            if key not in ('__dict__', '__weakref__') and key not in defaults
+        }
+        namespace['__slots__'] = tuple(annotations)
+        namespace['type'] = name
+        if annotations:
+            namespace['__annotations__'] = {**annotations, 'type': str}
+            namespace['type'] = _NodeType(name)
+        cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+        for key, default in defaults.items():
+            setattr(cls, key, _Default(cls.__dict__[key], default))
+
+        return cls
 
     return inner
 
 
+class _NodeType:
+    """
+    The type of the nodes of a class, which is their last field. Setting it
+    on a node, as the constructor does, only checks that it is this one.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, node: Any, owner: Any = None) -> str:
+        return self.name
+
+    def __set__(self, node: Any, value: str) -> None:
+        if value != self.name:
+            raise ValueError(f'{type(node).__name__} nodes have type '
+                             f'{self.name!r}, not {value!r}')
+
+
+class _Default:
+    """
+    The slot of a field with a default, which dataclass reads from the
+    class.
+    """
+    __slots__ = ('slot', 'default')
+
+    def __init__(self, slot: Any, default: Any) -> None:
+        self.slot = slot
+        self.default = default
+
+    def __get__(self, node: Any, owner: Any = None) -> Any:
+        if node is None:
+            return self.default
+        return self.slot.__get__(node, owner)
+
+    def __set__(self, node: Any, value: Any) -> None:
+        self.slot.__set__(node, value)
+
+
 @dataclass
 @ast_node("stmt")
 class Stmt:
@@ -0,0 +1,269 @@
+import hashlib
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ply.lex import LexToken  # type: ignore
+
+import lexzig.ast as ast
+from lexzig.tokens import KINDS, KIND_IDS
+
+MEDIA_TYPE = 'application/vnd.lexzig+binary'
+
+MAGIC = b'LZB'
+
+FORMAT_VERSION = 1
+
+# Kinds of node in the order they are declared, which gives them their tags.
+NODES: List[type] = [
+    node for node in vars(ast).values()
+    if isinstance(node, type) and is_dataclass(node)
+]
+
+# The fields of every kind of node that are stored, in constructor order.
+# The type of node is the same for all of them.
+NODE_FIELDS: Dict[type, List[str]] = {
+    node: [f.name for f in fields(node) if f.name != 'type'] for node in NODES
+}
+
+# Tags of the values that are not nodes. Node tags come after them, and all
+# of them fit in a byte.
+NONE, INT, STR, LIST = range(4)
+FIRST_NODE = 4
+assert FIRST_NODE + len(NODES) <= 0x100
+
+# Token kinds are stored as a single byte too.
+assert len(KINDS) < 0x80
+
+
+class BinaryFormatError(Exception):
+    """
+    Raised when data is not in the binary format of this version of lexzig.
+    """
+
+
+def _schema_version() -> str:
+    """
+    Hash what the tags and fields of the format stand for, so that data
+    written for other nodes or tokens is rejected instead of misread.
+    """
+    parts = [f'{node.__name__}({",".join(NODE_FIELDS[node])})'
+             for node in NODES]
+    parts += KINDS
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:16]
+
+
+SCHEMA_VERSION = _schema_version()
+
+HEADER = MAGIC + bytes([FORMAT_VERSION]) + bytes.fromhex(SCHEMA_VERSION)
+
+
+def dumps(program: Optional[ast.Program],
+          tokens: Iterable[LexToken] = ()) -> bytes:
+    """
+    Encode a program, and the tokens it was parsed from, in the binary
+    format.
+
+    The data starts with the header, followed by the table of every string
+    in it, the tokens and the program. Values start with a byte that tells
+    what they are, and integers are varints.
+    """
+    writer = _Writer()
+
+    count = 0
+    body = bytearray()
+    previous_line = 1
+    previous_position = 0
+    for token in tokens:
+        # Lines and positions grow from token to token, so their deltas are
+        # small.
+        writer.varint(body, KIND_IDS[token.type])
+        writer.value(body, token.value)
+        writer.signed(body, token.lineno - previous_line)
+        writer.signed(body, token.lexpos - previous_position)
+        previous_line = token.lineno
+        previous_position = token.lexpos
+        count += 1
+
+    writer.varint(writer.out, count)
+    writer.out += body
+    writer.value(writer.out, program)
+
+    table = bytearray()
+    writer.varint(table, len(writer.strings))
+    for string in writer.strings:
+        encoded = string.encode('utf-8')
+        writer.varint(table, len(encoded))
+        table += encoded
+
+    return HEADER + bytes(table) + bytes(writer.out)
+
+
+def loads(data: bytes) -> Tuple[Optional[ast.Program], List[LexToken]]:
+    """
+    Decode a program and its tokens from the binary format.
+    """
+    if data[:len(HEADER)] != HEADER:
+        if data[:len(MAGIC)] != MAGIC:
+            raise BinaryFormatError('Not lexzig binary data')
+        raise BinaryFormatError('Binary data from another version of lexzig')
+
+    try:
+        reader = _Reader(data, len(HEADER))
+        tokens = reader.tokens()
+        program = reader.value()
+    except (IndexError, KeyError, TypeError, UnicodeDecodeError,
+            RecursionError) as error:
+        raise BinaryFormatError(f'Corrupt binary data: {error}') from error
+
+    if reader.position != len(data) or not (
+            program is None or isinstance(program, ast.Program)):
+        raise BinaryFormatError('Corrupt binary data')
+    return program, tokens
+
+
+class _Writer:
+    """
+    Encode values, collecting their strings in a table.
+    """
+
+    def __init__(self) -> None:
+        self.out = bytearray()
+        self.strings: Dict[str, int] = {}
+        self.nodes: Dict[type, Tuple[int, List[Callable[[Any], Any]]]] = {
+            node: (FIRST_NODE + tag, [attrgetter(name)
+                                      for name in NODE_FIELDS[node]])
+            for tag, node in enumerate(NODES)
+        }
+
+    def varint(self, out: bytearray, n: int) -> None:
+        while n >= 0x80:
+            out.append(n & 0x7f | 0x80)
+            n >>= 7
+        out.append(n)
+
+    def signed(self, out: bytearray, n: int) -> None:
+        # Zigzag encode, so that small negative numbers stay small.
+        self.varint(out, n << 1 if n >= 0 else (-n << 1) - 1)
+
+    def value(self, out: bytearray, value: Any) -> None:
+        cls = value.__class__
+
+        if cls is str:
+            out.append(STR)
+            self.varint(out, self.strings.setdefault(value, len(self.strings)))
+        elif cls is int:
+            out.append(INT)
+            self.signed(out, value)
+        elif cls is list:
+            out.append(LIST)
+            self.varint(out, len(value))
+            for item in value:
+                self.value(out, item)
+        elif value is None:
+            out.append(NONE)
+        else:
+            try:
+                tag, getters = self.nodes[cls]
+            except KeyError:
+                raise TypeError(
+                    f'Object of type {cls.__name__} cannot be encoded') from None
+            out.append(tag)
+            for get in getters:
+                self.value(out, get(value))
+
+
+class _Reader:
+    """
+    Decode values from the position that follows the header.
+    """
+
+    def __init__(self, data: bytes, position: int) -> None:
+        self.data = data
+        self.position = position
+
+        count = self.varint()
+        self.strings: List[str] = []
+        for _ in range(count):
+            length = self.varint()
+            end = self.position + length
+            if end > len(data):
+                raise BinaryFormatError('Corrupt binary data')
+            self.strings.append(str(data[self.position:end], 'utf-8'))
+            self.position = end
+
+    def varint(self) -> int:
+        data = self.data
+        byte = data[self.position]
+        self.position += 1
+        if byte < 0x80:
+            return byte
+
+        n = byte & 0x7f
+        shift = 7
+        while byte & 0x80:
+            byte = data[self.position]
+            self.position += 1
+            n |= (byte & 0x7f) << shift
+            shift += 7
+        return n
+
+    def signed(self) -> int:
+        n = self.varint()
+        return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+    def tokens(self) -> List[LexToken]:
+        data = self.data
+        strings = self.strings
+        tokens = []
+        line = 1
+        position = 0
+
+        for _ in range(self.varint()):
+            token = LexToken()
+            token.type = KINDS[data[self.position]]
+
+            # Most tokens are a string and two small positive deltas, each a
+            # byte.
+            at = self.position + 1
+            if (data[at] == STR and data[at + 1] < 0x80
+                    and (data[at + 2] | data[at + 3]) & 0x81 == 0):
+                token.value = strings[data[at + 1]]
+                line += data[at + 2] >> 1
+                position += data[at + 3] >> 1
+                self.position = at + 4
+            else:
+                self.position = at
+                token.value = self.value()
+                line += self.signed()
+                position += self.signed()
+
+            token.lineno = line
+            token.lexpos = position
+            tokens.append(token)
+
+        return tokens
+
+    def value(self) -> Any:
+        data = self.data
+        position = self.position
+        tag = data[position]
+
+        # Most strings and lists are short enough for a one byte varint.
+        if tag == STR and data[position + 1] < 0x80:
+            self.position = position + 2
+            return self.strings[data[position + 1]]
+
+        self.position = position + 1
+
+        if tag == STR:
+            return self.strings[self.varint()]
+        if tag == INT:
+            return self.signed()
+        if tag == LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == NONE:
+            return None
+
+        node = NODES[tag - FIRST_NODE]
+        return node(*[self.value() for _ in NODE_FIELDS[node]])
@@ -0,0 +1,478 @@
+"""
+A recursive descent parser for the grammar of lexzig.parser.
+
+Every statement and every construct that starts with its own token has a
+method, and binary operators are parsed by precedence climbing over the
+levels of Parser.precedence. Where the grammar is ambiguous, the choices are
+the ones the LALR tables make, so that both engines build the same trees.
+"""
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ply.lex import LexToken  # type: ignore
+
+import lexzig.ast as ast
+from lexzig.lexer import Lexer
+from lexzig.parser import (Parser, ParserError, arithmetic_expression,
+                           comparison_expression, unary_expression,
+                           value_expression)
+
+Precedence = Tuple[int, str]
+
+# The level and associativity of the tokens in the precedence table, with
+# levels counted from 1 as PLY does. Productions take the precedence of their
+# last token, and those without one in the table have the lowest.
+_PRECEDENCE: Dict[str, Precedence] = {
+    type: (level, assoc)
+    for level, (assoc, *types) in enumerate(Parser.precedence, start=1)
+    for type in types
+}
+
+_LOWEST: Precedence = (0, 'right')
+
+_BINARY: Dict[str, Tuple[int, Callable[..., ast.BinOp]]] = {
+    **{type: (_PRECEDENCE[type][0], arithmetic_expression)
+       for type in ('PLUS', 'MINUS', 'MULTIPLICATION', 'DIVISION', 'MODULE')},
+    **{type: (_PRECEDENCE[type][0], comparison_expression)
+       for type in ('LT', 'IS_EQUAL_TO', 'IS_NOT_EQUAL', 'GREATER_THAN')},
+}
+
+_ASSIGNMENT = frozenset(('EQUAL', 'MINUS_EQUAL', 'MOD_EQUAL', 'MULT_EQUAL',
+                         'PLUS_EQUAL', 'DIV_EQUAL'))
+
+_VALUES = frozenset(('INTEGER', 'STRING', 'IDENT', 'CHAR', 'BUILTIN_FUNCTION',
+                     'TYPE_UNDEFINED'))
+
+_TYPES = frozenset([f'TYPE_{type.upper()}' for type in Lexer.types] +
+                   ['IDENT'])
+
+_FUNCTION_START = frozenset(('PUB', 'EXPORT', 'FUNCTION'))
+
+_VARDECL = frozenset(('VAR', 'CONST', 'COMPTIME'))
+
+# Stands for the end of the input, so that there always is a token to look
+# at.
+_END = LexToken()
+_END.type = '$end'
+_END.value = None
+_END.lineno = 0
+_END.lexpos = 0
+
+
+class _Rejected(Exception):
+    """
+    The tokens are not a program of the grammar.
+    """
+
+
+class DescentParser:
+    """
+    Parse the tokens of a source with a token method, like a PLY lexer,
+    reading them one at a time.
+
+    Only programs are parsed: on anything else, parse gives up and the
+    tokens can be handed to the LALR engine with replay, since how errors
+    are reported and recovered from is defined by it.
+    """
+
+    def __init__(self, source: Any) -> None:
+        self.next_token = source.token
+        self.read: List[LexToken] = []
+        self.token = _END
+        self._advance()
+
+    def parse(self) -> Optional[ast.Program]:
+        """
+        Return the program, or None when there is a syntax error, a
+        production rejects its operands, or the nesting is deeper than the
+        recursion limit allows.
+        """
+        try:
+            stmts = []
+            while self.token is not _END:
+                stmts.append(self._stmt())
+            return ast.Program(stmts=stmts)
+        except (_Rejected, ParserError, RecursionError):
+            return None
+
+    def replay(self) -> Iterator[LexToken]:
+        """
+        Return the tokens read so far followed by the rest of the source.
+        """
+        return chain(self.read, iter(self.next_token, None))
+
+    def _advance(self) -> LexToken:
+        token = self.token
+        following = self.next_token()
+        if following is None:
+            self.token = _END
+        else:
+            self.read.append(following)
+            self.token = following
+        return token
+
+    def _expect(self, type: str) -> LexToken:
+        if self.token.type != type:
+            raise _Rejected
+        return self._advance()
+
+    def _stmt(self) -> ast.Stmt:
+        type = self.token.type
+
+        if type in _VARDECL:
+            self._advance()
+            return self._assignment_stmt()
+        if type == 'EXPORT':
+            self._advance()
+            if self.token.type == 'FUNCTION':
+                return self._function()
+            if self.token.type not in _VARDECL:
+                raise _Rejected
+            self._advance()
+            return self._assignment_stmt()
+        if type == 'PUB' or type == 'FUNCTION':
+            return self._functiondecl()
+        if type == 'UNDERSCORE':
+            name = self._advance().value
+            _, value = self._assignment_tail()
+            self._expect('SEMICOLON')
+            return ast.AssignmentStmt(ident=ast.Identifier(name), value=value)
+        if type == 'RETURN':
+            self._advance()
+            value = self._expression()
+            self._expect('SEMICOLON')
+            return ast.ReturnStmt(value)
+        if type == 'FOR':
+            return self._for_stmt()
+        if type == 'WHILE':
+            return self._while_stmt()
+
+        expression = self._expression()
+        self._expect('SEMICOLON')
+        return expression
+
+    def _stmts(self) -> List[ast.Stmt]:
+        self._expect('LCURLY')
+        stmts = []
+        while self.token.type != 'RCURLY':
+            stmts.append(self._stmt())
+        self._advance()
+        return stmts
+
+    def _assignment_stmt(self) -> ast.AssignmentStmt:
+        name = self._expect('IDENT').value
+        if self.token.type == 'COLON':
+            self._advance()
+            self._error_union_typedecl()
+        _, value = self._assignment_tail()
+        self._expect('SEMICOLON')
+        return ast.AssignmentStmt(ident=ast.Identifier(name), value=value)
+
+    def _assignment_tail(self) -> Tuple[str, ast.Expr]:
+        if self.token.type not in _ASSIGNMENT:
+            raise _Rejected
+        op = self._advance()
+        return op.value, self._expression(*_PRECEDENCE[op.type])
+
+    def _functiondecl(self) -> ast.FunctionDeclStmt:
+        if self.token.type == 'PUB':
+            self._advance()
+            if self.token.type == 'EXPORT':
+                self._advance()
+        elif self.token.type == 'EXPORT':
+            self._advance()
+        return self._function()
+
+    def _function(self) -> ast.FunctionDeclStmt:
+        self._expect('FUNCTION')
+        name = self._expect('IDENT').value
+
+        self._expect('LPAREN')
+        params = []
+        while self.token.type == 'IDENT':
+            params.append(ast.Identifier(self._advance().value))
+            self._expect('COLON')
+            self._compound_typedecl()
+            if self.token.type == 'COMMA':
+                self._advance()
+        self._expect('RPAREN')
+        self._error_union_typedecl()
+
+        return ast.FunctionDeclStmt(name=ast.Identifier(name), params=params,
+                                    body=self._stmts())
+
+    def _methods(self) -> List[ast.FunctionDeclStmt]:
+        methods = []
+        while self.token.type in _FUNCTION_START:
+            methods.append(self._functiondecl())
+        return methods
+
+    def _compound_typedecl(self) -> None:
+        if self.token.type == 'LBRACE':
+            self._advance()
+            if self.token.type == 'INTEGER' or self.token.type == 'UNDERSCORE':
+                self._advance()
+            self._expect('RBRACE')
+        if self.token.type not in _TYPES:
+            raise _Rejected
+        self._advance()
+
+    def _error_union_typedecl(self) -> None:
+        if self.token.type == 'BANG':
+            self._advance()
+        elif self.token.type == 'IDENT':
+            self._advance()
+            if self.token.type != 'BANG':
+                return
+            self._advance()
+        self._compound_typedecl()
+
+    def _for_stmt(self) -> ast.ForStmt:
+        self._advance()
+        self._expect('LPAREN')
+        target = self._expression()
+        self._expect('RPAREN')
+
+        self._expect('BAR')
+        item = self._capture_target()
+        index = None
+        if self.token.type == 'COMMA':
+            self._advance()
+            index = self._capture_target()
+        self._expect('BAR')
+
+        # Any expression is a target, as in the LALR engine.
+        return ast.ForStmt(target=target,  # type: ignore
+                           capture=ast.ForStmtCapture(item=item, index=index),
+                           body=self._stmts())
+
+    def _while_stmt(self) -> ast.WhileStmt:
+        self._advance()
+        self._expect('LPAREN')
+        condition = self._expression()
+        self._expect('RPAREN')
+
+        if self.token.type == 'BAR':
+            self._advance()
+            self._capture_target()
+            bar = self._expect('BAR')
+            self._expect('LCURLY')
+            while self.token.type != 'RCURLY':
+                self._stmt()
+            closing = self._advance()
+            # The LALR action of this form takes its symbols from the wrong
+            # positions: the capture and the body are lost, and the tokens
+            # around the body take their place.
+            return ast.WhileStmt(condition, post_action=bar.value,
+                                 body=closing.value)
+
+        if self.token.type == 'COLON':
+            self._advance()
+            self._expect('LPAREN')
+            post_action = self._expression()
+            self._expect('RPAREN')
+            return ast.WhileStmt(condition, post_action=post_action,
+                                 body=self._stmts())
+
+        return ast.WhileStmt(condition, body=self._stmts())
+
+    def _capture_target(self) -> ast.Identifier:
+        if self.token.type != 'IDENT' and self.token.type != 'UNDERSCORE':
+            raise _Rejected
+        return ast.Identifier(self._advance().value)
+
+    def _expression(self, level: int = 0,
+                    assoc: str = 'right') -> ast.Expr:
+        """
+        Parse an expression that ends a production of the given precedence.
+        Binary operators that bind tighter than the production continue the
+        expression, the rest are left to the productions around it.
+        """
+        token = self.token
+        type = token.type
+        expression: ast.Expr
+
+        if type in _VALUES:
+            self._advance()
+            following = self.token.type
+            if type != 'IDENT':
+                expression = value_expression(token.value)
+            elif following == 'LCURLY':
+                self._advance()
+                expression = self._struct_instantiation(
+                    ast.Identifier(token.value))
+            elif following in _ASSIGNMENT:
+                assignment, value = self._assignment_tail()
+                expression = ast.AssignmentExpr(
+                    ident=ast.Identifier(token.value), op=assignment,
+                    value=value)
+            else:
+                expression = value_expression(token.value)
+        elif type == 'DOT':
+            expression = self._anonymous()
+        elif type == 'AMPERSAND':
+            self._advance()
+            expression = unary_expression(
+                token.value, self._expression(*_PRECEDENCE[type]),
+                token.lineno)
+        elif type == 'TRY':
+            self._advance()
+            expression = ast.TryExpr(
+                self._expression(*_PRECEDENCE.get(type, _LOWEST)))
+        elif type == 'IF':
+            expression = self._if_expression()
+        elif type == 'SWITCH':
+            expression = self._switch_expression()
+        elif type == 'STRUCT':
+            expression = self._struct_decl()
+        elif type == 'ENUM':
+            expression = self._enum_decl()
+        else:
+            raise _Rejected
+
+        # Field accesses and calls bind to what comes right before them.
+        while True:
+            type = self.token.type
+            if type == 'DOT':
+                self._advance()
+                expression = ast.FieldAccess(
+                    target=expression,
+                    field_name=ast.Identifier(self._expect('IDENT').value))
+            elif type == 'LPAREN':
+                self._advance()
+                args = []
+                while self.token.type != 'RPAREN':
+                    args.append(self._expression())
+                    if self.token.type == 'COMMA':
+                        self._advance()
+                self._advance()
+                expression = ast.FunctionCall(name=expression, args=args)
+            else:
+                break
+
+        while True:
+            binary = _BINARY.get(self.token.type)
+            if binary is None:
+                return expression
+            op_level, build = binary
+            if op_level < level:
+                return expression
+            if op_level == level:
+                if assoc == 'left':
+                    return expression
+                if assoc == 'nonassoc':
+                    raise _Rejected
+
+            op = self._advance()
+            rhs = self._expression(*_PRECEDENCE[op.type])
+            # The LALR engine has no line numbers for nonterminals, so the
+            # errors of binary operators are on line 0 there.
+            expression = build(expression, op.value, rhs, 0)
+
+    def _anonymous(self) -> ast.Expr:
+        self._advance()
+        self._expect('LCURLY')
+        if self.token.type == 'DOT':
+            return self._struct_instantiation(ast.Identifier('anonymous'))
+
+        elems = []
+        while self.token.type != 'RCURLY':
+            elems.append(self._expression())
+            if self.token.type == 'COMMA':
+                self._advance()
+        self._advance()
+        return ast.AnonArray(elems=elems)
+
+    def _struct_instantiation(
+            self, name: ast.Identifier) -> ast.StructInstantiation:
+        pairs = []
+        while True:
+            self._expect('DOT')
+            field_name = self._expect('IDENT').value
+            op = self._expect('EQUAL')
+            pairs.append(ast.StructInitializerPair(
+                field_name=field_name,
+                value=self._expression(*_PRECEDENCE[op.type])))
+            if self.token.type != 'COMMA':
+                break
+            self._advance()
+            if self.token.type == 'RCURLY':
+                break
+        self._expect('RCURLY')
+        return ast.StructInstantiation(name=name, field_initializers=pairs)
+
+    def _if_expression(self) -> ast.IfExpr:
+        self._advance()
+        self._expect('LPAREN')
+        condition = self._expression()
+        self._expect('RPAREN')
+        if_branch = self._expression()
+        self._expect('ELSE')
+        return ast.IfExpr(condition=condition, ifBranch=if_branch,
+                          elseBranch=self._expression(*_PRECEDENCE['ELSE']))
+
+    def _switch_expression(self) -> ast.SwitchExpr:
+        self._advance()
+        self._expect('LPAREN')
+        target = self._expression()
+        self._expect('RPAREN')
+
+        self._expect('LCURLY')
+        branches = []
+        while True:
+            match = self._switch_match_target()
+            self._expect('FAT_ARROW')
+            branches.append(ast.SwitchBranch(match=match,
+                                             body=self._expression()))
+            if self.token.type != 'COMMA':
+                break
+            self._advance()
+            if self.token.type == 'RCURLY':
+                break
+        self._expect('RCURLY')
+
+        return ast.SwitchExpr(target=target, branches=branches)
+
+    def _switch_match_target(self) -> ast.SwitchMatchTarget:
+        if self.token.type == 'ELSE':
+            self._advance()
+            return ast.SwitchElse()
+
+        start = self._expect('INTEGER').value
+        if self.token.type == 'ELLIPSIS':
+            self._advance()
+            return ast.SwitchRange(start=start,
+                                   end=self._expect('INTEGER').value)
+
+        elems: List[ast.SwitchMatchTarget] = [ast.Integer(start)]
+        while self.token.type == 'COMMA':
+            self._advance()
+            elems.append(ast.Integer(self._expect('INTEGER').value))
+        return ast.SwitchList(elems=elems)
+
+    def _struct_decl(self) -> ast.StructDeclaration:
+        self._advance()
+        self._expect('LCURLY')
+        fields = []
+        while self.token.type == 'IDENT':
+            fields.append(ast.Identifier(self._advance().value))
+            self._expect('COLON')
+            self._compound_typedecl()
+            self._expect('COMMA')
+        methods = self._methods()
+        self._expect('RCURLY')
+        # Struct methods have always been listed from last to first.
+        return ast.StructDeclaration(fields=fields, methods=methods[::-1])
+
+    def _enum_decl(self) -> ast.EnumDeclaration:
+        self._advance()
+        self._expect('LCURLY')
+        variants = []
+        while True:
+            variants.append(ast.Identifier(self._expect('IDENT').value))
+            self._expect('COMMA')
+            if self.token.type != 'IDENT':
+                break
+        methods = self._methods()
+        self._expect('RCURLY')
+        return ast.EnumDeclaration(variants=variants, methods=methods)
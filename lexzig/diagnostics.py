@@ -0,0 +1,47 @@
+"""
+What the lexer and the parser report about their input.
+"""
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+# How many errors an analysis collects before it gives up on the input.
+MAX_ERRORS = 100
+
+
+@dataclass
+class Diagnostic:
+    """
+    A problem found in the input: what it is, its line, and the offset and
+    length of the text it covers.
+    """
+    message: str
+    lineno: int
+    lexpos: int
+    length: int = 1
+
+
+class ParserError(Exception):
+    def __init__(self, message: str, lineno: Optional[int] = None):
+        super().__init__(message)
+        self.message = message
+        self.lineno = lineno
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Keep the line number when errors cross process boundaries.
+        return (ParserError, (self.message, self.lineno))
+
+
+class TooManyErrors(ParserError):
+    """
+    Raised when the input has more errors than the analysis collects. The
+    ones collected until then are kept in diagnostics.
+    """
+
+    def __init__(self, diagnostics: List[Diagnostic],
+                 lineno: Optional[int] = None):
+        super().__init__(
+            f'Too many errors, stopped after {len(diagnostics)}', lineno)
+        self.diagnostics = diagnostics
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (TooManyErrors, (self.diagnostics, self.lineno))
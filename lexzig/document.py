@@ -0,0 +1,237 @@
+import bisect
+from dataclasses import dataclass, replace
+from typing import Iterator, List, Optional, Tuple
+
+from ply.lex import LexToken  # type: ignore
+
+import lexzig.ast as ast
+from lexzig.diagnostics import Diagnostic
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError
+from lexzig.statements import StatementSplitter
+
+
+@dataclass
+class TextEdit:
+    """
+    Replace the characters between start and end with text.
+    """
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class _Outcome:
+    """
+    The result of parsing the tokens of one top-level statement.
+    """
+    stmts: List[ast.Stmt]
+    error: Optional[ParserError] = None
+    recovered: bool = False
+
+
+def _shift(outcome: _Outcome, shift: int) -> _Outcome:
+    """
+    Move the error of a statement that is reused shift lines down.
+    """
+    error = outcome.error
+    if error is None or error.lineno is None or not shift:
+        return outcome
+    return replace(outcome,
+                   error=ParserError(error.message, error.lineno + shift))
+
+
+class Document:
+    """
+    A source file that is reparsed incrementally as it is edited.
+
+    Only the top-level statements around an edit are lexed and parsed again;
+    the others are reused from the previous program. When a statement needed
+    error recovery the whole document is parsed again instead, since the
+    recovery can skip past statement boundaries. Either way the program, or
+    the error, is the one Parser.parse gives for the text.
+
+    What the lexer found wrong in the text is kept in diagnostics, without a
+    limit, since a document is edited until it is right. Syntax errors are
+    not kept there, nor printed.
+    """
+
+    def __init__(self, text: str = '', parser: Optional[Parser] = None):
+        self.text = text
+        self.parser = parser or Parser()
+        self.program: Optional[ast.Program] = None
+        self.error: Optional[ParserError] = None
+        self.diagnostics: List[Diagnostic] = []
+
+        # Where the tokens of every top-level statement end, the line of the
+        # last one and what parsing them gave.
+        self.ends: List[int] = []
+        self.lines: List[int] = []
+        self.outcomes: List[_Outcome] = []
+        self._reparse(0, 0, 0)
+
+        try:
+            self._update()
+        except ParserError:
+            pass
+
+    def edit(self, start: int, end: int, text: str) -> ast.Program:
+        """
+        Apply an edit and return the updated program.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f'Invalid range {start}:{end}')
+
+        self.text = self.text[:start] + text + self.text[end:]
+        self._reparse(start, start + len(text), len(text) - (end - start))
+
+        return self._update()
+
+    def apply(self, edits: List[TextEdit]) -> ast.Program:
+        """
+        Apply edits one after the other and return the final program. Errors
+        in the intermediate states are ignored.
+        """
+        for edit in edits[:-1]:
+            try:
+                self.edit(edit.start, edit.end, edit.text)
+            except ParserError:
+                pass
+
+        if edits:
+            return self.edit(edits[-1].start, edits[-1].end, edits[-1].text)
+
+        if self.error is not None:
+            raise self.error
+        assert self.program is not None
+        return self.program
+
+    def _update(self) -> ast.Program:
+        self.program = None
+        self.error = None
+
+        for outcome in self.outcomes:
+            if outcome.recovered:
+                try:
+                    self.program = self.parser.parse(self.text,
+                                                     diagnostics=[])
+                except ParserError as parser_error:
+                    self.error = parser_error
+                    raise
+                return self.program
+
+            if outcome.error is not None:
+                self.error = outcome.error
+                raise outcome.error
+
+        self.program = ast.Program(
+            stmts=[stmt for outcome in self.outcomes for stmt in outcome.stmts]
+        )
+        return self.program
+
+    def _reparse(self, start: int, edit_end: int, delta: int) -> None:
+        """
+        Reparse the statements after an edit that left the text between start
+        and edit_end, shifting what follows by delta characters.
+        """
+        # Start from the end of the last statement that ends before the edit,
+        # or before a quote that was left open, since the edit may close it.
+        first = bisect.bisect_left(self.ends, start)
+        for diagnostic in self.diagnostics:
+            if diagnostic.lexpos >= start:
+                break
+            if self.text[diagnostic.lexpos] in '"\'':
+                first = min(first,
+                            bisect.bisect_right(self.ends, diagnostic.lexpos))
+                break
+        if first > 0:
+            position, line = self.ends[first - 1], self.lines[first - 1]
+        else:
+            position, line = 0, 1
+        found: List[Diagnostic] = []
+        statements = self._statements(position, line, found)
+
+        ends: List[int] = []
+        lines: List[int] = []
+        outcomes: List[_Outcome] = []
+        old = first
+        reused = len(self.ends)
+        shift = 0
+        # Where the old text that is reused starts, if any is.
+        kept: Optional[int] = None
+
+        for end, line, outcome in statements:
+            ends.append(end)
+            lines.append(line)
+            outcomes.append(outcome)
+
+            if end < edit_end:
+                continue
+
+            # Past the edit the text is the same as before, so once a
+            # statement ends where an old one did, the rest can be reused.
+            while old < len(self.ends) and self.ends[old] < end - delta:
+                old += 1
+
+            if old < len(self.ends) and self.ends[old] == end - delta:
+                shift = line - self.lines[old]
+                reused = old + 1
+                kept = self.ends[old]
+                break
+
+        if reused < len(self.ends):
+            ends += [end + delta for end in self.ends[reused:]]
+            lines += [line + shift for line in self.lines[reused:]]
+            outcomes += [_shift(outcome, shift)
+                         for outcome in self.outcomes[reused:]]
+
+        diagnostics = [diagnostic for diagnostic in self.diagnostics
+                       if diagnostic.lexpos < position]
+        diagnostics += found
+        if kept is not None:
+            diagnostics += [
+                replace(diagnostic, lineno=diagnostic.lineno + shift,
+                        lexpos=diagnostic.lexpos + delta)
+                for diagnostic in self.diagnostics if diagnostic.lexpos >= kept
+            ]
+        self.diagnostics = diagnostics
+
+        self.ends[first:] = ends
+        self.lines[first:] = lines
+        self.outcomes[first:] = outcomes
+
+    def _statements(self, position: int, line: int,
+                    found: List[Diagnostic]) -> Iterator[Tuple[int, int,
+                                                               _Outcome]]:
+        """
+        Lex and parse the statements from position, which is on the given
+        line, to the end of the text, adding what the lexer finds wrong to
+        found.
+        """
+        lexer = Lexer(max_errors=None)
+        lexer.input(self.text)
+        lexer.diagnostics = found
+        lexer.lexer.lexpos = position
+        lexer.lexer.lineno = line
+
+        splitter = StatementSplitter()
+        for token in lexer.lexer:
+            tokens = splitter.feed(token)
+            if tokens is not None:
+                yield lexer.lexer.lexpos, tokens[-1].lineno, self._parse(tokens)
+
+        tokens = splitter.flush()
+        if tokens:
+            yield lexer.lexer.lexpos, tokens[-1].lineno, self._parse(tokens)
+
+    def _parse(self, tokens: List[LexToken]) -> _Outcome:
+        try:
+            program = self.parser.parse_tokens(tokens, diagnostics=[])
+        except ParserError as parser_error:
+            return _Outcome([], error=parser_error,
+                            recovered=self.parser.syntax_errors > 0)
+
+        if program is None or self.parser.syntax_errors:
+            return _Outcome([], recovered=True)
+        return _Outcome(program.stmts)
@@ -1,8 +1,42 @@
-from typing import List, Dict, Any
+import codecs
+import hashlib
+import mmap
+import os
+import re
+from typing import (List, Dict, Any, Iterable, Iterator, Optional, Pattern,
+                    Union)
 
 import ply.lex as pylex  # type: ignore
 from ply.lex import LexToken
 
+from lexzig.diagnostics import MAX_ERRORS, Diagnostic, TooManyErrors
+from lexzig.tables import TABLES_DIR, remove_stale_tables
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# How many characters are decoded at a time when lexing a buffer.
+CHUNK_SIZE = 1 << 20
+
+# How many characters after a token it takes to tell that it is complete:
+# the longest operator is three characters long, and PLY leaves lexpos one
+# past the end of the input when it runs out of it.
+_LOOKAHEAD = 3
+
+# The engines a Lexer can run on: PLY, or a scanner that matches the same
+# rules without calling back into Python for every token.
+ENGINES = ('ply', 'fast')
+
+# How many tokens the fast engine scans ahead when they are read one at a
+# time.
+_BATCH_SIZE = 64
+
+# How many characters of a run of illegal ones its diagnostic shows.
+_SHOWN = 16
+
+# Characters that can start a token the decoded window of a buffer cuts
+# short, so they are not taken as illegal along with the ones before them.
+_QUOTES = '"\'@'
+
 
 class Lexer:
     """
@@ -149,12 +183,547 @@ class Lexer:
         t.lexer.lineno += len(t.value)
 
     def t_error(self, t: LexToken) -> None:
-        print("Illegal character '%s'" % t.value[0])
-        t.lexer.skip(1)
+        """
+        Skip the run of illegal characters at t, reporting it as a single
+        diagnostic.
+        """
+        self._illegal(t, 0)
 
-    def __init__(self, **kwargs: Dict[str, Any]) -> None:
-        self.lexer = pylex.lex(module=self, **kwargs)
+    def __init__(self, engine: str = 'ply',
+                 max_errors: Optional[int] = MAX_ERRORS,
+                 **kwargs: Dict[str, Any]) -> None:
+        """
+        Create a lexer by cloning a template shared by the whole process.
 
-    def lex(self, input: str) -> List[LexToken]:
+        Passing any PLY options builds a fresh lexer from the rules instead.
+        With engine set to 'fast', the rules are matched by a scanner that
+        gives the same tokens as PLY in less time.
+
+        Runs of illegal characters are collected in diagnostics. Finding
+        more than max_errors of them raises TooManyErrors, unless it is None.
+        """
+        self._buffer: Optional[Iterator[LexToken]] = None
+        self.lexer: Any
+        self.diagnostics: List[Diagnostic] = []
+        self.max_errors = max_errors
+
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown lexer engine: {engine}')
+
+        if engine == 'fast':
+            if kwargs:
+                raise ValueError('PLY options only apply to the ply engine')
+            self.lexer = _Scanner(self)
+            return
+
+        if kwargs:
+            self.lexer = pylex.lex(module=self, **kwargs)
+            return
+
+        self.lexer = _lexer_template(self).clone(self)
+        # clone() rebinds the rules of every state but leaves the current
+        # state pointing to the template's ones.
+        self.lexer.begin('INITIAL')
+
+    def input(self, input: str) -> None:
+        """
+        Start lexing input from its first line.
+        """
+        self.lexer.lineno = 1
         self.lexer.input(input)
-        return list(self.lexer)
+        self._buffer = None
+        self.diagnostics = []
+
+    def input_buffer(self, buffer: Buffer, encoding: str = 'utf-8',
+                     chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Start lexing bytes-like input from its first line. The input is
+        decoded a chunk at a time as the tokens are read.
+        """
+        self.input('')
+        self._buffer = self._iter_buffer(buffer, encoding, chunk_size)
+
+    def iter_tokens(self) -> Iterator[LexToken]:
+        """
+        Yield the tokens of the input one at a time.
+        """
+        if self._buffer is not None:
+            return self._buffer
+        return iter(self.lexer)
+
+    def iter_file(self, filename: str,
+                  encoding: str = 'utf-8') -> Iterator[LexToken]:
+        """
+        Yield the tokens of a file, which is mapped into memory instead of
+        being read.
+        """
+        with open(filename, 'rb') as f:
+            # Empty files cannot be mapped.
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.input_buffer(buffer, encoding)
+                yield from self.iter_tokens()
+
+    def lex(self, input: str) -> List[LexToken]:
+        self.input(input)
+        if isinstance(self.lexer, _Scanner):
+            return self.lexer.lex()
+        return list(self.iter_tokens())
+
+    def _illegal(self, t: LexToken, offset: int) -> None:
+        """
+        Report the run of illegal characters at t, which is offset characters
+        into the input, and skip it.
+        """
+        data = t.lexer.lexdata
+        match = _illegal_run().match(data, t.lexpos + 1)
+        assert match is not None
+        run = data[t.lexpos:match.end()]
+
+        if self.max_errors is not None and len(
+                self.diagnostics) >= self.max_errors:
+            raise TooManyErrors(self.diagnostics, t.lineno)
+
+        if len(run) == 1:
+            message = f"Illegal character '{run}'"
+        elif len(run) <= _SHOWN:
+            message = f"Illegal characters '{run}'"
+        else:
+            message = f"Illegal characters '{run[:_SHOWN]}...'"
+        self.diagnostics.append(
+            Diagnostic(message, t.lineno, offset + t.lexpos, len(run)))
+        t.lexer.skip(len(run))
+
+    def _iter_buffer(self, buffer: Buffer, encoding: str,
+                     chunk_size: int) -> Iterator[LexToken]:
+        """
+        Lex a window of decoded text that slides over the buffer.
+
+        The window is kept at least chunk_size characters ahead of the
+        lexer. A token that ends too close to the end of the window, or a
+        quote that is not closed within it, is lexed again with a longer
+        window.
+        """
+        chunk_size = max(chunk_size, 2 * _LOOKAHEAD)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        whole = memoryview(buffer)
+        view = whole.cast('B')
+        lexer = self.lexer
+        read = 0
+        # How many characters come before the window.
+        offset = 0
+        window = ''
+        done = False
+        ahead = chunk_size
+
+        def error(t: LexToken) -> None:
+            if not done and t.value[0] in _QUOTES:
+                raise _Unterminated()
+
+            self._illegal(t, offset)
+
+        lexer.lexerrorf = error
+        try:
+            while True:
+                position = lexer.lexpos
+                if not done and len(window) - position < ahead:
+                    offset += position
+                    window = window[position:]
+                    position = 0
+
+                    while not done and len(window) < ahead:
+                        # Copied out of the view, so that nothing holds on
+                        # to the buffer when decoding it fails.
+                        chunk = bytes(view[read:read + ahead])
+                        read += len(chunk)
+                        done = read == len(view)
+                        window += decoder.decode(chunk, done)
+
+                    lexer.input(window)
+
+                lineno = lexer.lineno
+                reported = len(self.diagnostics)
+                try:
+                    token = lexer.token()
+                    unterminated = False
+                except _Unterminated:
+                    unterminated = True
+
+                if not done and (unterminated or
+                                 lexer.lexpos + _LOOKAHEAD > len(window)):
+                    # Whatever was matched last may go on past the window,
+                    # and so may a run of illegal characters.
+                    lexer.lexpos = position
+                    lexer.lineno = lineno
+                    del self.diagnostics[reported:]
+                    ahead *= 2
+                    continue
+
+                ahead = chunk_size
+
+                if token is None:
+                    return
+
+                token.lexpos += offset
+                yield token
+        finally:
+            lexer.lexerrorf = self.t_error
+            # Otherwise the buffer cannot be closed while an error raised
+            # here is on its way out.
+            view.release()
+            whole.release()
+
+
+class _Unterminated(Exception):
+    """
+    Raised when a quote is not closed before the end of the decoded window.
+    """
+
+
+class _Scanner:
+    """
+    Match the rules of Lexer with a single regular expression, with the same
+    results as PLY and the same interface as its lexers.
+
+    PLY calls a rule function for every identifier, integer, builtin and
+    run of newlines, and goes back to its loop for every blank. Here blanks
+    are matched along with the token or newlines that follow them, the work
+    of the rule functions is done inline, with a direct lookup of keywords,
+    and tokens are scanned in batches.
+    """
+
+    def __init__(self, owner: Lexer) -> None:
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lexerrorf: Any = owner.t_error
+        # Tokens scanned ahead, where each of them ends, and the next one to
+        # hand out. They are dropped when lexpos or lineno are changed.
+        self._tokens: List[LexToken] = []
+        self._ends: List[int] = []
+        self._scan_ends: List[int] = []
+        self._next = 0
+        self._resume = (-1, -1)
+
+    def input(self, data: str) -> None:
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        self._tokens = []
+
+    def skip(self, n: int) -> None:
+        self.lexpos += n
+
+    def token(self) -> Optional[LexToken]:
+        if (self._next == len(self._tokens)
+                or self._resume != (self.lexpos, self.lineno)):
+            self._tokens = self._scan(_BATCH_SIZE)
+            self._ends = self._scan_ends
+            self._next = 0
+            if not self._tokens:
+                return None
+
+        token = self._tokens[self._next]
+        self.lexpos = self._ends[self._next]
+        self.lineno = token.lineno
+        self._resume = (self.lexpos, self.lineno)
+        self._next += 1
+        return token
+
+    def __iter__(self) -> '_Scanner':
+        return self
+
+    def __next__(self) -> LexToken:
+        token = self.token()
+        if token is None:
+            raise StopIteration
+        return token
+
+    def lex(self) -> List[LexToken]:
+        """
+        Scan the rest of the input at once.
+        """
+        tokens: List[LexToken] = []
+        while True:
+            batch = self._scan(0)
+            if not batch:
+                return tokens
+            tokens += batch
+
+    def _scan(self, limit: int) -> List[LexToken]:
+        """
+        Scan up to limit tokens from lexpos, or all of them with a limit of
+        0, leaving lexpos and lineno after
+        the last one like PLY does, or one past the end of the input when
+        there are none left. The ends of the tokens are left in _scan_ends.
+
+        Scanning stops at an error that comes after some tokens, so that it
+        is only reported once they have been read.
+        """
+        data = self.lexdata
+        finditer = _fast_pattern().finditer
+        keywords = Lexer.keywords
+        special = _SPECIAL
+        lineno = self.lineno
+        position = self.lexpos
+
+        tokens: List[LexToken] = []
+        ends: List[int] = []
+        self._scan_ends = ends
+        append = tokens.append
+        append_end = ends.append
+
+        while True:
+            for match in finditer(data, position):
+                kind: str = match.lastgroup  # type: ignore
+
+                if kind not in special:
+                    value = match.group(kind)
+                    token = LexToken()
+                    token.type = kind
+                    token.value = value
+                elif kind == 'IDENT':
+                    # What the rule functions of Lexer do, in the same order.
+                    value = match.group(kind)
+                    token = LexToken()
+                    token.type = keywords.get(value, 'IDENT')
+                    token.value = value
+                    if value[0] == '@':
+                        token.value = value[2:-1]
+                    if token.value == '_':
+                        token.type = 'UNDERSCORE'
+                    token.lexer = self
+                elif kind == 'newline':
+                    lineno += match.group(kind).count('\n')
+                    continue
+                elif kind == 'INTEGER':
+                    value = match.group(kind)
+                    token = LexToken()
+                    token.type = kind
+                    token.value = int(value)
+                    token.lexer = self
+                elif kind == 'BUILTIN_FUNCTION':
+                    value = match.group(kind)
+                    token = LexToken()
+                    token.type = kind
+                    token.value = value[1:]
+                    token.lexer = self
+                elif kind == 'COMMENTS':
+                    continue
+                elif kind == 'error':
+                    if tokens:
+                        break
+                    position = self._error(match.start(kind), lineno)
+                    lineno = self.lineno
+                    break
+                else:
+                    # Blanks at the end of the input.
+                    continue
+
+                end = match.end()
+                token.lineno = lineno
+                token.lexpos = end - len(value)
+                append(token)
+                append_end(end)
+
+                if limit and len(tokens) == limit:
+                    break
+            else:
+                if not tokens:
+                    # PLY leaves lexpos one past the end of the input.
+                    self.lexpos = len(data) + 1
+                    self.lineno = lineno
+                    return tokens
+
+            if tokens:
+                self.lexpos = ends[-1]
+                self.lineno = tokens[-1].lineno
+                return tokens
+
+    def _error(self, position: int, lineno: int) -> int:
+        """
+        Hand a character no rule matches to the error function, which has
+        to skip it, and return where to go on from.
+        """
+        data = self.lexdata
+        self.lexpos = position
+        self.lineno = lineno
+
+        if self.lexerrorf is None:
+            raise pylex.LexError(
+                f'Illegal character {data[position]!r} at index {position}',
+                data[position:])
+
+        token = LexToken()
+        token.type = 'error'
+        token.value = data[position:]
+        token.lineno = lineno
+        token.lexpos = position
+        token.lexer = self
+        self.lexerrorf(token)
+
+        if self.lexpos == position:
+            raise pylex.LexError(
+                f'Scanning error. Illegal character {data[position]!r} '
+                f'at index {position}', data[position:])
+        return self.lexpos
+
+
+def _lexer_version() -> str:
+    """
+    Hash the token rules, in the order PLY tries them.
+    """
+    strings = []
+    functions = []
+
+    for name in dir(Lexer):
+        if not name.startswith('t_'):
+            continue
+
+        rule = getattr(Lexer, name)
+        if callable(rule):
+            functions.append(
+                (rule.__code__.co_firstlineno, f'{name}={rule.__doc__}'))
+        else:
+            strings.append(f'{name}={rule}')
+
+    parts = Lexer.tokens + sorted(strings) + [f for _, f in sorted(functions)]
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:16]
+
+
+LEXER_VERSION = _lexer_version()
+
+LEXTAB_MODULE = f'lexzig.tables.lextab_{LEXER_VERSION}'
+
+_template: Optional[pylex.Lexer] = None
+
+_pattern: Optional[Pattern[str]] = None
+
+_run_pattern: Optional[Pattern[str]] = None
+
+# The groups of the fast expression that are not a token of their own type.
+_SPECIAL = frozenset(['IDENT', 'INTEGER', 'BUILTIN_FUNCTION', 'COMMENTS',
+                      'newline', 'error', 'end'])
+
+
+def _lexer_template(owner: Lexer) -> pylex.Lexer:
+    """
+    Load the lexer tables once per process.
+
+    The master regular expression is read from the lextab shipped in
+    lexzig/tables when it matches the current rules. Otherwise it is built
+    from the rules, without writing anything to disk.
+    """
+    global _template
+
+    if _template is None:
+        rules = {name: getattr(owner, name) for name in dir(owner)}
+        template = pylex.Lexer()
+        try:
+            template.readtab(LEXTAB_MODULE, rules)
+        except ImportError:
+            template = pylex.lex(module=owner)
+        _template = template
+
+    return _template
+
+
+def _fast_pattern() -> 'Pattern[str]':
+    """
+    Build the expression of the fast engine once per process.
+
+    The rules are tried in the order PLY tries them, after the characters
+    PLY ignores. Runs of newlines take the blanks after them along. A
+    character nothing else matches is an error, and blanks at the end of
+    the input are matched on their own.
+    """
+    global _pattern
+
+    if _pattern is None:
+        blank = re.escape(Lexer.t_ignore)
+        groups = _rules() + ['(?P<error>(?s:.))', '(?P<end>\\Z)']
+
+        # PLY compiles its rules in verbose mode, so they are read the same
+        # way here.
+        _pattern = re.compile(f'[{blank}]*(?:{"|".join(groups)})', re.VERBOSE)
+
+    return _pattern
+
+
+def _illegal_run() -> 'Pattern[str]':
+    """
+    Build the expression that matches the rest of a run of illegal
+    characters once per process: those that no rule matches and PLY does not
+    ignore, other than quotes.
+    """
+    global _run_pattern
+
+    if _run_pattern is None:
+        stop = re.escape(Lexer.t_ignore + _QUOTES)
+        _run_pattern = re.compile(
+            f'(?:(?!{"|".join(_rules())}|[{stop}])(?s:.))*', re.VERBOSE)
+
+    return _run_pattern
+
+
+def _rules() -> List[str]:
+    """
+    Return a group for every rule of Lexer, in the order PLY tries them.
+    """
+    rules = pylex.LexerReflect(
+        {name: getattr(Lexer, name) for name in dir(Lexer)},
+        log=pylex.NullLogger())
+    rules.get_all()
+
+    groups = []
+    for name, rule in rules.funcsym['INITIAL']:
+        regex = rule.__doc__
+        if name == 't_newline':
+            regex = f'\\n[\\n{re.escape(Lexer.t_ignore)}]*'
+        groups.append(f'(?P<{name[2:]}>{regex})')
+    for name, rule in rules.strsym['INITIAL']:
+        groups.append(f'(?P<{name[2:]}>{rule})')
+    return groups
+
+
+def print_diagnostics(lexer: Lexer,
+                      tokens: Iterable[LexToken]) -> Iterator[LexToken]:
+    """
+    Pass tokens on to the parser, printing what the lexer found wrong before
+    each of them, so that it comes out in order with what the parser prints.
+    """
+    printed = 0
+
+    def report() -> None:
+        nonlocal printed
+        for diagnostic in lexer.diagnostics[printed:]:
+            print(diagnostic.message)
+        printed = len(lexer.diagnostics)
+
+    try:
+        for token in tokens:
+            if len(lexer.diagnostics) > printed:
+                report()
+            yield token
+    except TooManyErrors:
+        report()
+        raise
+    report()
+
+
+def write_tables(outputdir: str = TABLES_DIR) -> str:
+    """
+    Generate the lextab for the current rules and remove the ones left
+    behind by previous versions of them.
+
+    Returns the path of the lextab.
+    """
+    basename = LEXTAB_MODULE.split('.')[-1]
+    remove_stale_tables(outputdir, 'lextab_', basename)
+
+    pylex.lex(module=Lexer()).writetab(basename, outputdir)
+
+    return os.path.join(outputdir, basename + '.py')
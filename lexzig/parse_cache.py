@@ -0,0 +1,174 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import lexzig.ast as ast
+from lexzig import binary
+from lexzig.lexer import LEXER_VERSION
+from lexzig.parser import GRAMMAR_VERSION, ParserError
+
+# Where the cache goes when no directory is given.
+DEFAULT_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'lexzig'
+)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+SUFFIX = '.lzc'
+
+
+@dataclass
+class ParseResult:
+    """
+    What analysing a file gives: the program or the error that stopped the
+    parser, and the messages printed along the way.
+
+    Printing a large program can take longer than parsing it, so the way it
+    is shown is kept too, for every kind of display it was shown in.
+    """
+    program: Optional[ast.Program]
+    error: Optional[ParserError] = None
+    output: str = ''
+    rendered: Dict[str, str] = field(default_factory=dict)
+
+
+class ParseCache:
+    """
+    A directory of parse results, keyed by the contents of the files they
+    come from and by the version of the lexer, grammar and binary format.
+
+    Every entry is a file with a line of JSON holding the error, output and
+    renderings of the parse, followed by the program in the binary format. When the
+    entries take more than max_bytes, trim removes the least recently used.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, filename: str) -> str:
+        """
+        Hash the contents of a file, which is mapped instead of read.
+        """
+        digest = hashlib.sha256(
+            f'{LEXER_VERSION}:{GRAMMAR_VERSION}:{binary.SCHEMA_VERSION}:'
+            .encode())
+
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest.update(data)
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ParseResult]:
+        """
+        Return the result stored for key. Entries that cannot be read, or
+        are nested too deeply to be, are treated as missing.
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                program, _ = binary.loads(f.read())
+
+            error = None
+            if header['error'] is not None:
+                error = ParserError(header['error']['detail'],
+                                    header['error']['lineno'])
+            output = header['output']
+            rendered = header['rendered']
+
+            # Keep track of when entries are used, for trim.
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError, RecursionError,
+                binary.BinaryFormatError):
+            return None
+
+        return ParseResult(program, error, output, rendered)
+
+    def put(self, key: str, result: ParseResult) -> None:
+        """
+        Store a result. The entry is written to a temporary file first, so
+        that readers never see half of it. Results that cannot be written,
+        as when the directory cannot be created, are not stored.
+        """
+        error = None
+        if result.error is not None:
+            error = {'detail': result.error.message,
+                     'lineno': result.error.lineno}
+        header = json.dumps({
+            'error': error,
+            'output': result.output,
+            'rendered': result.rendered,
+        })
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temporary = tempfile.mkstemp(dir=self.directory,
+                                             suffix='.tmp')
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header.encode('utf-8') + b'\n')
+                f.write(binary.dumps(result.program))
+            os.replace(temporary, self._path(key))
+        except OSError:
+            self._remove(temporary)
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+    def trim(self) -> None:
+        """
+        Remove the least recently used entries until the rest fit in
+        max_bytes.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            self._remove(path)
+            size -= entry_size
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _entries(self) -> List['os.DirEntry[str]']:
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry for entry in entries
+                        if entry.name.endswith(SUFFIX)]
+        except OSError:
+            return []
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
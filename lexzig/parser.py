@@ -1,18 +1,177 @@
-from typing import cast, Optional
+import copy
+import hashlib
+import os
+import time
+from typing import cast, Any, Iterable, Iterator, List, Optional, Tuple
 
 from ply.lex import LexToken  # type: ignore
 import ply.yacc as yacc  # type: ignore
 from ply.yacc import YaccProduction
 
 import lexzig.ast as ast
-from lexzig.lexer import Lexer
+from lexzig.diagnostics import MAX_ERRORS, Diagnostic, TooManyErrors
+# ParserError has always been imported from here.
+from lexzig.diagnostics import ParserError as ParserError
+from lexzig.lexer import Lexer, print_diagnostics
+from lexzig.statements import split_statements
+from lexzig.tables import TABLES_DIR, remove_stale_tables
+
+# The engines a Parser can run on: PLY with the LALR tables of the grammar,
+# or a recursive descent parser that builds the same trees.
+ENGINES = ('lalr', 'descent')
+
+
+# The nodes of the productions that check their operands. Both engines
+# build them through these, so they raise the same errors.
+
+def value_expression(value: Any) -> ast.Expr:
+    # TODO: It would be better to check the token type.
+    if isinstance(value, int):
+        return ast.Integer(value)
+    if value[0] == "'":
+        return ast.Char(value)
+    if value[0] == '"':
+        return ast.String(value)
+    return ast.Identifier(value)
+
+
+def unary_expression(op: str, rhs: ast.Expr,
+                     lineno: Optional[int]) -> ast.UnaryOp:
+    if op == '&' and not isinstance(rhs, ast.Identifier):
+        raise ParserError("Can only take a reference to an lvalue", lineno)
+
+    return ast.UnaryOp(op=op, rhs=rhs)
+
+
+def arithmetic_expression(lhs: ast.Expr, op: str, rhs: ast.Expr,
+                          lineno: Optional[int]) -> ast.BinOp:
+    if (isinstance(lhs, ast.Integer) and not isinstance(rhs, ast.Integer)):
+        raise ParserError(
+            f"Invalid types for binary operator '{op}', " +
+            "expected Integer and Integer, but got " +
+            f"{type(lhs).__name__} and {type(rhs).__name__}",
+            lineno
+        )
+
+    if (isinstance(lhs, ast.String) and not isinstance(rhs, ast.String)):
+        raise ParserError(
+            f"Invalid types for binary operator '{op}', " +
+            "expected String and String, but got " +
+            f"{type(lhs).__name__} and {type(rhs).__name__}",
+            lineno
+        )
+
+    if op in ('/', '%') and isinstance(rhs, ast.Integer) and rhs.n == 0:
+        raise ParserError(f"'{op}': /by zero is undefined", lineno)
+
+    return ast.BinOp(lhs=lhs, op=op, rhs=rhs)
+
+
+def comparison_expression(lhs: ast.Expr, op: str, rhs: ast.Expr,
+                          lineno: Optional[int]) -> ast.BinOp:
+    isValidExprLeft = isinstance(lhs, ast.Integer) and (
+        isinstance(rhs, ast.Integer) or isinstance(rhs, ast.Identifier))
+
+    isValidExprRight = isinstance(rhs, ast.Integer) and (
+        isinstance(lhs, ast.Integer) or isinstance(lhs, ast.Identifier))
+
+    if ((op == '<' or op == '>')
+            and not (isValidExprLeft or isValidExprRight)):
+        raise ParserError(
+            f"Invalid types for binary operator '{op}', " +
+            "expected Integer and Integer, but got " +
+            f"{type(lhs).__name__} and {type(rhs).__name__}",
+            lineno
+        )
+
+    if ((op == '==' or op == '!=') and not (type(lhs) == type(rhs))):
+        raise ParserError(
+            f"Invalid types for operator '{op}', " +
+            f"expected '{type(lhs).__name__}' and '{type(lhs).__name__}' " +
+            f"or '{type(rhs).__name__}' and '{type(rhs).__name__}', but got " +
+            f"{type(lhs).__name__} and {type(rhs).__name__}",
+            lineno
+        )
+
+    return ast.BinOp(lhs=lhs, op=op, rhs=rhs)
+
+
+class _TokenFeed:
+    """
+    Hand already lexed tokens to PLY as if they came from a lexer.
+    """
+
+    def __init__(self, tokens: Iterable[LexToken]) -> None:
+        self.tokens = iter(tokens)
+
+    def token(self) -> Optional[LexToken]:
+        return next(self.tokens, None)
 
 
-class ParserError(Exception):
-    def __init__(self, message: str, lineno: Optional[int] = None):
-        super().__init__(message)
-        self.message = message
-        self.lineno = lineno
+class ParserHooks:
+    """
+    Receive the events of a parse. Subclasses override the events they
+    care about; the rest do nothing.
+    """
+
+    def token_consumed(self, token: LexToken) -> None:
+        """
+        Called for every token the parser reads, including the ones skipped
+        while recovering from a syntax error.
+        """
+
+    def production_reduced(self, production: str, seconds: float) -> None:
+        """
+        Called after the action of a production runs, with the production,
+        as in 'stmt -> return_stmt', and the time its action took.
+        """
+
+    def error_recovered(self, token: LexToken, skipped: int) -> None:
+        """
+        Called after a syntax error at token, once skipped tokens were
+        thrown away to get to the next statement.
+        """
+
+
+class _HookedFeed:
+    """
+    Report every token a lexer or token feed gives to the parser.
+    """
+
+    def __init__(self, source: Any, hooks: ParserHooks) -> None:
+        self.source = source
+        self.hooks = hooks
+
+    def token(self) -> Optional[LexToken]:
+        token = self.source.token()
+        if token is not None:
+            self.hooks.token_consumed(token)
+        return token
+
+
+class _SyntaxErrors:
+    """
+    Where the syntax errors of a single parse go: printed or, for a partial
+    parse, collected into diagnostics until there are max_errors of them.
+    """
+
+    def __init__(self, diagnostics: Optional[List[Diagnostic]] = None,
+                 max_errors: Optional[int] = None) -> None:
+        self.diagnostics = diagnostics
+        self.max_errors = max_errors
+        self.count = 0
+
+    def report(self, diagnostic: Diagnostic) -> None:
+        self.count += 1
+
+        if self.diagnostics is None:
+            print(diagnostic.message)
+            return
+
+        if self.max_errors is not None and len(
+                self.diagnostics) >= self.max_errors:
+            raise TooManyErrors(self.diagnostics, diagnostic.lineno)
+        self.diagnostics.append(diagnostic)
 
 
 class Parser:
@@ -35,8 +194,89 @@ class Parser:
         ('left', 'DOT'),
     )
 
-    def __init__(self) -> None:
-        self.parser = yacc.yacc(module=self, debug=True)
+    def __init__(self, debug: bool = False,
+                 hooks: Optional[ParserHooks] = None) -> None:
+        """
+        Create a parser from the precompiled LALR tables. The tables are
+        loaded the first time the lalr engine runs, which the descent engine
+        only needs for input with syntax errors.
+
+        With debug set, the tables are regenerated from the grammar and
+        parser.out is written next to this module, which is useful when
+        working on the grammar.
+
+        With hooks, every parse reports its events to them. Parsers without
+        hooks run exactly as if hooks did not exist.
+        """
+        # Number of syntax errors recovered from during the last parse.
+        self.syntax_errors = 0
+        self.hooks = hooks
+        # The PLY parser, bound to this instance by _lalr. Every parse runs
+        # on a copy of it, which recovers from errors on its own.
+        self.parser: Any = None
+
+        if debug:
+            self.parser = yacc.yacc(module=self, debug=True,
+                                    write_tables=False)
+            if hooks is not None:
+                for production in self.parser.productions:
+                    if production.callable:
+                        production.callable = self._hooked(
+                            production.str, production.callable, hooks)
+
+    def _lalr(self) -> Any:
+        """
+        Return the PLY parser, binding the shared tables to this instance the
+        first time.
+        """
+        if self.parser is None:
+            table = _lr_table(self)
+            bound = yacc.LRTable()
+            bound.lr_action = table.lr_action
+            bound.lr_goto = table.lr_goto
+            bound.lr_productions = [
+                self._bind_production(production)
+                for production in table.lr_productions
+            ]
+            self.parser = yacc.LRParser(bound, self.p_error)
+
+        return self.parser
+
+    def _bind_production(self, production: yacc.MiniProduction) -> yacc.MiniProduction:
+        """
+        Copy a production of the shared tables and bind its action to this
+        parser.
+        """
+        bound = yacc.MiniProduction(production.str, production.name,
+                                    production.len, production.func,
+                                    production.file, production.line)
+        if production.func:
+            bound.callable = getattr(self, production.func)
+            if self.hooks is not None:
+                bound.callable = self._hooked(production.str, bound.callable,
+                                              self.hooks)
+        return bound
+
+    @staticmethod
+    def _hooked(production: str, action: Any,
+                hooks: ParserHooks) -> Any:
+        """
+        Wrap the action of a production so that its reductions are reported.
+        """
+        clock = time.perf_counter
+        reduced = hooks.production_reduced
+
+        def reduce(p: YaccProduction) -> None:
+            start = clock()
+            action(p)
+            reduced(production, clock() - start)
+
+        return reduce
+
+    def _feed(self, source: Any) -> Any:
+        if self.hooks is None:
+            return source
+        return _HookedFeed(source, self.hooks)
 
     def p_program(self, p: YaccProduction) -> None:
         """
@@ -46,11 +286,12 @@ class Parser:
 
     def p_stmts(self, p: YaccProduction) -> None:
         """
-        stmts : stmt stmts
+        stmts : stmts stmt
               | empty
         """
         if len(p) == 3:
-            p[0] = [p[1]] + p[2]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -128,7 +369,8 @@ class Parser:
                             | empty
         """
         if 3 <= len(p) <= 4:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -263,11 +505,7 @@ class Parser:
         """
         unary_expression : AMPERSAND expression
         """
-        if p[1] == '&' and not isinstance(p[2], ast.Identifier):
-            raise ParserError("Can only take a reference to an lvalue",
-                              p.lineno(1))
-
-        p[0] = ast.UnaryOp(op=p[1], rhs=p[2])
+        p[0] = unary_expression(p[1], p[2], p.lineno(1))
 
     def p_value_expression(self, p: YaccProduction) -> None:
         """
@@ -278,17 +516,7 @@ class Parser:
                          | BUILTIN_FUNCTION
                          | TYPE_UNDEFINED
         """
-        # TODO: It would be better to check the token type.
-        # TODO: Test this.
-        if isinstance(p[1], int):
-            p[0] = ast.Integer(p[1])
-        elif isinstance(p[1], str):
-            if p[1][0] == "'":
-                p[0] = ast.Char(p[1])
-            elif p[1][0] == '"':
-                p[0] = ast.String(p[1])
-            else:
-                p[0] = ast.Identifier(p[1])
+        p[0] = value_expression(p[1])
 
     def p_arithmetic_expression(self, p: YaccProduction) -> None:
         """
@@ -298,46 +526,7 @@ class Parser:
                               | expression DIVISION expression
                               | expression MODULE expression
         """
-        lhs, op, rhs = p[1:4]
-
-        if (isinstance(lhs, ast.Integer) and not isinstance(rhs, ast.Integer)):
-            raise ParserError(
-                f"Invalid types for binary operator '{op}', " +
-                "expected Integer and Integer, but got " +
-                f"{type(lhs).__name__} and {type(rhs).__name__}",
-                p.lineno(1)
-            )
-
-        if (isinstance(lhs, ast.String) and not isinstance(rhs, ast.String)):
-            raise ParserError(
-                f"Invalid types for binary operator '{op}', " +
-                "expected String and String, but got " +
-                f"{type(lhs).__name__} and {type(rhs).__name__}",
-                p.lineno(1)
-            )
-
-        if op == '+':
-            p[0] = ast.BinOp(lhs=lhs, op='+', rhs=rhs)
-        elif op == '-':
-            p[0] = ast.BinOp(lhs=lhs, op='-', rhs=rhs)
-        elif op == '*':
-            p[0] = ast.BinOp(lhs=lhs, op='*', rhs=rhs)
-        elif op == '/':
-            if isinstance(rhs, ast.Integer) and rhs.n == 0:
-                raise ParserError(
-                    f"'{op}': /by zero is undefined",
-                    p.lineno(1)
-                )
-            else:
-                p[0] = ast.BinOp(lhs=lhs, op='/', rhs=rhs)
-        elif op == '%':
-            if isinstance(rhs, ast.Integer) and rhs.n == 0:
-                raise ParserError(
-                    f"'{op}': /by zero is undefined",
-                    p.lineno(1)
-                )
-            else:
-                p[0] = ast.BinOp(lhs=lhs, op='%', rhs=rhs)
+        p[0] = arithmetic_expression(p[1], p[2], p[3], p.lineno(1))
 
     # TODO: Find another way to parse these, lots of S/R conflicts.
 
@@ -348,34 +537,7 @@ class Parser:
                               | expression IS_NOT_EQUAL expression
                               | expression GREATER_THAN expression
         """
-
-        lhs, op, rhs = p[1:4]
-
-        isValidExprLeft = isinstance(lhs, ast.Integer) and (
-            isinstance(rhs, ast.Integer) or isinstance(rhs, ast.Identifier))
-
-        isValidExprRight = isinstance(rhs, ast.Integer) and (
-            isinstance(lhs, ast.Integer) or isinstance(lhs, ast.Identifier))
-
-        if ((op == '<' or op == '>')
-                and not (isValidExprLeft or isValidExprRight)):
-            raise ParserError(
-                f"Invalid types for binary operator '{op}', " +
-                "expected Integer and Integer, but got " +
-                f"{type(lhs).__name__} and {type(rhs).__name__}",
-                p.lineno(1)
-            )
-
-        if ((op == '==' or op == '!=') and not (type(lhs) == type(rhs))):
-            raise ParserError(
-                f"Invalid types for operator '{op}', " +
-                f"expected '{type(lhs).__name__}' and '{type(lhs).__name__}' " +
-                f"or '{type(rhs).__name__}' and '{type(rhs).__name__}', but got " +
-                f"{type(lhs).__name__} and {type(rhs).__name__}",
-                p.lineno(1)
-            )
-
-        p[0] = ast.BinOp(lhs=p[1], op=p[2], rhs=p[3])
+        p[0] = comparison_expression(p[1], p[2], p[3], p.lineno(1))
 
     def p_if_expression(self, p: YaccProduction) -> None:
         """
@@ -396,7 +558,8 @@ class Parser:
                       | empty
         """
         if 3 <= len(p) <= 4:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -408,14 +571,21 @@ class Parser:
 
     def p_switch_branches(self, p: YaccProduction) -> None:
         """
-        switch_branches : switch_branch COMMA switch_branches
-                        | switch_branch COMMA
-                        | switch_branch
+        switch_branches : switch_branch_list COMMA
+                        | switch_branch_list
         """
-        if 2 <= len(p) <= 3:
-            p[0] = [p[1]]
+        p[0] = p[1]
+
+    def p_switch_branch_list(self, p: YaccProduction) -> None:
+        """
+        switch_branch_list : switch_branch_list COMMA switch_branch
+                           | switch_branch
+        """
+        if len(p) == 4:
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
-            p[0] = [p[1]] + p[3]
+            p[0] = [p[1]]
 
     def p_switch_branch(self, p: YaccProduction) -> None:
         """
@@ -442,19 +612,21 @@ class Parser:
 
     def p_switch_list(self, p: YaccProduction) -> None:
         """
-        switch_list : INTEGER COMMA switch_list
+        switch_list : switch_list COMMA INTEGER
                     | INTEGER
         """
         if len(p) == 2:
             p[0] = ast.SwitchList(elems=[ast.Integer(p[1])])
         else:
-            p[0] = ast.SwitchList(elems=[ast.Integer(p[1])] + p[3].elems)
+            p[1].elems.append(ast.Integer(p[3]))
+            p[0] = p[1]
 
     def p_struct_decl(self, p: YaccProduction) -> None:
         """
         struct_decl : STRUCT LCURLY struct_fields struct_methods RCURLY
         """
-        p[0] = ast.StructDeclaration(fields=p[3], methods=p[4])
+        # Struct methods have always been listed from last to first.
+        p[0] = ast.StructDeclaration(fields=p[3], methods=p[4][::-1])
 
     def p_struct_fields(self, p: YaccProduction) -> None:
         """
@@ -462,7 +634,8 @@ class Parser:
                       | empty
         """
         if len(p) == 4:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -487,7 +660,8 @@ class Parser:
                        | empty
         """
         if len(p) == 3:
-            p[0] = [p[2]] + p[1]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
@@ -504,12 +678,19 @@ class Parser:
 
     def p_struct_initializer_pairs(self, p: YaccProduction) -> None:
         """
-        struct_initializer_pairs : struct_initializer_pair COMMA struct_initializer_pairs
-                                 | struct_initializer_pair COMMA
-                                 | struct_initializer_pair
+        struct_initializer_pairs : struct_initializer_pair_list COMMA
+                                 | struct_initializer_pair_list
+        """
+        p[0] = p[1]
+
+    def p_struct_initializer_pair_list(self, p: YaccProduction) -> None:
+        """
+        struct_initializer_pair_list : struct_initializer_pair_list COMMA struct_initializer_pair
+                                     | struct_initializer_pair
         """
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
@@ -599,14 +780,19 @@ class Parser:
         if len(p) == 3:
             p[0] = [ast.Identifier(p[1])]
         else:
-            p[0] = p[1] + [ast.Identifier(p[2])]
+            p[1].append(ast.Identifier(p[2]))
+            p[0] = p[1]
 
     def p_enum_methods(self, p: YaccProduction) -> None:
         """
         enum_methods : enum_methods functiondecl_stmt
                      | empty
         """
-        p[0] = [] if len(p) == 2 else p[1] + [p[2]]
+        if len(p) == 3:
+            p[1].append(p[2])
+            p[0] = p[1]
+        else:
+            p[0] = []
 
     def p_anon_array(self, p: YaccProduction) -> None:
         """
@@ -620,31 +806,274 @@ class Parser:
                     | array_elems expression
                     | empty
         """
-        if len(p) == 4:
-            p[0] = p[1] + [p[2]]
-        elif len(p) == 3:
-            p[0] = p[1] + [p[2]]
+        if 3 <= len(p) <= 4:
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = []
 
     def p_error(self, token: LexToken) -> None:
         '''
-        Skip tokens until we meet a synchronization point, a semicolon in this
-        case.
+        PLY requires the grammar to have an error function, but every parse
+        recovers from errors with one of its own, see _recover.
+        '''
+
+    def _recover(self, lalr: Any, errors: _SyntaxErrors,
+                 token: LexToken) -> None:
+        '''
+        Report the syntax error at token to errors, then skip tokens until we
+        meet a synchronization point, a semicolon in this case.
         '''
         if not token:
             raise ParserError(
                 'Unexpected end of file while parsing, maybe you forgot a semicolon?'
             )
 
-        print(f'Error while parsing at token: {token.type}')
+        errors.report(Diagnostic(f'Error while parsing at token: {token.type}',
+                                 token.lineno, token.lexpos,
+                                 len(str(token.value))))
 
+        skipped = 0
         while True:
-            token = self.parser.token()
-            if not token or token.type == 'SEMICOLON':
+            next_token = lalr.token()
+            if not next_token or next_token.type == 'SEMICOLON':
                 break
+            skipped += 1
+
+        lalr.restart()
+
+        if self.hooks is not None:
+            self.hooks.error_recovered(token, skipped)
+
+    def parse(self, input: str, engine: str = 'lalr',
+              diagnostics: Optional[List[Diagnostic]] = None) -> ast.Program:
+        """
+        Parse the input with one of ENGINES: the LALR tables, or the
+        recursive descent parser of lexzig.descent, which is faster and
+        gives the same trees, errors and output.
+
+        What the lexer and the parser find wrong is added to diagnostics in
+        the order it appears in the input or, without it, printed in that
+        order once the parse ends.
+        """
+        found: List[Diagnostic] = [] if diagnostics is None else diagnostics
+        lexer = Lexer()
+        lexer.input(input)
+        lexer.diagnostics = found
+        try:
+            return self._parse(lexer.lexer, engine, _SyntaxErrors(found))
+        finally:
+            found.sort(key=lambda diagnostic: diagnostic.lexpos)
+            if diagnostics is None:
+                for diagnostic in found:
+                    print(diagnostic.message)
+
+    def parse_tokens(self, tokens: Iterable[LexToken], engine: str = 'lalr',
+                     diagnostics: Optional[List[Diagnostic]] = None
+                     ) -> ast.Program:
+        """
+        Parse tokens that were already lexed, for example by Lexer.lex.
+        Syntax errors are printed or, with diagnostics, added to it.
+        """
+        return self._parse(_TokenFeed(tokens), engine,
+                           _SyntaxErrors(diagnostics))
+
+    def partial_parse(self, input: str, engine: str = 'lalr',
+                      max_errors: Optional[int] = MAX_ERRORS
+                      ) -> Tuple[ast.Program, List[Diagnostic]]:
+        """
+        Parse the input without stopping at errors, returning the program
+        with every top-level statement that could be parsed, and what the
+        lexer and the parser found wrong with the rest, in the order it
+        appears in the input.
+
+        Finding more than max_errors errors raises TooManyErrors, unless it
+        is None.
+        """
+        lexer = Lexer(max_errors=max_errors)
+        lexer.input(input)
+        return self.partial_parse_tokens(lexer.lexer, engine, max_errors,
+                                         lexer.diagnostics)
+
+    def partial_parse_tokens(self, tokens: Iterable[LexToken],
+                             engine: str = 'lalr',
+                             max_errors: Optional[int] = MAX_ERRORS,
+                             diagnostics: Optional[List[Diagnostic]] = None
+                             ) -> Tuple[ast.Program, List[Diagnostic]]:
+        """
+        Like partial_parse, for tokens that are lexed elsewhere. The errors
+        are added to diagnostics, which a lexer can be adding its own to
+        as the tokens are read.
+
+        Statements are parsed on their own, as in iter_parse_tokens, so that
+        an error only takes the statement it is in out of the program. An
+        error that stops the parse of a statement is reported as covering
+        all of it.
+        """
+        found: List[Diagnostic] = [] if diagnostics is None else diagnostics
+        stmts: List[ast.Stmt] = []
+
+        for statement in split_statements(tokens):
+            errors = _SyntaxErrors(found, max_errors)
+            try:
+                program = self._parse(_TokenFeed(statement), engine, errors)
+            except TooManyErrors:
+                raise
+            except ParserError as parser_error:
+                start, last = statement[0], statement[-1]
+                errors.report(Diagnostic(
+                    parser_error.message, parser_error.lineno or start.lineno,
+                    start.lexpos,
+                    last.lexpos + len(str(last.value)) - start.lexpos))
+                continue
+
+            # What follows a syntax error is parsed as if it started a
+            # statement, so it is left out along with the statement.
+            if program is not None and not errors.count:
+                stmts += program.stmts
+
+        found.sort(key=lambda diagnostic: diagnostic.lexpos)
+        return ast.Program(stmts=stmts), found
+
+    def _parse(self, source: Any, engine: str,
+               errors: Optional[_SyntaxErrors] = None) -> ast.Program:
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown parser engine: {engine}')
+
+        self.syntax_errors = 0
+        if errors is None:
+            errors = _SyntaxErrors()
+
+        if engine == 'descent':
+            if self.hooks is not None:
+                raise ValueError('Hooks only apply to the lalr engine')
+
+            # Imported here, since the descent parser builds on this module.
+            from lexzig.descent import DescentParser
+
+            descent = DescentParser(source)
+            program = descent.parse()
+            if program is not None:
+                return program
+
+            # Errors are rare, and which one is found first and how the
+            # parser recovers from it are defined by the LALR tables, so
+            # the tokens are parsed again with them.
+            source = _TokenFeed(descent.replay())
+
+        lalr = copy.copy(self._lalr())
+        lalr.errorfunc = lambda token: self._recover(lalr, errors, token)
+        try:
+            return cast(ast.Program, lalr.parse(lexer=self._feed(source)))
+        finally:
+            self.syntax_errors = errors.count
+
+    def iter_parse(self, input: str, engine: str = 'lalr',
+                   diagnostics: Optional[List[Diagnostic]] = None
+                   ) -> Iterator[ast.Stmt]:
+        """
+        Parse the input one top-level statement at a time, yielding every
+        statement as soon as its last token is read.
+
+        What the lexer and the parser find wrong is printed as it is found
+        or, with diagnostics, added to it as it is found.
+        """
+        lexer = Lexer()
+        lexer.input(input)
+        if diagnostics is None:
+            return self.iter_parse_tokens(
+                print_diagnostics(lexer, lexer.lexer), engine)
+
+        lexer.diagnostics = diagnostics
+        return self.iter_parse_tokens(lexer.lexer, engine, diagnostics)
+
+    def iter_parse_tokens(self, tokens: Iterable[LexToken],
+                          engine: str = 'lalr',
+                          diagnostics: Optional[List[Diagnostic]] = None
+                          ) -> Iterator[ast.Stmt]:
+        """
+        Like iter_parse, for tokens that are lexed elsewhere. Only the tokens
+        of the statement being parsed are kept in memory. Syntax errors are
+        printed or, with diagnostics, added to it.
+
+        Statements are parsed on their own, so syntax error recovery cannot
+        skip past the end of the statement where the error was found.
+        """
+        for statement in split_statements(tokens):
+            program = self.parse_tokens(statement, engine, diagnostics)
+            if program is not None:
+                yield from program.stmts
+
+
+def _grammar_version() -> str:
+    """
+    Hash the PLY signature of the grammar, which covers the start symbol,
+    the precedence table, the tokens and every production.
+    """
+    pdict = {name: getattr(Parser, name) for name in dir(Parser)}
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+    return hashlib.sha256(pinfo.signature().encode()).hexdigest()[:16]
+
+
+GRAMMAR_VERSION = _grammar_version()
+
+TABLE_MODULE = f'lexzig.tables.parsetab_{GRAMMAR_VERSION}'
+
+_table: Optional[yacc.LRTable] = None
+
+_shared_parser: Optional[Parser] = None
+
+
+def _lr_table(owner: Parser) -> yacc.LRTable:
+    """
+    Load the LALR tables once per process.
+
+    The tables shipped in lexzig/tables are read directly when they match the
+    current grammar, which their name tells. Otherwise they are built in
+    memory, without writing anything to disk.
+    """
+    global _table
+
+    if _table is None:
+        table = yacc.LRTable()
+        try:
+            table.read_table(TABLE_MODULE)
+        except (ImportError, yacc.VersionError):
+            parser = yacc.yacc(module=owner, tabmodule=TABLE_MODULE,
+                               debug=False, write_tables=False,
+                               errorlog=yacc.NullLogger())
+            table.lr_action = parser.action
+            table.lr_goto = parser.goto
+            table.lr_productions = parser.productions
+        _table = table
+
+    return _table
+
+
+def shared_parser() -> Parser:
+    """
+    Return a parser shared by the whole process.
+    """
+    global _shared_parser
+
+    if _shared_parser is None:
+        _shared_parser = Parser()
+
+    return _shared_parser
+
+
+def write_tables(outputdir: str = TABLES_DIR) -> str:
+    """
+    Generate the table module for the current grammar and remove the ones
+    left behind by previous versions of it.
+
+    Returns the path of the table module.
+    """
+    basename = TABLE_MODULE.split('.')[-1]
+    remove_stale_tables(outputdir, 'parsetab_', basename)
 
-        self.parser.restart()
+    yacc.yacc(module=Parser(), tabmodule=TABLE_MODULE, outputdir=outputdir,
+              debug=False, errorlog=yacc.NullLogger())
 
-    def parse(self, input: str) -> ast.Program:
-        return cast(ast.Program, self.parser.parse(input, lexer=Lexer().lexer))
+    return os.path.join(outputdir, basename + '.py')
@@ -0,0 +1,120 @@
+"""
+Profile where the parser spends its time on an input.
+
+    python -m lexzig.profiler FILE [--limit 20]
+"""
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ply.lex import LexToken  # type: ignore
+
+import lexzig.ast as ast
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserHooks
+
+
+@dataclass
+class Stat:
+    count: int = 0
+    seconds: float = 0.0
+
+
+class ParseProfiler(ParserHooks):
+    """
+    Count the reductions of every production and the tokens of every type,
+    and add up the time spent on each.
+
+    The time of a token type is the time between reading a token of that
+    type and reading the next one, which is when the parser shifts it and
+    reduces the productions it completes.
+    """
+
+    def __init__(self) -> None:
+        self.parser = Parser(hooks=self)
+        self.productions: Dict[str, Stat] = {}
+        self.tokens: Dict[str, Stat] = {}
+        self.errors = 0
+        self.seconds = 0.0
+        self._last_type: Optional[str] = None
+        self._last_time = 0.0
+
+    def profile(self, input: str) -> ast.Program:
+        """
+        Parse the input, adding its events to the ones profiled so far.
+        """
+        tokens = Lexer().lex(input)
+
+        start = self._last_time = time.perf_counter()
+        self._last_type = None
+        try:
+            return self.parser.parse_tokens(tokens)
+        finally:
+            self._close_token(time.perf_counter())
+            self.seconds += self._last_time - start
+
+    def token_consumed(self, token: LexToken) -> None:
+        self._close_token(time.perf_counter())
+        self._last_type = token.type
+
+    def production_reduced(self, production: str, seconds: float) -> None:
+        stat = self.productions.get(production)
+        if stat is None:
+            stat = self.productions[production] = Stat()
+        stat.count += 1
+        stat.seconds += seconds
+
+    def error_recovered(self, token: LexToken, skipped: int) -> None:
+        self.errors += 1
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        Format the productions and token types, the slowest first.
+        """
+        lines = [f'{self.seconds * 1e3:.2f} ms parsing, '
+                 f'{self.errors} syntax errors', '']
+        lines += _table('production', self.productions, self.seconds, limit)
+        lines.append('')
+        lines += _table('token', self.tokens, self.seconds, limit)
+        return '\n'.join(lines)
+
+    def _close_token(self, now: float) -> None:
+        if self._last_type is not None:
+            stat = self.tokens.get(self._last_type)
+            if stat is None:
+                stat = self.tokens[self._last_type] = Stat()
+            stat.count += 1
+            stat.seconds += now - self._last_time
+        self._last_time = now
+
+
+def _table(title: str, stats: Dict[str, Stat], total: float,
+           limit: Optional[int]) -> List[str]:
+    rows = sorted(stats.items(), key=lambda item: item[1].seconds,
+                  reverse=True)[:limit]
+    lines = [f'{"count":>10} {"ms":>10} {"%":>6}  {title}']
+    for name, stat in rows:
+        share = stat.seconds / total * 100 if total else 0.0
+        lines.append(f'{stat.count:>10} {stat.seconds * 1e3:>10.2f} '
+                     f'{share:>6.1f}  {name}')
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('file')
+    parser.add_argument('--limit', type=int, default=20,
+                        help='rows to show in each table')
+    args = parser.parse_args()
+
+    with open(args.file) as f:
+        input = f.read()
+
+    profiler = ParseProfiler()
+    profiler.profile(input)
+    print(profiler.report(args.limit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+from typing import Iterable, Iterator, List, Optional
+
+from ply.lex import LexToken  # type: ignore
+
+OPENING = {'LPAREN', 'LCURLY', 'LBRACE'}
+CLOSING = {'RPAREN', 'RCURLY', 'RBRACE'}
+
+# Tokens that may come before the keyword that tells what a statement is.
+MODIFIERS = {'PUB', 'EXPORT'}
+
+# Statements that end with their body instead of a semicolon.
+BLOCK_STATEMENTS = {'FUNCTION', 'FOR', 'WHILE'}
+
+
+class StatementSplitter:
+    """
+    Group tokens into top-level statements as they come in.
+
+    A top-level statement ends at the first semicolon outside of any
+    brackets or, for functions and loops, at the curly brace that closes
+    their body.
+    """
+
+    def __init__(self) -> None:
+        self.tokens: List[LexToken] = []
+        self.depth = 0
+        self.kind: Optional[str] = None
+
+    def feed(self, token: LexToken) -> Optional[List[LexToken]]:
+        """
+        Add a token, returning the tokens of the statement it completes.
+        """
+        self.tokens.append(token)
+
+        if self.kind is None and token.type not in MODIFIERS:
+            self.kind = token.type
+
+        if token.type in OPENING:
+            self.depth += 1
+        elif token.type in CLOSING:
+            # A stray closing bracket must not leave the brackets that
+            # follow it looking like the top level.
+            self.depth = max(self.depth - 1, 0)
+
+        if self.depth > 0:
+            return None
+
+        if token.type == 'SEMICOLON' or (
+                token.type == 'RCURLY' and self.kind in BLOCK_STATEMENTS):
+            return self.flush()
+
+        return None
+
+    def flush(self) -> List[LexToken]:
+        """
+        Return the tokens of the statement in progress and start a new one.
+        """
+        tokens = self.tokens
+        self.tokens = []
+        self.depth = 0
+        self.kind = None
+        return tokens
+
+
+def split_statements(tokens: Iterable[LexToken]) -> Iterator[List[LexToken]]:
+    """
+    Group tokens into top-level statements. Whatever is left at the end of
+    the input is returned as a last, incomplete, statement.
+    """
+    splitter = StatementSplitter()
+
+    for token in tokens:
+        statement = splitter.feed(token)
+        if statement is not None:
+            yield statement
+
+    rest = splitter.flush()
+    if rest:
+        yield rest
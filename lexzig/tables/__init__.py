@@ -0,0 +1,16 @@
+"""
+Precompiled PLY tables, named after the hash of the grammar they were
+generated from. Regenerate them with `make tables`.
+"""
+import os
+
+TABLES_DIR = os.path.dirname(__file__)
+
+
+def remove_stale_tables(outputdir: str, prefix: str, current: str) -> None:
+    """
+    Remove the table modules starting with prefix, except for current.
+    """
+    for filename in os.listdir(outputdir):
+        if filename.startswith(prefix) and filename != current + '.py':
+            os.remove(os.path.join(outputdir, filename))
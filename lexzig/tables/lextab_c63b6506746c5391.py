@@ -0,0 +1,10 @@
+# lextab_c63b6506746c5391.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AMPERSAND', 'BANG', 'BAR', 'BUILTIN_FUNCTION', 'CHAR', 'COLON', 'COMMA', 'COMPTIME', 'CONST', 'DIVISION', 'DIV_EQUAL', 'DOT', 'ELLIPSIS', 'ELSE', 'ENUM', 'EQUAL', 'EXPORT', 'EXTERN', 'FAT_ARROW', 'FOR', 'FUNCTION', 'GREATER_THAN', 'IDENT', 'IF', 'INTEGER', 'IS_EQUAL_TO', 'IS_NOT_EQUAL', 'LBRACE', 'LCURLY', 'LPAREN', 'LT', 'MINUS', 'MINUS_EQUAL', 'MODULE', 'MOD_EQUAL', 'MULTIPLICATION', 'MULT_EQUAL', 'PLUS', 'PLUS_EQUAL', 'PUB', 'RBRACE', 'RCURLY', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'STRUCT', 'SWITCH', 'TEST', 'THREADLOCAL', 'TRY', 'TYPE_ANYERROR', 'TYPE_ANYOPAQUE', 'TYPE_ANYTYPE', 'TYPE_BOOL', 'TYPE_COMPTIME_FLOAT', 'TYPE_COMPTIME_INT', 'TYPE_C_INT', 'TYPE_C_LONG', 'TYPE_C_LONGDOUBLE', 'TYPE_C_LONGLONG', 'TYPE_C_SHORT', 'TYPE_C_UINT', 'TYPE_C_ULONG', 'TYPE_C_ULONGLONG', 'TYPE_C_USHORT', 'TYPE_F128', 'TYPE_F16', 'TYPE_F32', 'TYPE_F64', 'TYPE_F80', 'TYPE_I128', 'TYPE_I16', 'TYPE_I32', 'TYPE_I64', 'TYPE_I8', 'TYPE_ISIZE', 'TYPE_NORETURN', 'TYPE_NULL', 'TYPE_TYPE', 'TYPE_U128', 'TYPE_U16', 'TYPE_U32', 'TYPE_U64', 'TYPE_U8', 'TYPE_UNDEFINED', 'TYPE_USIZE', 'TYPE_VOID', 'UNDERSCORE', 'VAR', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_BUILTIN_FUNCTION>@[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_INTEGER>\\d+)|(?P<t_IDENT>(@"[^"]*"|[a-zA-Z_][a-zA-Z_0-9]*))|(?P<t_COMMENTS>//.* | ///.* | //!)|(?P<t_newline>\\n+)|(?P<t_CHAR>\'([^\']|\\\\n)\')|(?P<t_STRING>"[^"]*")|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_MINUS_EQUAL>\\-=)|(?P<t_MULT_EQUAL>\\*=)|(?P<t_PLUS_EQUAL>\\+=)|(?P<t_BAR>\\|)|(?P<t_DIV_EQUAL>/=)|(?P<t_DOT>\\.)|(?P<t_FAT_ARROW>=>)|(?P<t_GREATER_THAN>\\>)|(?P<t_IS_EQUAL_TO>==)|(?P<t_IS_NOT_EQUAL>!=)|(?P<t_LBRACE>\\[)|(?P<t_LPAREN>\\()|(?P<t_LT>\\<)|(?P<t_MINUS>\\-)|(?P<t_MOD_EQUAL>%=)|(?P<t_MULTIPLICATION>\\*)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\])|(?P<t_RPAREN>\\))|(?P<t_AMPERSAND>&)|(?P<t_BANG>!)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVISION>/)|(?P<t_EQUAL>=)|(?P<t_LCURLY>{)|(?P<t_MODULE>%)|(?P<t_RCURLY>})|(?P<t_SEMICOLON>;)|(?P<t_UNDERSCORE>_)', [None, ('t_BUILTIN_FUNCTION', 'BUILTIN_FUNCTION'), ('t_INTEGER', 'INTEGER'), ('t_IDENT', 'IDENT'), None, ('t_COMMENTS', 'COMMENTS'), ('t_newline', 'newline'), (None, 'CHAR'), None, (None, 'STRING'), (None, 'ELLIPSIS'), (None, 'MINUS_EQUAL'), (None, 'MULT_EQUAL'), (None, 'PLUS_EQUAL'), (None, 'BAR'), (None, 'DIV_EQUAL'), (None, 'DOT'), (None, 'FAT_ARROW'), (None, 'GREATER_THAN'), (None, 'IS_EQUAL_TO'), (None, 'IS_NOT_EQUAL'), (None, 'LBRACE'), (None, 'LPAREN'), (None, 'LT'), (None, 'MINUS'), (None, 'MOD_EQUAL'), (None, 'MULTIPLICATION'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RPAREN'), (None, 'AMPERSAND'), (None, 'BANG'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVISION'), (None, 'EQUAL'), (None, 'LCURLY'), (None, 'MODULE'), (None, 'RCURLY'), (None, 'SEMICOLON'), (None, 'UNDERSCORE')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
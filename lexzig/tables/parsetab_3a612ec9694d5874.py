@@ -0,0 +1,196 @@
+
+# parsetab_3a612ec9694d5874.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftELSEnonassocMINUS_EQUALMOD_EQUALMULT_EQUALPLUS_EQUALDIV_EQUALEQUALnonassocLTIS_EQUAL_TOGREATER_THANIS_NOT_EQUALleftPLUSMINUSleftMULTIPLICATIONDIVISIONMODULErightAMPERSANDleftDOTAMPERSAND BANG BAR BUILTIN_FUNCTION CHAR COLON COMMA COMPTIME CONST DIVISION DIV_EQUAL DOT ELLIPSIS ELSE ENUM EQUAL EXPORT EXTERN FAT_ARROW FOR FUNCTION GREATER_THAN IDENT IF INTEGER IS_EQUAL_TO IS_NOT_EQUAL LBRACE LCURLY LPAREN LT MINUS MINUS_EQUAL MODULE MOD_EQUAL MULTIPLICATION MULT_EQUAL PLUS PLUS_EQUAL PUB RBRACE RCURLY RETURN RPAREN SEMICOLON STRING STRUCT SWITCH TEST THREADLOCAL TRY TYPE_ANYERROR TYPE_ANYOPAQUE TYPE_ANYTYPE TYPE_BOOL TYPE_COMPTIME_FLOAT TYPE_COMPTIME_INT TYPE_C_INT TYPE_C_LONG TYPE_C_LONGDOUBLE TYPE_C_LONGLONG TYPE_C_SHORT TYPE_C_UINT TYPE_C_ULONG TYPE_C_ULONGLONG TYPE_C_USHORT TYPE_F128 TYPE_F16 TYPE_F32 TYPE_F64 TYPE_F80 TYPE_I128 TYPE_I16 TYPE_I32 TYPE_I64 TYPE_I8 TYPE_ISIZE TYPE_NORETURN TYPE_NULL TYPE_TYPE TYPE_U128 TYPE_U16 TYPE_U32 TYPE_U64 TYPE_U8 TYPE_UNDEFINED TYPE_USIZE TYPE_VOID UNDERSCORE VAR WHILE\n        program : stmts\n        \n        stmts : stmts stmt\n              | empty\n        \n        stmt : assignment_stmt\n             | functiondecl_stmt\n             | expression_stmt\n             | return_stmt\n             | for_stmt\n             | while_stmt\n        \n        return_stmt : RETURN expression SEMICOLON\n        \n        assignment_expression : IDENT assignment_stmt_tail\n        \n        assignment_stmt : vardecl IDENT assignment_stmt_tail SEMICOLON\n                        | vardecl IDENT COLON error_union_typedecl assignment_stmt_tail SEMICOLON\n                        | UNDERSCORE assignment_stmt_tail SEMICOLON\n        \n        assignment_stmt_tail : EQUAL expression\n                             | MINUS_EQUAL expression\n                             | MOD_EQUAL expression\n                             | MULT_EQUAL expression\n                             | PLUS_EQUAL expression\n                             | DIV_EQUAL expression\n        \n        functiondecl_stmt : function_signature function_body\n        function_param : IDENT COLON compound_typedecl\n        function_param_list : function_param_list function_param COMMA\n                            | function_param_list function_param\n                            | empty\n        \n        function_signature : PUB EXPORT FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl\n                           | PUB FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl\n                           | EXPORT FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl\n                           | FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl\n        \n        function_body : LCURLY stmts RCURLY\n        \n        vardecl : EXPORT vardecl_tail\n                | vardecl_tail\n        \n        vardecl_tail : VAR\n                     | CONST\n                     | COMPTIME\n        \n        compound_typedecl : LBRACE RBRACE typedecl\n                          | LBRACE INTEGER RBRACE typedecl\n                          | LBRACE UNDERSCORE RBRACE typedecl\n                          | typedecl\n        \n        error_union_typedecl : BANG compound_typedecl\n                             | IDENT BANG compound_typedecl\n                             | compound_typedecl\n        \n        typedecl : TYPE_I32\n                 | TYPE_I8\n                 | TYPE_U8\n                 | TYPE_I16\n                 | TYPE_U16\n                 | TYPE_U32\n                 | TYPE_I64\n                 | TYPE_U64\n                 | TYPE_I128\n                 | TYPE_U128\n                 | TYPE_ISIZE\n                 | TYPE_USIZE\n                 | TYPE_C_SHORT\n                 | TYPE_C_USHORT\n                 | TYPE_C_INT\n                 | TYPE_C_UINT\n                 | TYPE_C_LONG\n                 | TYPE_C_ULONG\n                 | TYPE_C_LONGLONG\n                 | TYPE_C_ULONGLONG\n                 | TYPE_C_LONGDOUBLE\n                 | TYPE_F16\n                 | TYPE_F32\n                 | TYPE_F64\n                 | TYPE_F80\n                 | TYPE_F128\n                 | TYPE_BOOL\n                 | TYPE_ANYOPAQUE\n                 | TYPE_VOID\n                 | TYPE_NORETURN\n                 | TYPE_TYPE\n                 | TYPE_ANYERROR\n                 | TYPE_ANYTYPE\n                 | TYPE_COMPTIME_INT\n                 | TYPE_COMPTIME_FLOAT\n                 | TYPE_NULL\n                 | TYPE_UNDEFINED\n                 | IDENT\n        \n        expression_stmt : expression SEMICOLON\n        \n        expression : postfix_expression\n        \n        postfix_expression : field_access\n                           | function_call\n                           | primary_expression\n        \n        primary_expression : arithmetic_expression\n                           | comparison_expression\n                           | if_expression\n                           | switch_expression\n                           | struct_decl\n                           | enum_decl\n                           | anon_array\n                           | struct_instantiation\n                           | try_expression\n                           | unary_expression\n                           | assignment_expression\n                           | value_expression\n        \n        unary_expression : AMPERSAND expression\n        \n        value_expression : INTEGER\n                         | STRING\n                         | IDENT\n                         | CHAR\n                         | BUILTIN_FUNCTION\n                         | TYPE_UNDEFINED\n        \n        arithmetic_expression : expression PLUS expression\n                              | expression MINUS expression\n                              | expression MULTIPLICATION expression\n                              | expression DIVISION expression\n                              | expression MODULE expression\n        \n        comparison_expression : expression LT expression\n                              | expression IS_EQUAL_TO expression\n                              | expression IS_NOT_EQUAL expression\n                              | expression GREATER_THAN expression\n        \n        if_expression : IF LPAREN expression RPAREN expression ELSE expression\n        \n        function_call : postfix_expression LPAREN function_args RPAREN\n        \n        function_args : function_args expression COMMA\n                      | function_args expression\n                      | empty\n        \n        switch_expression : SWITCH LPAREN expression RPAREN LCURLY switch_branches RCURLY\n        \n        switch_branches : switch_branch_list COMMA\n                        | switch_branch_list\n        \n        switch_branch_list : switch_branch_list COMMA switch_branch\n                           | switch_branch\n        \n        switch_branch : switch_match_target FAT_ARROW expression\n        \n        switch_match_target : switch_range\n                            | switch_list\n                            | ELSE\n        \n        switch_range : INTEGER ELLIPSIS INTEGER\n        \n        switch_list : switch_list COMMA INTEGER\n                    | INTEGER\n        \n        struct_decl : STRUCT LCURLY struct_fields struct_methods RCURLY\n        \n        struct_fields : struct_fields struct_field COMMA\n                      | empty\n        \n        struct_field : IDENT COLON compound_typedecl\n        \n        field_access : postfix_expression DOT IDENT\n        \n        struct_methods : struct_methods functiondecl_stmt\n                       | empty\n        \n        struct_instantiation : IDENT LCURLY struct_initializer_pairs RCURLY\n                             | DOT LCURLY struct_initializer_pairs RCURLY\n        \n        struct_initializer_pairs : struct_initializer_pair_list COMMA\n                                 | struct_initializer_pair_list\n        \n        struct_initializer_pair_list : struct_initializer_pair_list COMMA struct_initializer_pair\n                                     | struct_initializer_pair\n        \n        struct_initializer_pair : struct_initializer_field_name EQUAL expression\n        \n        struct_initializer_field_name : DOT IDENT\n        \n        for_stmt : FOR LPAREN expression RPAREN for_stmt_capture LCURLY stmts RCURLY\n        \n        for_stmt_capture : BAR for_stmt_capture_target COMMA for_stmt_capture_target BAR\n                         | BAR for_stmt_capture_target BAR\n        \n        for_stmt_capture_target : IDENT\n                                | UNDERSCORE\n        \n        while_stmt : WHILE LPAREN expression RPAREN LCURLY stmts RCURLY\n                   | WHILE LPAREN expression RPAREN BAR while_stmt_capture_target BAR LCURLY stmts RCURLY\n                   | WHILE LPAREN expression RPAREN COLON LPAREN expression RPAREN LCURLY stmts RCURLY\n        \n        while_stmt_capture_target : IDENT\n                                  | UNDERSCORE\n        \n        try_expression : TRY expression\n        empty :\n        enum_decl : ENUM LCURLY enum_variants enum_methods RCURLY\n        \n        enum_variants : enum_variants IDENT COMMA\n                      | IDENT COMMA\n        \n        enum_methods : enum_methods functiondecl_stmt\n                     | empty\n        \n        anon_array : DOT LCURLY array_elems RCURLY\n        \n        array_elems : array_elems expression COMMA\n                    | array_elems expression\n                    | empty\n        '
+    
+_lr_action_items = {'UNDERSCORE':([0,2,3,4,5,6,7,8,9,10,64,65,66,106,107,117,136,141,184,217,218,219,240,244,248,271,273,274,287,289,297,298,299,300,301,],[-157,13,-3,-2,-4,-5,-6,-7,-8,-9,-21,-157,-81,-14,13,-10,-12,213,-30,247,-157,251,-13,-157,13,13,247,-151,-146,-157,13,-157,-152,13,-153,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,16,-3,-2,-4,-5,-6,-7,-8,-9,-21,-157,-81,-14,16,-10,-12,-30,-157,-13,-157,16,16,-151,-146,-157,16,-157,-152,16,-153,]),'FOR':([0,2,3,4,5,6,7,8,9,10,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,17,-3,-2,-4,-5,-6,-7,-8,-9,-21,-157,-81,-14,17,-10,-12,-30,-157,-13,-157,17,17,-151,-146,-157,17,-157,-152,17,-153,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,18,-3,-2,-4,-5,-6,-7,-8,-9,-21,-157,-81,-14,18,-10,-12,-30,-157,-13,-157,18,18,-151,-146,-157,18,-157,-152,18,-153,]),'EXPORT':([0,2,3,4,5,6,7,8,9,10,21,64,65,66,89,106,107,117,132,133,134,136,184,199,201,203,205,206,218,232,234,237,238,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,19,-3,-2,-4,-5,-6,-7,-8,-9,81,-21,-157,-81,-157,-14,19,-10,-157,-133,-157,-12,-30,233,-137,233,-162,-160,-157,-136,-132,-161,-159,-13,-157,19,19,-151,-146,-157,19,-157,-152,19,-153,]),'PUB':([0,2,3,4,5,6,7,8,9,10,64,65,66,89,106,107,117,132,133,134,136,184,199,201,203,205,206,218,232,234,237,238,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,21,-3,-2,-4,-5,-6,-7,-8,-9,-21,-157,-81,-157,-14,21,-10,-157,-133,-157,-12,-30,21,-137,21,-162,-160,-157,-136,-132,-161,-159,-13,-157,21,21,-151,-146,-157,21,-157,-152,21,-153,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,19,21,64,65,66,81,89,106,107,117,132,133,134,136,184,199,201,203,205,206,218,232,233,234,237,238,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,22,-3,-2,-4,-5,-6,-7,-8,-9,80,82,-21,-157,-81,121,-157,-14,22,-10,-157,-133,-157,-12,-30,22,-137,22,-162,-160,-157,-136,80,-132,-161,-159,-13,-157,22,22,-151,-146,-157,22,-157,-152,22,-153,]),'VAR':([0,2,3,4,5,6,7,8,9,10,19,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,24,-3,-2,-4,-5,-6,-7,-8,-9,24,-21,-157,-81,-14,24,-10,-12,-30,-157,-13,-157,24,24,-151,-146,-157,24,-157,-152,24,-153,]),'CONST':([0,2,3,4,5,6,7,8,9,10,19,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,25,-3,-2,-4,-5,-6,-7,-8,-9,25,-21,-157,-81,-14,25,-10,-12,-30,-157,-13,-157,25,25,-151,-146,-157,25,-157,-152,25,-153,]),'COMPTIME':([0,2,3,4,5,6,7,8,9,10,19,64,65,66,106,107,117,136,184,218,240,244,248,271,274,287,289,297,298,299,300,301,],[-157,26,-3,-2,-4,-5,-6,-7,-8,-9,26,-21,-157,-81,-14,26,-10,-12,-30,-157,-13,-157,26,26,-151,-146,-157,26,-157,-152,26,-153,]),'IF':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,43,-3,-2,-4,-5,-6,-7,-8,-9,-101,43,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,43,43,-99,-100,-102,-103,-104,-11,43,43,43,43,43,43,-21,-157,-81,43,43,43,43,43,43,43,43,43,43,43,-157,-157,43,43,-156,-98,-15,-16,-17,-18,-19,-20,-14,43,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,43,-118,43,-166,-12,-138,43,-30,-115,-117,-163,-165,-139,43,-157,-116,-164,-131,-158,-13,-157,43,43,43,43,-151,-114,-119,43,-146,-157,43,-157,-152,43,-153,]),'SWITCH':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,44,-3,-2,-4,-5,-6,-7,-8,-9,-101,44,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,44,44,-99,-100,-102,-103,-104,-11,44,44,44,44,44,44,-21,-157,-81,44,44,44,44,44,44,44,44,44,44,44,-157,-157,44,44,-156,-98,-15,-16,-17,-18,-19,-20,-14,44,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,44,-118,44,-166,-12,-138,44,-30,-115,-117,-163,-165,-139,44,-157,-116,-164,-131,-158,-13,-157,44,44,44,44,-151,-114,-119,44,-146,-157,44,-157,-152,44,-153,]),'STRUCT':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,45,-3,-2,-4,-5,-6,-7,-8,-9,-101,45,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,45,45,-99,-100,-102,-103,-104,-11,45,45,45,45,45,45,-21,-157,-81,45,45,45,45,45,45,45,45,45,45,45,-157,-157,45,45,-156,-98,-15,-16,-17,-18,-19,-20,-14,45,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,45,-118,45,-166,-12,-138,45,-30,-115,-117,-163,-165,-139,45,-157,-116,-164,-131,-158,-13,-157,45,45,45,45,-151,-114,-119,45,-146,-157,45,-157,-152,45,-153,]),'ENUM':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,46,-3,-2,-4,-5,-6,-7,-8,-9,-101,46,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,46,46,-99,-100,-102,-103,-104,-11,46,46,46,46,46,46,-21,-157,-81,46,46,46,46,46,46,46,46,46,46,46,-157,-157,46,46,-156,-98,-15,-16,-17,-18,-19,-20,-14,46,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,46,-118,46,-166,-12,-138,46,-30,-115,-117,-163,-165,-139,46,-157,-116,-164,-131,-158,-13,-157,46,46,46,46,-151,-114,-119,46,-146,-157,46,-157,-152,46,-153,]),'DOT':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,55,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,181,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,30,-3,-2,-4,-5,-6,-7,-8,-9,-101,30,84,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,30,30,-99,-100,-102,-103,-104,99,-11,30,30,30,30,30,30,-21,-157,-81,30,30,30,30,30,30,30,30,30,30,30,-157,99,30,30,-156,-98,-15,-16,-17,-18,-19,-20,-14,30,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,30,-118,30,-166,-12,-138,99,30,-30,-115,-117,-163,-165,-139,30,-157,-116,-164,-131,-158,-13,-157,30,30,30,30,-151,-114,-119,30,-146,-157,30,-157,-152,30,-153,]),'IDENT':([0,2,3,4,5,6,7,8,9,10,11,12,16,20,22,23,24,25,26,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,79,80,82,84,85,86,87,88,89,90,91,92,94,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,121,123,124,125,126,127,129,132,133,134,136,139,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,184,187,189,190,191,192,193,194,195,196,197,206,207,210,211,217,218,219,221,222,223,225,226,227,228,231,234,235,236,238,240,241,242,243,244,248,252,253,254,255,256,258,259,269,270,271,273,274,278,280,281,282,284,287,289,297,298,299,300,301,],[-157,12,-3,-2,-4,-5,-6,-7,-8,-9,54,-101,12,-32,83,-82,-33,-34,-35,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,12,12,-99,-100,-102,-103,-104,-11,12,12,12,12,12,12,-21,-157,-81,12,12,12,12,12,12,12,12,12,12,12,-31,120,122,124,-157,-157,12,12,-157,135,-156,-98,137,183,-15,-16,-17,-18,-19,-20,-14,12,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,188,-157,-135,12,-118,12,-166,202,-133,204,-12,210,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-138,12,-30,-157,-157,224,-25,-115,-117,-163,-165,-139,12,-160,210,-80,210,246,-157,250,224,-157,224,137,-24,-116,-164,-131,-132,210,-158,-159,-13,-36,210,210,-157,12,12,137,224,137,210,-23,12,-37,-38,12,246,-151,137,-22,-114,-119,12,-146,-157,12,-157,-152,12,-153,]),'TRY':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,47,-3,-2,-4,-5,-6,-7,-8,-9,-101,47,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,47,47,-99,-100,-102,-103,-104,-11,47,47,47,47,47,47,-21,-157,-81,47,47,47,47,47,47,47,47,47,47,47,-157,-157,47,47,-156,-98,-15,-16,-17,-18,-19,-20,-14,47,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,47,-118,47,-166,-12,-138,47,-30,-115,-117,-163,-165,-139,47,-157,-116,-164,-131,-158,-13,-157,47,47,47,47,-151,-114,-119,47,-146,-157,47,-157,-152,47,-153,]),'AMPERSAND':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,48,-3,-2,-4,-5,-6,-7,-8,-9,-101,48,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,48,48,-99,-100,-102,-103,-104,-11,48,48,48,48,48,48,-21,-157,-81,48,48,48,48,48,48,48,48,48,48,48,-157,-157,48,48,-156,-98,-15,-16,-17,-18,-19,-20,-14,48,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,48,-118,48,-166,-12,-138,48,-30,-115,-117,-163,-165,-139,48,-157,-116,-164,-131,-158,-13,-157,48,48,48,48,-151,-114,-119,48,-146,-157,48,-157,-152,48,-153,]),'INTEGER':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,141,180,182,184,192,193,194,195,196,197,218,227,228,230,231,236,240,244,248,252,259,271,274,281,282,283,284,285,286,287,289,297,298,299,300,301,],[-157,49,-3,-2,-4,-5,-6,-7,-8,-9,-101,49,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,49,49,-99,-100,-102,-103,-104,-11,49,49,49,49,49,49,-21,-157,-81,49,49,49,49,49,49,49,49,49,49,49,-157,-157,49,49,-156,-98,-15,-16,-17,-18,-19,-20,-14,49,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,49,-118,49,-166,-12,212,-138,49,-30,-115,-117,-163,-165,-139,49,-157,-116,-164,267,-131,-158,-13,-157,49,49,49,49,-151,-114,-119,267,49,294,295,-146,-157,49,-157,-152,49,-153,]),'STRING':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,50,-3,-2,-4,-5,-6,-7,-8,-9,-101,50,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,50,50,-99,-100,-102,-103,-104,-11,50,50,50,50,50,50,-21,-157,-81,50,50,50,50,50,50,50,50,50,50,50,-157,-157,50,50,-156,-98,-15,-16,-17,-18,-19,-20,-14,50,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,50,-118,50,-166,-12,-138,50,-30,-115,-117,-163,-165,-139,50,-157,-116,-164,-131,-158,-13,-157,50,50,50,50,-151,-114,-119,50,-146,-157,50,-157,-152,50,-153,]),'CHAR':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,51,-3,-2,-4,-5,-6,-7,-8,-9,-101,51,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,51,51,-99,-100,-102,-103,-104,-11,51,51,51,51,51,51,-21,-157,-81,51,51,51,51,51,51,51,51,51,51,51,-157,-157,51,51,-156,-98,-15,-16,-17,-18,-19,-20,-14,51,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,51,-118,51,-166,-12,-138,51,-30,-115,-117,-163,-165,-139,51,-157,-116,-164,-131,-158,-13,-157,51,51,51,51,-151,-114,-119,51,-146,-157,51,-157,-152,51,-153,]),'BUILTIN_FUNCTION':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,180,182,184,192,193,194,195,196,197,218,227,228,231,236,240,244,248,252,259,271,274,281,282,284,287,289,297,298,299,300,301,],[-157,52,-3,-2,-4,-5,-6,-7,-8,-9,-101,52,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,52,52,-99,-100,-102,-103,-104,-11,52,52,52,52,52,52,-21,-157,-81,52,52,52,52,52,52,52,52,52,52,52,-157,-157,52,52,-156,-98,-15,-16,-17,-18,-19,-20,-14,52,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,52,-118,52,-166,-12,-138,52,-30,-115,-117,-163,-165,-139,52,-157,-116,-164,-131,-158,-13,-157,52,52,52,52,-151,-114,-119,52,-146,-157,52,-157,-152,52,-153,]),'TYPE_UNDEFINED':([0,2,3,4,5,6,7,8,9,10,12,16,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,52,53,56,57,58,59,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,77,78,85,86,87,88,91,92,94,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,125,126,127,129,136,139,180,182,184,192,193,194,195,196,197,207,211,218,225,227,228,231,235,236,240,242,243,244,248,252,253,255,256,259,271,274,278,281,282,284,287,289,297,298,299,300,301,],[-157,53,-3,-2,-4,-5,-6,-7,-8,-9,-101,53,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,53,53,-99,-100,-102,-103,-104,-11,53,53,53,53,53,53,-21,-157,-81,53,53,53,53,53,53,53,53,53,53,53,-157,-157,53,53,-156,-98,179,-15,-16,-17,-18,-19,-20,-14,53,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,53,-118,53,-166,-12,179,-138,53,-30,-115,-117,-163,-165,-139,53,179,179,-157,179,-116,-164,-131,179,-158,-13,179,179,-157,53,53,179,179,179,53,53,-151,179,-114,-119,53,-146,-157,53,-157,-152,53,-153,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,64,66,106,117,136,184,240,274,287,299,301,],[-157,0,-1,-3,-2,-4,-5,-6,-7,-8,-9,-21,-81,-14,-10,-12,-30,-13,-151,-146,-152,-153,]),'RCURLY':([3,4,5,6,7,8,9,10,12,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,64,65,66,86,89,91,92,95,96,97,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,124,127,128,129,132,133,134,136,180,181,184,192,194,195,196,199,201,203,205,206,214,215,218,228,231,232,234,236,237,238,240,244,248,260,261,262,271,274,281,282,283,287,289,292,293,297,298,299,300,301,],[-3,-2,-4,-5,-6,-7,-8,-9,-101,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,-21,-157,-81,-157,-157,-156,-98,180,-141,-143,-15,-16,-17,-18,-19,-20,-14,184,-105,-106,-107,-108,-109,-110,-111,-112,-113,-10,-135,194,196,-166,-157,-133,-157,-12,-138,-140,-30,-115,-163,-165,-139,231,-137,236,-162,-160,-142,-144,-157,-164,-131,-136,-132,-158,-161,-159,-13,-157,274,282,-121,-123,287,-151,-114,-119,-120,-146,-157,-122,-124,299,-157,-152,301,-153,]),'LCURLY':([12,14,30,45,46,137,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,186,198,209,210,216,239,241,257,269,270,272,275,277,279,290,291,296,],[55,65,86,89,90,-80,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,218,230,-40,-80,244,-41,-36,-29,-37,-38,-148,289,-28,-27,298,-26,-147,]),'LPAREN':([12,17,18,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,49,50,51,52,53,56,83,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,120,122,124,180,188,192,194,196,220,231,236,281,282,],[-101,77,78,85,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,87,88,-99,-100,-102,-103,-104,-11,123,-156,-98,-15,-16,-17,-18,-19,-20,-105,-106,-107,-108,-109,-110,-111,-112,-113,187,189,-135,-138,222,-115,-163,-139,252,-131,-158,-114,-119,]),'SEMICOLON':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,63,76,91,92,93,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,124,180,192,194,196,208,231,236,281,282,],[-101,66,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,106,117,-156,-98,136,-15,-16,-17,-18,-19,-20,-105,-106,-107,-108,-109,-110,-111,-112,-113,-135,-138,-115,-163,-139,240,-131,-158,-114,-119,]),'PLUS':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,67,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,67,67,-98,67,67,67,67,67,67,-105,-106,-107,-108,-109,67,67,67,67,67,67,-135,67,67,-138,-115,67,-163,67,-139,67,67,-131,-158,67,67,-119,67,]),'MINUS':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,68,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,68,68,-98,68,68,68,68,68,68,-105,-106,-107,-108,-109,68,68,68,68,68,68,-135,68,68,-138,-115,68,-163,68,-139,68,68,-131,-158,68,68,-119,68,]),'MULTIPLICATION':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,69,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,69,69,-98,69,69,69,69,69,69,69,69,-107,-108,-109,69,69,69,69,69,69,-135,69,69,-138,-115,69,-163,69,-139,69,69,-131,-158,69,69,-119,69,]),'DIVISION':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,70,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,70,70,-98,70,70,70,70,70,70,70,70,-107,-108,-109,70,70,70,70,70,70,-135,70,70,-138,-115,70,-163,70,-139,70,70,-131,-158,70,70,-119,70,]),'MODULE':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,71,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,71,71,-98,71,71,71,71,71,71,71,71,-107,-108,-109,71,71,71,71,71,71,-135,71,71,-138,-115,71,-163,71,-139,71,71,-131,-158,71,71,-119,71,]),'LT':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,72,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,72,72,-98,72,72,72,72,72,72,-105,-106,-107,-108,-109,None,None,None,None,72,72,-135,72,72,-138,-115,72,-163,72,-139,72,72,-131,-158,72,72,-119,72,]),'IS_EQUAL_TO':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,73,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,73,73,-98,73,73,73,73,73,73,-105,-106,-107,-108,-109,None,None,None,None,73,73,-135,73,73,-138,-115,73,-163,73,-139,73,73,-131,-158,73,73,-119,73,]),'IS_NOT_EQUAL':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,74,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,74,74,-98,74,74,74,74,74,74,-105,-106,-107,-108,-109,None,None,None,None,74,74,-135,74,74,-138,-115,74,-163,74,-139,74,74,-131,-158,74,74,-119,74,]),'GREATER_THAN':([12,15,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,124,130,131,180,192,193,194,195,196,215,229,231,236,276,281,282,293,],[-101,75,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,75,75,-98,75,75,75,75,75,75,-105,-106,-107,-108,-109,None,None,None,None,75,75,-135,75,75,-138,-115,75,-163,75,-139,75,75,-131,-158,75,75,-119,75,]),'RPAREN':([12,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,85,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,123,124,125,126,130,131,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,187,189,190,191,192,193,194,196,210,221,222,223,226,227,231,236,241,254,258,269,270,276,280,281,282,],[-101,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,-157,-156,-98,-15,-16,-17,-18,-19,-20,-105,-106,-107,-108,-109,-110,-111,-112,-113,185,186,-157,-135,192,-118,197,198,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-138,-157,-157,225,-25,-115,-117,-163,-139,-80,253,-157,255,-24,-116,-131,-158,-36,278,-23,-37,-38,290,-22,-114,-119,]),'COMMA':([12,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,91,92,96,97,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,124,135,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,192,193,194,195,196,200,204,210,214,215,226,231,236,241,245,246,247,261,262,265,267,268,269,270,280,281,282,292,293,294,],[-101,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,-156,-98,181,-143,-15,-16,-17,-18,-19,-20,-105,-106,-107,-108,-109,-110,-111,-112,-113,-135,206,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-138,-115,227,-163,228,-139,234,238,-80,-142,-144,258,-131,-158,-36,273,-149,-150,283,-123,285,-130,-134,-37,-38,-22,-114,-119,-122,-124,-129,]),'ELSE':([12,23,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,49,50,51,52,53,56,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,124,180,192,194,196,229,230,231,236,281,282,283,],[-101,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-102,-103,-104,-11,-156,-98,-15,-16,-17,-18,-19,-20,-105,-106,-107,-108,-109,-110,-111,-112,-113,-135,-138,-115,-163,-139,259,266,-131,-158,-114,-119,266,]),'EQUAL':([12,13,54,98,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,209,210,239,241,269,270,],[57,57,57,182,-80,57,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-145,-40,-80,-41,-36,-37,-38,]),'MINUS_EQUAL':([12,13,54,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,209,210,239,241,269,270,],[58,58,58,-80,58,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-40,-80,-41,-36,-37,-38,]),'MOD_EQUAL':([12,13,54,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,209,210,239,241,269,270,],[59,59,59,-80,59,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-40,-80,-41,-36,-37,-38,]),'MULT_EQUAL':([12,13,54,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,209,210,239,241,269,270,],[60,60,60,-80,60,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-40,-80,-41,-36,-37,-38,]),'PLUS_EQUAL':([12,13,54,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,209,210,239,241,269,270,],[61,61,61,-80,61,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-40,-80,-41,-36,-37,-38,]),'DIV_EQUAL':([12,13,54,137,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,209,210,239,241,269,270,],[62,62,62,-80,62,-42,-39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-40,-80,-41,-36,-37,-38,]),'COLON':([54,186,202,224,],[94,220,235,256,]),'BANG':([94,137,225,253,255,278,],[139,207,139,139,139,139,]),'LBRACE':([94,139,207,225,235,253,255,256,278,],[141,141,141,141,141,141,141,141,141,]),'TYPE_I32':([94,139,207,211,225,235,242,243,253,255,256,278,],[143,143,143,143,143,143,143,143,143,143,143,143,]),'TYPE_I8':([94,139,207,211,225,235,242,243,253,255,256,278,],[144,144,144,144,144,144,144,144,144,144,144,144,]),'TYPE_U8':([94,139,207,211,225,235,242,243,253,255,256,278,],[145,145,145,145,145,145,145,145,145,145,145,145,]),'TYPE_I16':([94,139,207,211,225,235,242,243,253,255,256,278,],[146,146,146,146,146,146,146,146,146,146,146,146,]),'TYPE_U16':([94,139,207,211,225,235,242,243,253,255,256,278,],[147,147,147,147,147,147,147,147,147,147,147,147,]),'TYPE_U32':([94,139,207,211,225,235,242,243,253,255,256,278,],[148,148,148,148,148,148,148,148,148,148,148,148,]),'TYPE_I64':([94,139,207,211,225,235,242,243,253,255,256,278,],[149,149,149,149,149,149,149,149,149,149,149,149,]),'TYPE_U64':([94,139,207,211,225,235,242,243,253,255,256,278,],[150,150,150,150,150,150,150,150,150,150,150,150,]),'TYPE_I128':([94,139,207,211,225,235,242,243,253,255,256,278,],[151,151,151,151,151,151,151,151,151,151,151,151,]),'TYPE_U128':([94,139,207,211,225,235,242,243,253,255,256,278,],[152,152,152,152,152,152,152,152,152,152,152,152,]),'TYPE_ISIZE':([94,139,207,211,225,235,242,243,253,255,256,278,],[153,153,153,153,153,153,153,153,153,153,153,153,]),'TYPE_USIZE':([94,139,207,211,225,235,242,243,253,255,256,278,],[154,154,154,154,154,154,154,154,154,154,154,154,]),'TYPE_C_SHORT':([94,139,207,211,225,235,242,243,253,255,256,278,],[155,155,155,155,155,155,155,155,155,155,155,155,]),'TYPE_C_USHORT':([94,139,207,211,225,235,242,243,253,255,256,278,],[156,156,156,156,156,156,156,156,156,156,156,156,]),'TYPE_C_INT':([94,139,207,211,225,235,242,243,253,255,256,278,],[157,157,157,157,157,157,157,157,157,157,157,157,]),'TYPE_C_UINT':([94,139,207,211,225,235,242,243,253,255,256,278,],[158,158,158,158,158,158,158,158,158,158,158,158,]),'TYPE_C_LONG':([94,139,207,211,225,235,242,243,253,255,256,278,],[159,159,159,159,159,159,159,159,159,159,159,159,]),'TYPE_C_ULONG':([94,139,207,211,225,235,242,243,253,255,256,278,],[160,160,160,160,160,160,160,160,160,160,160,160,]),'TYPE_C_LONGLONG':([94,139,207,211,225,235,242,243,253,255,256,278,],[161,161,161,161,161,161,161,161,161,161,161,161,]),'TYPE_C_ULONGLONG':([94,139,207,211,225,235,242,243,253,255,256,278,],[162,162,162,162,162,162,162,162,162,162,162,162,]),'TYPE_C_LONGDOUBLE':([94,139,207,211,225,235,242,243,253,255,256,278,],[163,163,163,163,163,163,163,163,163,163,163,163,]),'TYPE_F16':([94,139,207,211,225,235,242,243,253,255,256,278,],[164,164,164,164,164,164,164,164,164,164,164,164,]),'TYPE_F32':([94,139,207,211,225,235,242,243,253,255,256,278,],[165,165,165,165,165,165,165,165,165,165,165,165,]),'TYPE_F64':([94,139,207,211,225,235,242,243,253,255,256,278,],[166,166,166,166,166,166,166,166,166,166,166,166,]),'TYPE_F80':([94,139,207,211,225,235,242,243,253,255,256,278,],[167,167,167,167,167,167,167,167,167,167,167,167,]),'TYPE_F128':([94,139,207,211,225,235,242,243,253,255,256,278,],[168,168,168,168,168,168,168,168,168,168,168,168,]),'TYPE_BOOL':([94,139,207,211,225,235,242,243,253,255,256,278,],[169,169,169,169,169,169,169,169,169,169,169,169,]),'TYPE_ANYOPAQUE':([94,139,207,211,225,235,242,243,253,255,256,278,],[170,170,170,170,170,170,170,170,170,170,170,170,]),'TYPE_VOID':([94,139,207,211,225,235,242,243,253,255,256,278,],[171,171,171,171,171,171,171,171,171,171,171,171,]),'TYPE_NORETURN':([94,139,207,211,225,235,242,243,253,255,256,278,],[172,172,172,172,172,172,172,172,172,172,172,172,]),'TYPE_TYPE':([94,139,207,211,225,235,242,243,253,255,256,278,],[173,173,173,173,173,173,173,173,173,173,173,173,]),'TYPE_ANYERROR':([94,139,207,211,225,235,242,243,253,255,256,278,],[174,174,174,174,174,174,174,174,174,174,174,174,]),'TYPE_ANYTYPE':([94,139,207,211,225,235,242,243,253,255,256,278,],[175,175,175,175,175,175,175,175,175,175,175,175,]),'TYPE_COMPTIME_INT':([94,139,207,211,225,235,242,243,253,255,256,278,],[176,176,176,176,176,176,176,176,176,176,176,176,]),'TYPE_COMPTIME_FLOAT':([94,139,207,211,225,235,242,243,253,255,256,278,],[177,177,177,177,177,177,177,177,177,177,177,177,]),'TYPE_NULL':([94,139,207,211,225,235,242,243,253,255,256,278,],[178,178,178,178,178,178,178,178,178,178,178,178,]),'RBRACE':([141,212,213,],[211,242,243,]),'BAR':([185,186,245,246,247,249,250,251,288,],[217,219,272,-149,-150,275,-154,-155,296,]),'FAT_ARROW':([263,264,265,266,267,294,295,],[284,-125,-126,-127,-130,-129,-128,]),'ELLIPSIS':([267,],[286,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'stmts':([0,65,218,244,289,298,],[2,107,248,271,297,300,]),'empty':([0,65,85,86,89,123,132,134,187,189,218,222,244,289,298,],[3,3,126,129,133,191,201,205,191,191,3,191,3,3,3,]),'stmt':([2,107,248,271,297,300,],[4,4,4,4,4,4,]),'assignment_stmt':([2,107,248,271,297,300,],[5,5,5,5,5,5,]),'functiondecl_stmt':([2,107,199,203,248,271,297,300,],[6,6,232,237,6,6,6,6,]),'expression_stmt':([2,107,248,271,297,300,],[7,7,7,7,7,7,]),'return_stmt':([2,107,248,271,297,300,],[8,8,8,8,8,8,]),'for_stmt':([2,107,248,271,297,300,],[9,9,9,9,9,9,]),'while_stmt':([2,107,248,271,297,300,],[10,10,10,10,10,10,]),'vardecl':([2,107,248,271,297,300,],[11,11,11,11,11,11,]),'function_signature':([2,107,199,203,248,271,297,300,],[14,14,14,14,14,14,14,14,]),'expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[15,76,91,92,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,118,119,130,131,15,193,195,215,229,15,276,281,15,293,15,15,]),'vardecl_tail':([2,19,107,248,271,297,300,],[20,79,20,20,20,20,20,]),'postfix_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'field_access':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'function_call':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'primary_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'arithmetic_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'comparison_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'if_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'switch_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'struct_decl':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'enum_decl':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'anon_array':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'struct_instantiation':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'try_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'unary_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'assignment_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'value_expression':([2,16,47,48,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,77,78,87,88,107,125,127,182,197,248,252,259,271,284,297,300,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'assignment_stmt_tail':([12,13,54,138,],[56,63,93,208,]),'function_body':([14,],[64,]),'struct_initializer_pairs':([55,86,],[95,128,]),'struct_initializer_pair_list':([55,86,],[96,96,]),'struct_initializer_pair':([55,86,181,],[97,97,214,]),'struct_initializer_field_name':([55,86,181,],[98,98,98,]),'function_args':([85,],[125,]),'array_elems':([86,],[127,]),'struct_fields':([89,],[132,]),'enum_variants':([90,],[134,]),'error_union_typedecl':([94,225,253,255,278,],[138,257,277,279,291,]),'compound_typedecl':([94,139,207,225,235,253,255,256,278,],[140,209,239,140,268,140,140,280,140,]),'typedecl':([94,139,207,211,225,235,242,243,253,255,256,278,],[142,142,142,241,142,142,269,270,142,142,142,142,]),'function_param_list':([123,187,189,222,],[190,221,223,254,]),'struct_methods':([132,],[199,]),'struct_field':([132,],[200,]),'enum_methods':([134,],[203,]),'for_stmt_capture':([185,],[216,]),'function_param':([190,221,223,254,],[226,226,226,226,]),'for_stmt_capture_target':([217,273,],[245,288,]),'while_stmt_capture_target':([219,],[249,]),'switch_branches':([230,],[260,]),'switch_branch_list':([230,],[261,]),'switch_branch':([230,283,],[262,292,]),'switch_match_target':([230,283,],[263,263,]),'switch_range':([230,283,],[264,264,]),'switch_list':([230,283,],[265,265,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> stmts','program',1,'p_program','parser.py',97),
+  ('stmts -> stmts stmt','stmts',2,'p_stmts','parser.py',103),
+  ('stmts -> empty','stmts',1,'p_stmts','parser.py',104),
+  ('stmt -> assignment_stmt','stmt',1,'p_stmt','parser.py',114),
+  ('stmt -> functiondecl_stmt','stmt',1,'p_stmt','parser.py',115),
+  ('stmt -> expression_stmt','stmt',1,'p_stmt','parser.py',116),
+  ('stmt -> return_stmt','stmt',1,'p_stmt','parser.py',117),
+  ('stmt -> for_stmt','stmt',1,'p_stmt','parser.py',118),
+  ('stmt -> while_stmt','stmt',1,'p_stmt','parser.py',119),
+  ('return_stmt -> RETURN expression SEMICOLON','return_stmt',3,'p_return_stmt','parser.py',125),
+  ('assignment_expression -> IDENT assignment_stmt_tail','assignment_expression',2,'p_assignment_expression','parser.py',131),
+  ('assignment_stmt -> vardecl IDENT assignment_stmt_tail SEMICOLON','assignment_stmt',4,'p_assignment_stmt','parser.py',142),
+  ('assignment_stmt -> vardecl IDENT COLON error_union_typedecl assignment_stmt_tail SEMICOLON','assignment_stmt',6,'p_assignment_stmt','parser.py',143),
+  ('assignment_stmt -> UNDERSCORE assignment_stmt_tail SEMICOLON','assignment_stmt',3,'p_assignment_stmt','parser.py',144),
+  ('assignment_stmt_tail -> EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',154),
+  ('assignment_stmt_tail -> MINUS_EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',155),
+  ('assignment_stmt_tail -> MOD_EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',156),
+  ('assignment_stmt_tail -> MULT_EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',157),
+  ('assignment_stmt_tail -> PLUS_EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',158),
+  ('assignment_stmt_tail -> DIV_EQUAL expression','assignment_stmt_tail',2,'p_assignment_stmt_tail','parser.py',159),
+  ('functiondecl_stmt -> function_signature function_body','functiondecl_stmt',2,'p_functiondecl_stmt','parser.py',165),
+  ('function_param -> IDENT COLON compound_typedecl','function_param',3,'p_function_param','parser.py',176),
+  ('function_param_list -> function_param_list function_param COMMA','function_param_list',3,'p_function_param_list','parser.py',181),
+  ('function_param_list -> function_param_list function_param','function_param_list',2,'p_function_param_list','parser.py',182),
+  ('function_param_list -> empty','function_param_list',1,'p_function_param_list','parser.py',183),
+  ('function_signature -> PUB EXPORT FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl','function_signature',8,'p_function_signature','parser.py',193),
+  ('function_signature -> PUB FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl','function_signature',7,'p_function_signature','parser.py',194),
+  ('function_signature -> EXPORT FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl','function_signature',7,'p_function_signature','parser.py',195),
+  ('function_signature -> FUNCTION IDENT LPAREN function_param_list RPAREN error_union_typedecl','function_signature',6,'p_function_signature','parser.py',196),
+  ('function_body -> LCURLY stmts RCURLY','function_body',3,'p_function_body','parser.py',207),
+  ('vardecl -> EXPORT vardecl_tail','vardecl',2,'p_vardecl','parser.py',213),
+  ('vardecl -> vardecl_tail','vardecl',1,'p_vardecl','parser.py',214),
+  ('vardecl_tail -> VAR','vardecl_tail',1,'p_vardecl_tail','parser.py',219),
+  ('vardecl_tail -> CONST','vardecl_tail',1,'p_vardecl_tail','parser.py',220),
+  ('vardecl_tail -> COMPTIME','vardecl_tail',1,'p_vardecl_tail','parser.py',221),
+  ('compound_typedecl -> LBRACE RBRACE typedecl','compound_typedecl',3,'p_compound_typedecl','parser.py',226),
+  ('compound_typedecl -> LBRACE INTEGER RBRACE typedecl','compound_typedecl',4,'p_compound_typedecl','parser.py',227),
+  ('compound_typedecl -> LBRACE UNDERSCORE RBRACE typedecl','compound_typedecl',4,'p_compound_typedecl','parser.py',228),
+  ('compound_typedecl -> typedecl','compound_typedecl',1,'p_compound_typedecl','parser.py',229),
+  ('error_union_typedecl -> BANG compound_typedecl','error_union_typedecl',2,'p_error_union_typedecl','parser.py',234),
+  ('error_union_typedecl -> IDENT BANG compound_typedecl','error_union_typedecl',3,'p_error_union_typedecl','parser.py',235),
+  ('error_union_typedecl -> compound_typedecl','error_union_typedecl',1,'p_error_union_typedecl','parser.py',236),
+  ('typedecl -> TYPE_I32','typedecl',1,'p_typedecl','parser.py',241),
+  ('typedecl -> TYPE_I8','typedecl',1,'p_typedecl','parser.py',242),
+  ('typedecl -> TYPE_U8','typedecl',1,'p_typedecl','parser.py',243),
+  ('typedecl -> TYPE_I16','typedecl',1,'p_typedecl','parser.py',244),
+  ('typedecl -> TYPE_U16','typedecl',1,'p_typedecl','parser.py',245),
+  ('typedecl -> TYPE_U32','typedecl',1,'p_typedecl','parser.py',246),
+  ('typedecl -> TYPE_I64','typedecl',1,'p_typedecl','parser.py',247),
+  ('typedecl -> TYPE_U64','typedecl',1,'p_typedecl','parser.py',248),
+  ('typedecl -> TYPE_I128','typedecl',1,'p_typedecl','parser.py',249),
+  ('typedecl -> TYPE_U128','typedecl',1,'p_typedecl','parser.py',250),
+  ('typedecl -> TYPE_ISIZE','typedecl',1,'p_typedecl','parser.py',251),
+  ('typedecl -> TYPE_USIZE','typedecl',1,'p_typedecl','parser.py',252),
+  ('typedecl -> TYPE_C_SHORT','typedecl',1,'p_typedecl','parser.py',253),
+  ('typedecl -> TYPE_C_USHORT','typedecl',1,'p_typedecl','parser.py',254),
+  ('typedecl -> TYPE_C_INT','typedecl',1,'p_typedecl','parser.py',255),
+  ('typedecl -> TYPE_C_UINT','typedecl',1,'p_typedecl','parser.py',256),
+  ('typedecl -> TYPE_C_LONG','typedecl',1,'p_typedecl','parser.py',257),
+  ('typedecl -> TYPE_C_ULONG','typedecl',1,'p_typedecl','parser.py',258),
+  ('typedecl -> TYPE_C_LONGLONG','typedecl',1,'p_typedecl','parser.py',259),
+  ('typedecl -> TYPE_C_ULONGLONG','typedecl',1,'p_typedecl','parser.py',260),
+  ('typedecl -> TYPE_C_LONGDOUBLE','typedecl',1,'p_typedecl','parser.py',261),
+  ('typedecl -> TYPE_F16','typedecl',1,'p_typedecl','parser.py',262),
+  ('typedecl -> TYPE_F32','typedecl',1,'p_typedecl','parser.py',263),
+  ('typedecl -> TYPE_F64','typedecl',1,'p_typedecl','parser.py',264),
+  ('typedecl -> TYPE_F80','typedecl',1,'p_typedecl','parser.py',265),
+  ('typedecl -> TYPE_F128','typedecl',1,'p_typedecl','parser.py',266),
+  ('typedecl -> TYPE_BOOL','typedecl',1,'p_typedecl','parser.py',267),
+  ('typedecl -> TYPE_ANYOPAQUE','typedecl',1,'p_typedecl','parser.py',268),
+  ('typedecl -> TYPE_VOID','typedecl',1,'p_typedecl','parser.py',269),
+  ('typedecl -> TYPE_NORETURN','typedecl',1,'p_typedecl','parser.py',270),
+  ('typedecl -> TYPE_TYPE','typedecl',1,'p_typedecl','parser.py',271),
+  ('typedecl -> TYPE_ANYERROR','typedecl',1,'p_typedecl','parser.py',272),
+  ('typedecl -> TYPE_ANYTYPE','typedecl',1,'p_typedecl','parser.py',273),
+  ('typedecl -> TYPE_COMPTIME_INT','typedecl',1,'p_typedecl','parser.py',274),
+  ('typedecl -> TYPE_COMPTIME_FLOAT','typedecl',1,'p_typedecl','parser.py',275),
+  ('typedecl -> TYPE_NULL','typedecl',1,'p_typedecl','parser.py',276),
+  ('typedecl -> TYPE_UNDEFINED','typedecl',1,'p_typedecl','parser.py',277),
+  ('typedecl -> IDENT','typedecl',1,'p_typedecl','parser.py',278),
+  ('expression_stmt -> expression SEMICOLON','expression_stmt',2,'p_expression_stmt','parser.py',283),
+  ('expression -> postfix_expression','expression',1,'p_expression','parser.py',289),
+  ('postfix_expression -> field_access','postfix_expression',1,'p_postfix_expression','parser.py',295),
+  ('postfix_expression -> function_call','postfix_expression',1,'p_postfix_expression','parser.py',296),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser.py',297),
+  ('primary_expression -> arithmetic_expression','primary_expression',1,'p_primary_expresssion','parser.py',303),
+  ('primary_expression -> comparison_expression','primary_expression',1,'p_primary_expresssion','parser.py',304),
+  ('primary_expression -> if_expression','primary_expression',1,'p_primary_expresssion','parser.py',305),
+  ('primary_expression -> switch_expression','primary_expression',1,'p_primary_expresssion','parser.py',306),
+  ('primary_expression -> struct_decl','primary_expression',1,'p_primary_expresssion','parser.py',307),
+  ('primary_expression -> enum_decl','primary_expression',1,'p_primary_expresssion','parser.py',308),
+  ('primary_expression -> anon_array','primary_expression',1,'p_primary_expresssion','parser.py',309),
+  ('primary_expression -> struct_instantiation','primary_expression',1,'p_primary_expresssion','parser.py',310),
+  ('primary_expression -> try_expression','primary_expression',1,'p_primary_expresssion','parser.py',311),
+  ('primary_expression -> unary_expression','primary_expression',1,'p_primary_expresssion','parser.py',312),
+  ('primary_expression -> assignment_expression','primary_expression',1,'p_primary_expresssion','parser.py',313),
+  ('primary_expression -> value_expression','primary_expression',1,'p_primary_expresssion','parser.py',314),
+  ('unary_expression -> AMPERSAND expression','unary_expression',2,'p_unary_expression','parser.py',320),
+  ('value_expression -> INTEGER','value_expression',1,'p_value_expression','parser.py',330),
+  ('value_expression -> STRING','value_expression',1,'p_value_expression','parser.py',331),
+  ('value_expression -> IDENT','value_expression',1,'p_value_expression','parser.py',332),
+  ('value_expression -> CHAR','value_expression',1,'p_value_expression','parser.py',333),
+  ('value_expression -> BUILTIN_FUNCTION','value_expression',1,'p_value_expression','parser.py',334),
+  ('value_expression -> TYPE_UNDEFINED','value_expression',1,'p_value_expression','parser.py',335),
+  ('arithmetic_expression -> expression PLUS expression','arithmetic_expression',3,'p_arithmetic_expression','parser.py',351),
+  ('arithmetic_expression -> expression MINUS expression','arithmetic_expression',3,'p_arithmetic_expression','parser.py',352),
+  ('arithmetic_expression -> expression MULTIPLICATION expression','arithmetic_expression',3,'p_arithmetic_expression','parser.py',353),
+  ('arithmetic_expression -> expression DIVISION expression','arithmetic_expression',3,'p_arithmetic_expression','parser.py',354),
+  ('arithmetic_expression -> expression MODULE expression','arithmetic_expression',3,'p_arithmetic_expression','parser.py',355),
+  ('comparison_expression -> expression LT expression','comparison_expression',3,'p_comparison_expression','parser.py',402),
+  ('comparison_expression -> expression IS_EQUAL_TO expression','comparison_expression',3,'p_comparison_expression','parser.py',403),
+  ('comparison_expression -> expression IS_NOT_EQUAL expression','comparison_expression',3,'p_comparison_expression','parser.py',404),
+  ('comparison_expression -> expression GREATER_THAN expression','comparison_expression',3,'p_comparison_expression','parser.py',405),
+  ('if_expression -> IF LPAREN expression RPAREN expression ELSE expression','if_expression',7,'p_if_expression','parser.py',438),
+  ('function_call -> postfix_expression LPAREN function_args RPAREN','function_call',4,'p_function_call','parser.py',444),
+  ('function_args -> function_args expression COMMA','function_args',3,'p_function_args','parser.py',450),
+  ('function_args -> function_args expression','function_args',2,'p_function_args','parser.py',451),
+  ('function_args -> empty','function_args',1,'p_function_args','parser.py',452),
+  ('switch_expression -> SWITCH LPAREN expression RPAREN LCURLY switch_branches RCURLY','switch_expression',7,'p_switch_expression','parser.py',462),
+  ('switch_branches -> switch_branch_list COMMA','switch_branches',2,'p_switch_branches','parser.py',468),
+  ('switch_branches -> switch_branch_list','switch_branches',1,'p_switch_branches','parser.py',469),
+  ('switch_branch_list -> switch_branch_list COMMA switch_branch','switch_branch_list',3,'p_switch_branch_list','parser.py',475),
+  ('switch_branch_list -> switch_branch','switch_branch_list',1,'p_switch_branch_list','parser.py',476),
+  ('switch_branch -> switch_match_target FAT_ARROW expression','switch_branch',3,'p_switch_branch','parser.py',486),
+  ('switch_match_target -> switch_range','switch_match_target',1,'p_switch_match_target','parser.py',492),
+  ('switch_match_target -> switch_list','switch_match_target',1,'p_switch_match_target','parser.py',493),
+  ('switch_match_target -> ELSE','switch_match_target',1,'p_switch_match_target','parser.py',494),
+  ('switch_range -> INTEGER ELLIPSIS INTEGER','switch_range',3,'p_switch_range','parser.py',503),
+  ('switch_list -> switch_list COMMA INTEGER','switch_list',3,'p_switch_list','parser.py',509),
+  ('switch_list -> INTEGER','switch_list',1,'p_switch_list','parser.py',510),
+  ('struct_decl -> STRUCT LCURLY struct_fields struct_methods RCURLY','struct_decl',5,'p_struct_decl','parser.py',520),
+  ('struct_fields -> struct_fields struct_field COMMA','struct_fields',3,'p_struct_fields','parser.py',527),
+  ('struct_fields -> empty','struct_fields',1,'p_struct_fields','parser.py',528),
+  ('struct_field -> IDENT COLON compound_typedecl','struct_field',3,'p_struct_field','parser.py',538),
+  ('field_access -> postfix_expression DOT IDENT','field_access',3,'p_field_access','parser.py',544),
+  ('struct_methods -> struct_methods functiondecl_stmt','struct_methods',2,'p_struct_methods','parser.py',553),
+  ('struct_methods -> empty','struct_methods',1,'p_struct_methods','parser.py',554),
+  ('struct_instantiation -> IDENT LCURLY struct_initializer_pairs RCURLY','struct_instantiation',4,'p_struct_instantiation','parser.py',564),
+  ('struct_instantiation -> DOT LCURLY struct_initializer_pairs RCURLY','struct_instantiation',4,'p_struct_instantiation','parser.py',565),
+  ('struct_initializer_pairs -> struct_initializer_pair_list COMMA','struct_initializer_pairs',2,'p_struct_initializer_pairs','parser.py',575),
+  ('struct_initializer_pairs -> struct_initializer_pair_list','struct_initializer_pairs',1,'p_struct_initializer_pairs','parser.py',576),
+  ('struct_initializer_pair_list -> struct_initializer_pair_list COMMA struct_initializer_pair','struct_initializer_pair_list',3,'p_struct_initializer_pair_list','parser.py',582),
+  ('struct_initializer_pair_list -> struct_initializer_pair','struct_initializer_pair_list',1,'p_struct_initializer_pair_list','parser.py',583),
+  ('struct_initializer_pair -> struct_initializer_field_name EQUAL expression','struct_initializer_pair',3,'p_struct_initializer_pair','parser.py',593),
+  ('struct_initializer_field_name -> DOT IDENT','struct_initializer_field_name',2,'p_struct_initializer_field_name','parser.py',599),
+  ('for_stmt -> FOR LPAREN expression RPAREN for_stmt_capture LCURLY stmts RCURLY','for_stmt',8,'p_for_stmt','parser.py',605),
+  ('for_stmt_capture -> BAR for_stmt_capture_target COMMA for_stmt_capture_target BAR','for_stmt_capture',5,'p_for_stmt_capture','parser.py',615),
+  ('for_stmt_capture -> BAR for_stmt_capture_target BAR','for_stmt_capture',3,'p_for_stmt_capture','parser.py',616),
+  ('for_stmt_capture_target -> IDENT','for_stmt_capture_target',1,'p_for_stmt_capture_target','parser.py',625),
+  ('for_stmt_capture_target -> UNDERSCORE','for_stmt_capture_target',1,'p_for_stmt_capture_target','parser.py',626),
+  ('while_stmt -> WHILE LPAREN expression RPAREN LCURLY stmts RCURLY','while_stmt',7,'p_while_stmt','parser.py',632),
+  ('while_stmt -> WHILE LPAREN expression RPAREN BAR while_stmt_capture_target BAR LCURLY stmts RCURLY','while_stmt',10,'p_while_stmt','parser.py',633),
+  ('while_stmt -> WHILE LPAREN expression RPAREN COLON LPAREN expression RPAREN LCURLY stmts RCURLY','while_stmt',11,'p_while_stmt','parser.py',634),
+  ('while_stmt_capture_target -> IDENT','while_stmt_capture_target',1,'p_while_stmt_capture_target','parser.py',646),
+  ('while_stmt_capture_target -> UNDERSCORE','while_stmt_capture_target',1,'p_while_stmt_capture_target','parser.py',647),
+  ('try_expression -> TRY expression','try_expression',2,'p_try_expression','parser.py',653),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',658),
+  ('enum_decl -> ENUM LCURLY enum_variants enum_methods RCURLY','enum_decl',5,'p_enum_decl','parser.py',662),
+  ('enum_variants -> enum_variants IDENT COMMA','enum_variants',3,'p_enum_fields','parser.py',671),
+  ('enum_variants -> IDENT COMMA','enum_variants',2,'p_enum_fields','parser.py',672),
+  ('enum_methods -> enum_methods functiondecl_stmt','enum_methods',2,'p_enum_methods','parser.py',682),
+  ('enum_methods -> empty','enum_methods',1,'p_enum_methods','parser.py',683),
+  ('anon_array -> DOT LCURLY array_elems RCURLY','anon_array',4,'p_anon_array','parser.py',693),
+  ('array_elems -> array_elems expression COMMA','array_elems',3,'p_array_elems','parser.py',699),
+  ('array_elems -> array_elems expression','array_elems',2,'p_array_elems','parser.py',700),
+  ('array_elems -> empty','array_elems',1,'p_array_elems','parser.py',701),
+]
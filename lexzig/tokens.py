@@ -0,0 +1,134 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Union, overload
+
+from ply.lex import LexToken  # type: ignore
+
+from lexzig.lexer import Lexer
+
+# Token types by kind id, in the order of Lexer.tokens.
+KINDS: List[str] = list(Lexer.tokens)
+
+KIND_IDS: Dict[str, int] = {kind: i for i, kind in enumerate(KINDS)}
+
+INTEGER = KIND_IDS['INTEGER']
+BUILTIN_FUNCTION = KIND_IDS['BUILTIN_FUNCTION']
+
+
+class TokenStream:
+    """
+    The tokens of a source, stored as columns of integers instead of a
+    LexToken per token.
+
+    Every token takes a kind id, the offset where it starts, its length and
+    its line. Values are sliced from the source when a token is read, and
+    slicing a stream shares the columns of the original one.
+    """
+
+    def __init__(self, source: str, kinds: 'array[int]',
+                 starts: 'array[int]', lengths: 'array[int]',
+                 lines: 'array[int]', start: int = 0, stop: Optional[int] = None) -> None:
+        self.source = source
+        self.kinds = kinds
+        self.starts = starts
+        self.lengths = lengths
+        self.lines = lines
+        self.start = start
+        self.stop = len(kinds) if stop is None else stop
+
+    @classmethod
+    def lex(cls, source: str) -> 'TokenStream':
+        """
+        Lex the source straight into columns.
+        """
+        kinds = array('H')
+        starts = array('Q')
+        lengths = array('I')
+        lines = array('I')
+
+        lexer = Lexer()
+        lexer.input(source)
+        pylexer = lexer.lexer
+
+        while (token := pylexer.token()) is not None:
+            kinds.append(KIND_IDS[token.type])
+            starts.append(token.lexpos)
+            # PLY leaves lexpos at the end of the text the token matched.
+            lengths.append(pylexer.lexpos - token.lexpos)
+            lines.append(token.lineno)
+
+        return cls(source, kinds, starts, lengths, lines)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> LexToken: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'TokenStream': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[LexToken, 'TokenStream']:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError('Token streams can only be sliced with a step of 1')
+            return TokenStream(self.source, self.kinds, self.starts,
+                               self.lengths, self.lines,
+                               self.start + start,
+                               self.start + max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Token index out of range')
+        return self._token(self.start + index)
+
+    def __iter__(self) -> Iterator[LexToken]:
+        for i in range(self.start, self.stop):
+            yield self._token(i)
+
+    def kind(self, index: int) -> str:
+        """
+        Return the type of a token without building it.
+        """
+        return KINDS[self.kinds[self.start + index]]
+
+    def text(self, index: int) -> str:
+        """
+        Return the source text a token was lexed from.
+        """
+        start = self.starts[self.start + index]
+        return self.source[start:start + self.lengths[self.start + index]]
+
+    def columns(self) -> Dict[str, memoryview]:
+        """
+        Export the columns of the stream without copying them.
+        """
+        return {
+            'kinds': memoryview(self.kinds)[self.start:self.stop],
+            'starts': memoryview(self.starts)[self.start:self.stop],
+            'lengths': memoryview(self.lengths)[self.start:self.stop],
+            'lines': memoryview(self.lines)[self.start:self.stop],
+        }
+
+    def _token(self, i: int) -> LexToken:
+        kind = self.kinds[i]
+        start = self.starts[i]
+        text = self.source[start:start + self.lengths[i]]
+
+        token = LexToken()
+        token.type = KINDS[kind]
+        token.lineno = self.lines[i]
+        token.lexpos = start
+
+        # Do to the text what the token rules do when lexing it.
+        if kind == INTEGER:
+            token.value = int(text)
+        elif text.startswith('@"'):
+            token.value = text[2:-1]
+        elif kind == BUILTIN_FUNCTION:
+            token.value = text[1:]
+        else:
+            token.value = text
+
+        return token
@@ -0,0 +1,67 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from lexzig.lexer import LEXER_VERSION
+from lexzig.parser import GRAMMAR_VERSION
+
+
+def cache_key(code: str, media_type: str = 'application/json',
+              partial: bool = False) -> str:
+    """
+    Key results by the code, the format they are encoded in, whether it was
+    parsed partially and the version of the lexer and grammar that produced
+    them.
+    """
+    version = f'{LEXER_VERSION}:{GRAMMAR_VERSION}:{media_type}:'
+    if partial:
+        version += 'partial:'
+    return hashlib.sha256((version + code).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    A least recently used cache of encoded responses, bounded by the total
+    size of the responses it holds.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        body = self.entries.get(key)
+
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key))
+
+        self.entries[key] = body
+        self.size += len(body)
+
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,38 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from lexzig.document import Document
+
+
+class DocumentStore:
+    """
+    Keep the documents being edited, forgetting the least recently used ones
+    once there are more than max_documents.
+    """
+
+    def __init__(self, max_documents: int) -> None:
+        self.max_documents = max_documents
+        self.lock = threading.Lock()
+        self.documents: OrderedDict[
+            str, Tuple[Document, threading.Lock]] = OrderedDict()
+
+    def open(self, text: str) -> Tuple[str, Document, threading.Lock]:
+        document_id = uuid.uuid4().hex
+        document = Document(text)
+        document_lock = threading.Lock()
+
+        with self.lock:
+            self.documents[document_id] = (document, document_lock)
+            while len(self.documents) > self.max_documents:
+                self.documents.popitem(last=False)
+
+        return document_id, document, document_lock
+
+    def get(self, document_id: str) -> Optional[Tuple[Document, threading.Lock]]:
+        with self.lock:
+            entry = self.documents.get(document_id)
+            if entry is not None:
+                self.documents.move_to_end(document_id)
+            return entry
@@ -1,46 +1,392 @@
-from typing import Any
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header
 from pydantic import BaseModel
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from ply.lex import LexToken  # type: ignore
 
-from lexzig import run_analysis
-from lexzig.parser import ParserError
+import lexzig.ast as ast
+from lexzig import binary
+from lexzig.document import Document, TextEdit
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError
+from lexzig.serialize import to_json
+from lexzig.statements import StatementSplitter
+from lexzig_api import workers
+from lexzig_api.cache import ResultCache, cache_key
+from lexzig_api.documents import DocumentStore
+from lexzig_api.metrics import (BYTES_BUCKETS, CONTENT_TYPE, Counter, Gauge,
+                                Histogram, MetricsMiddleware, Registry)
 
+JSON = 'application/json'
+
+# Total size of the responses kept by the result cache.
+CACHE_BYTES = int(os.environ.get('LEXZIG_CACHE_BYTES', 64 * 1024 * 1024))
+
+# Number of documents kept open for incremental reparsing.
+MAX_DOCUMENTS = int(os.environ.get('LEXZIG_MAX_DOCUMENTS', 1024))
 
 app = FastAPI()
 
+cache = ResultCache(max_bytes=CACHE_BYTES)
+
+documents = DocumentStore(max_documents=MAX_DOCUMENTS)
+
+metrics = Registry()
+
+requests_total = metrics.register(Counter(
+    'lexzig_requests_total', 'Requests served.',
+    ('method', 'endpoint', 'status')))
+
+requests_in_flight = metrics.register(Gauge(
+    'lexzig_requests_in_flight', 'Requests being served.'))
+
+request_seconds = metrics.register(Histogram(
+    'lexzig_request_seconds', 'Time taken to serve requests.',
+    ('endpoint',)))
+
+input_bytes = metrics.register(Histogram(
+    'lexzig_input_bytes', 'Size of the code sent to be analysed.',
+    ('endpoint',), buckets=BYTES_BUCKETS))
+
+phase_seconds = metrics.register(Histogram(
+    'lexzig_phase_seconds', 'Time taken by each phase of analyses.',
+    ('phase',)))
+
+analyses_total = metrics.register(Counter(
+    'lexzig_analyses_total',
+    'Analyses run, by whether they succeeded or raised a ParserError.',
+    ('result',)))
+
+metrics.register(Counter(
+    'lexzig_cache_hits_total', 'Results answered from the result cache.',
+    function=lambda: cache.hits))
+
+metrics.register(Counter(
+    'lexzig_cache_misses_total', 'Results missing from the result cache.',
+    function=lambda: cache.misses))
+
+metrics.register(Gauge(
+    'lexzig_cache_hit_ratio', 'Share of results answered from the cache.',
+    function=lambda: cache.hits / max(cache.hits + cache.misses, 1)))
+
+metrics.register(Gauge(
+    'lexzig_cache_bytes', 'Size of the responses in the result cache.',
+    function=lambda: cache.size))
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins="*",
     allow_methods=["POST"]
 )
 
+app.add_middleware(
+    MetricsMiddleware,
+    requests=requests_total,
+    in_flight=requests_in_flight,
+    seconds=request_seconds,
+)
+
+
+@app.on_event("startup")
+def start_workers() -> None:
+    workers.start()
+
+
+@app.on_event("shutdown")
+def stop_workers() -> None:
+    workers.stop()
+
 
 class AnalysisRequest(BaseModel):
     code: str
+    # Only read by POST /, which then returns the partial AST of code with
+    # errors instead of failing.
+    partial: bool = False
+
+
+class BatchItem(BaseModel):
+    id: str
+    code: str
+
+
+class Edit(BaseModel):
+    start: int
+    end: int
+    text: str
+
+
+class EditRequest(BaseModel):
+    edits: List[Edit]
+
+
+def content_hash(code: str) -> str:
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+def encode(error: HTTPException) -> bytes:
+    # Analysis errors have always been sent as the exception's attributes.
+    return bytes(JSONResponse(jsonable_encoder(error)).body)
+
+
+def observe_phases(phases: workers.Phases) -> None:
+    for phase, seconds in phases.items():
+        phase_seconds.observe(seconds, phase)
+
+
+def json_response(content: Any) -> Response:
+    return Response(content=to_json(content), media_type=JSON)
+
+
+def accepts(accept: str, media_type: str) -> bool:
+    return media_type in (part.split(';')[0].strip()
+                          for part in accept.split(','))
 
 
 @app.post("/")
-async def analyse(request: AnalysisRequest) -> Any:
+async def analyse(request: AnalysisRequest,
+                  accept: str = Header('')) -> Response:
+    """
+    Analyse the code, answering from the result cache when the same code was
+    analysed before, whether it succeeded or not.
+
+    The tokens and AST are sent in the binary format of lexzig.binary when
+    the Accept header asks for it, without the diagnostics, which it has no
+    room for. Errors, and partial analyses, which come with their
+    diagnostics, are always sent as JSON.
+    """
+    media_type = JSON
+    if accepts(accept, binary.MEDIA_TYPE) and not request.partial:
+        media_type = binary.MEDIA_TYPE
+
+    input_bytes.observe(len(request.code.encode()), 'analyse')
+    key = cache_key(request.code, media_type, request.partial)
+
+    body = cache.get(key)
+    if body is None:
+        if media_type == JSON:
+            body = await analysis_result(workers.analyse_json, request.code,
+                                         request.partial)
+        else:
+            body = await analysis_result(workers.analyse_binary,
+                                         request.code)
+        cache.put(key, body)
+
+    if not body.startswith(binary.MAGIC):
+        media_type = JSON
+
+    return Response(content=body, media_type=media_type,
+                    headers={'Vary': 'Accept'})
+
+
+@app.get("/cache")
+def cache_stats() -> Dict[str, int]:
+    return cache.stats()
+
+
+@app.get("/metrics")
+def metrics_text() -> Response:
+    """
+    Report the metrics of the server in the Prometheus text format.
+    """
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+
+async def analysis_result(
+        analyse: Callable[..., Tuple[bytes, workers.Phases]],
+        *args: Any) -> bytes:
+    """
+    Run an analysis that encodes its result in the worker, and return the
+    body of the response.
+    """
     try:
-        result = run_analysis(request.code)
+        body, phases = await workers.run(analyse, *args)
     except ParserError as parser_error:
-        return HTTPException(
+        analyses_total.inc('parser_error')
+        return encode(HTTPException(
             status_code=400,
             detail=str(parser_error)
-        )
+        ))
 
-    if result is not None:
-        return {
-            'data': {
-                'tokens': list(map(str, result[0])),
-                'ast': result[1],
+    analyses_total.inc('success')
+    observe_phases(phases)
+    return body
+
+
+@app.post("/batch")
+async def analyse_batch(items: List[BatchItem]) -> Response:
+    """
+    Analyse many snippets at once. Identical snippets are only analysed once,
+    and a snippet that fails to parse does not fail the others.
+    """
+    for item in items:
+        input_bytes.observe(len(item.code.encode()), 'analyse_batch')
+    hashes = [content_hash(item.code) for item in items]
+
+    unique: Dict[str, str] = {}
+    for item, code_hash in zip(items, hashes):
+        unique.setdefault(code_hash, item.code)
+
+    outcomes = dict(zip(
+        unique.keys(),
+        await workers.run_chunked(workers.analyse_many, list(unique.values()))
+    ))
+
+    for outcome in outcomes.values():
+        if isinstance(outcome, ParserError):
+            analyses_total.inc('parser_error')
+        else:
+            analyses_total.inc('success')
+            observe_phases(outcome[3])
+
+    results = []
+    for item, code_hash in zip(items, hashes):
+        outcome = outcomes[code_hash]
+        if isinstance(outcome, ParserError):
+            results.append({
+                'id': item.id,
+                'error': {
+                    'detail': str(outcome),
+                    'lineno': outcome.lineno,
+                },
+            })
+        else:
+            results.append({
+                'id': item.id,
+                'data': {
+                    'tokens': outcome[0],
+                    'ast': outcome[1],
+                    'diagnostics': outcome[2],
+                },
+            })
+
+    with phase_seconds.time('serialize'):
+        body = to_json({'data': results})
+    return Response(content=body, media_type=JSON)
+
+
+def ndjson(record: Dict[str, Any]) -> str:
+    return json.dumps(jsonable_encoder(record)) + '\n'
+
+
+def stream_analysis(code: str) -> Iterator[str]:
+    """
+    Yield a record per token as it is lexed and a record per top-level
+    statement as soon as its last token is read, along with a record per
+    problem the lexer and the parser find.
+    """
+    lexer = Lexer(max_errors=workers.MAX_ERRORS)
+    lexer.input(code)
+    # Streams are consumed from a thread pool, so they cannot share a parser.
+    parser = Parser()
+    splitter = StatementSplitter()
+
+    reported = 0
+
+    def report() -> List[str]:
+        nonlocal reported
+        records = [ndjson({'diagnostic': diagnostic})
+                   for diagnostic in lexer.diagnostics[reported:]]
+        reported = len(lexer.diagnostics)
+        return records
+
+    def statements(tokens: List[LexToken]) -> Iterator[str]:
+        program = parser.parse_tokens(tokens, diagnostics=lexer.diagnostics)
+        yield from report()
+        if program is not None:
+            for stmt in program.stmts:
+                yield ndjson({'stmt': stmt})
+
+    try:
+        for token in lexer.lexer:
+            yield from report()
+            yield ndjson({'token': str(token)})
+
+            statement = splitter.feed(token)
+            if statement is not None:
+                yield from statements(statement)
+
+        yield from report()
+        rest = splitter.flush()
+        if rest:
+            yield from statements(rest)
+        analyses_total.inc('success')
+    except ParserError as parser_error:
+        analyses_total.inc('parser_error')
+        yield from report()
+        yield ndjson({
+            'error': {
+                'detail': str(parser_error),
+                'lineno': parser_error.lineno,
             }
+        })
+
+
+@app.post("/stream")
+def analyse_stream(request: AnalysisRequest) -> StreamingResponse:
+    """
+    Analyse the code and stream the results as newline-delimited JSON.
+    """
+    input_bytes.observe(len(request.code.encode()), 'analyse_stream')
+    return StreamingResponse(
+        stream_analysis(request.code),
+        media_type='application/x-ndjson'
+    )
+
+
+def document_result(document: Document) -> Dict[str, Any]:
+    error = document.error
+    if error is not None:
+        analyses_total.inc('parser_error')
+        return {
+            'error': {'detail': str(error), 'lineno': error.lineno},
+            'diagnostics': document.diagnostics,
         }
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail="Failed to analyse input"
-        )
+    analyses_total.inc('success')
+    return {
+        'data': {'ast': document.program, 'diagnostics': document.diagnostics}
+    }
+
+
+@app.post("/documents")
+def open_document(request: AnalysisRequest) -> Response:
+    """
+    Open a document to be reparsed incrementally as it is edited.
+    """
+    input_bytes.observe(len(request.code.encode()), 'open_document')
+    document_id, document, _ = documents.open(request.code)
+    return json_response({
+        'id': document_id,
+        **document_result(document),
+    })
+
+
+@app.post("/documents/{document_id}/edits")
+def edit_document(document_id: str, request: EditRequest) -> Response:
+    """
+    Apply edits to an open document, given as character offsets into its
+    text, and return the updated AST.
+    """
+    entry = documents.get(document_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown document")
+
+    document, lock = entry
+    with lock:
+        try:
+            document.apply([
+                TextEdit(edit.start, edit.end, edit.text)
+                for edit in request.edits
+            ])
+        except ValueError as value_error:
+            raise HTTPException(status_code=400, detail=str(value_error))
+        except ParserError:
+            pass
+
+        return json_response(document_result(document))
@@ -0,0 +1,246 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Optional,
+                    Sequence, Tuple, TypeVar)
+
+# The media type of the Prometheus text format. The response adds the
+# charset.
+CONTENT_TYPE = 'text/plain; version=0.0.4'
+
+# Latency buckets, in seconds, from half a millisecond to ten seconds.
+SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Size buckets, in bytes, from 64 bytes to 4 MiB.
+BYTES_BUCKETS = tuple(float(4 ** n) for n in range(3, 12))
+
+Labels = Tuple[str, ...]
+
+M = TypeVar('M', bound='Metric')
+
+
+class Metric(ABC):
+    """
+    A named series of values, one per combination of its labels.
+    """
+    kind = 'untyped'
+
+    def __init__(self, name: str, help: str,
+                 labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {_escape_help(self.help)}',
+                 f'# TYPE {self.name} {self.kind}']
+        for suffix, labels, value in self.samples():
+            lines.append(f'{self.name}{suffix}{labels} {_format(value)}')
+        return lines
+
+    @abstractmethod
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """
+        Yield the suffix, the formatted labels and the value of every sample.
+        """
+
+    def _format_labels(self, values: Labels,
+                       extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labels, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape_label(value)}"'
+                              for name, value in pairs) + '}'
+
+
+class Counter(Metric):
+    """
+    A value that only goes up. Without labels, it can be read from a
+    function instead, for counts that are kept somewhere else.
+    """
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None) -> None:
+        super().__init__(name, help, labels)
+        self.function = function
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        if self.function is not None:
+            return [('', '', self.function())]
+        with self.lock:
+            values = sorted(self.values.items())
+        return [('', self._format_labels(labels), value)
+                for labels, value in values]
+
+
+class Gauge(Counter):
+    """
+    A value that goes up and down.
+    """
+    kind = 'gauge'
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self.lock:
+            self.values[labels] = value
+
+
+class Histogram(Metric):
+    """
+    Count observations in buckets of the values they are lower than or
+    equal to, along with their sum.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = SECONDS_BUCKETS) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = sorted(buckets)
+        # Per combination of labels, the count of every bucket, followed by
+        # the count of values above the last one, and the sum.
+        self.values: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        bucket = bisect_left(self.buckets, value)
+        with self.lock:
+            entry = self.values.get(labels)
+            if entry is None:
+                entry = self.values[labels] = (
+                    [0] * (len(self.buckets) + 1), [0.0])
+            entry[0][bucket] += 1
+            entry[1][0] += value
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        with self.lock:
+            values = sorted((labels, (list(counts), total[0]))
+                            for labels, (counts, total) in self.values.items())
+
+        samples: List[Tuple[str, str, float]] = []
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + [float('inf')], counts):
+                cumulative += count
+                samples.append(('_bucket', self._format_labels(
+                    labels, ('le', _format(bound))), cumulative))
+            formatted = self._format_labels(labels)
+            samples.append(('_sum', formatted, total))
+            samples.append(('_count', formatted, cumulative))
+        return samples
+
+    def time(self, *labels: str) -> '_Timer':
+        """
+        Observe the time a with block takes.
+        """
+        return _Timer(self, labels)
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Labels) -> None:
+        self.histogram = histogram
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+
+
+class Registry:
+    """
+    The metrics of the process, rendered in the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: M) -> M:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines += metric.render()
+        return '\n'.join(lines) + '\n'
+
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class MetricsMiddleware:
+    """
+    Count requests by endpoint and status, time them until their response is
+    sent, and keep track of how many are being served.
+
+    Requests are labelled with the name of the endpoint that handles them
+    rather than their path, which would give a series per document id.
+    """
+
+    def __init__(self, app: Callable[[Dict[str, Any], Receive, Send],
+                                     Awaitable[None]],
+                 requests: Counter, in_flight: Gauge,
+                 seconds: Histogram) -> None:
+        self.app = app
+        self.requests = requests
+        self.in_flight = in_flight
+        self.seconds = seconds
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive,
+                       send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        self.in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            seconds = time.perf_counter() - start
+            self.in_flight.dec()
+
+            # The router leaves the endpoint it picked in the scope.
+            endpoint = getattr(scope.get('endpoint'), '__name__', 'unmatched')
+            self.requests.inc(scope['method'], endpoint, str(status))
+            self.seconds.observe(seconds, endpoint)
+
+
+def _format(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label(value: str) -> str:
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from ply.lex import LexToken  # type: ignore
+
+import lexzig.ast as ast
+from lexzig import binary, diagnostics
+from lexzig.diagnostics import Diagnostic
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError
+from lexzig.serialize import to_json
+
+T = TypeVar('T')
+
+# Seconds taken by each phase of an analysis, by the name of the phase.
+Phases = Dict[str, float]
+
+Analysis = Tuple[List[str], ast.Program, List[Diagnostic], Phases]
+
+# Number of worker processes used to run analyses. With 0, analyses run on
+# the event loop's default thread pool instead.
+WORKERS = int(os.environ.get('LEXZIG_WORKERS', os.cpu_count() or 1))
+
+# How many errors an analysis collects before it gives up on the code.
+MAX_ERRORS = int(os.environ.get('LEXZIG_MAX_ERRORS',
+                                diagnostics.MAX_ERRORS))
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+_local = threading.local()
+
+
+def thread_parser() -> Parser:
+    """
+    Return the parser of the calling thread. With WORKERS set to 0 analyses
+    run on a thread pool, where a parser shared by the whole process would
+    be used by many of them at once.
+    """
+    parser: Optional[Parser] = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = Parser()
+    return parser
+
+
+def warm_up() -> None:
+    """
+    Load the lexer and parser tables so the first request does not pay for it.
+    """
+    Lexer()
+    thread_parser().parse_tokens([])
+
+
+def timed_analysis(code: str, partial: bool = False
+                   ) -> Tuple[List[LexToken], ast.Program, List[Diagnostic],
+                              Phases]:
+    """
+    Lex and parse the code like lexzig.run_analysis, timing each phase so
+    that the server can report it. With partial, the code is parsed with
+    Parser.partial_parse_tokens instead.
+    """
+    start = time.perf_counter()
+    lexer = Lexer(max_errors=MAX_ERRORS)
+    tokens = lexer.lex(code)
+    lexed = time.perf_counter()
+    diagnostics = lexer.diagnostics
+    if partial:
+        program, diagnostics = thread_parser().partial_parse_tokens(
+            tokens, max_errors=MAX_ERRORS, diagnostics=diagnostics)
+    else:
+        program = thread_parser().parse_tokens(tokens,
+                                               diagnostics=diagnostics)
+        diagnostics.sort(key=lambda diagnostic: diagnostic.lexpos)
+    parsed = time.perf_counter()
+    return tokens, program, diagnostics, {
+        'lex': lexed - start, 'parse': parsed - lexed}
+
+
+def analyse_code(code: str, partial: bool = False) -> Analysis:
+    """
+    Run the analysis and turn the tokens into strings, since they keep a
+    reference to their lexer and cannot be sent back to the server process.
+    """
+    tokens, program, diagnostics, phases = timed_analysis(code, partial)
+    return list(map(str, tokens)), program, diagnostics, phases
+
+
+def analyse_json(code: str, partial: bool = False) -> Tuple[bytes, Phases]:
+    """
+    Run the analysis and encode it as the JSON response, so that the
+    program is not sent back to the server process to be encoded there.
+    """
+    tokens, program, diagnostics, phases = timed_analysis(code, partial)
+    start = time.perf_counter()
+    body = to_json({
+        'data': {
+            'tokens': list(map(str, tokens)),
+            'ast': program,
+            'diagnostics': diagnostics,
+        }
+    })
+    phases['serialize'] = time.perf_counter() - start
+    return body, phases
+
+
+def analyse_binary(code: str) -> Tuple[bytes, Phases]:
+    """
+    Run the analysis and encode it in the binary format, which has no room
+    for diagnostics, so they are left out.
+    """
+    tokens, program, _, phases = timed_analysis(code)
+    start = time.perf_counter()
+    body = binary.dumps(program, tokens)
+    phases['serialize'] = time.perf_counter() - start
+    return body, phases
+
+
+def analyse_many(codes: List[str]) -> List[Union[Analysis, ParserError]]:
+    """
+    Analyse several snippets, returning the error of the ones that fail
+    instead of raising it.
+    """
+    results: List[Union[Analysis, ParserError]] = []
+
+    for code in codes:
+        try:
+            results.append(analyse_code(code))
+        except ParserError as parser_error:
+            results.append(parser_error)
+
+    return results
+
+
+def start() -> None:
+    global _pool
+
+    if WORKERS > 0 and _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=WORKERS, initializer=warm_up)
+
+
+def stop() -> None:
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+async def run(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run func in a worker without blocking the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pool, func, *args)
+
+
+async def run_chunked(func: Callable[[List[T]], List[Any]],
+                      items: List[T]) -> List[Any]:
+    """
+    Split items in one chunk per worker, run func on every chunk and join
+    the results back in order.
+    """
+    size = max(1, -(-len(items) // max(WORKERS, 1)))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    results = await asyncio.gather(*(run(func, chunk) for chunk in chunks))
+    return [result for chunk in results for result in chunk]
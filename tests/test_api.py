@@ -0,0 +1,323 @@
+import json
+import unittest
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from lexzig import binary
+from lexzig.parser import Parser, ParserError
+from lexzig.serialize import to_json
+from lexzig_api import main, workers
+from lexzig_api.cache import ResultCache
+
+GOOD = 'const x = 1;'
+BAD = 'const y = 2;\nconst x = "a" + 1;'
+
+
+def records(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def samples(response):
+    values = {}
+    for line in response.text.splitlines():
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            values[name] = float(value)
+    return values
+
+
+class TestApi(unittest.TestCase):
+
+    def setUp(self):
+        # Run analyses in threads, which the tests can see into.
+        patcher = mock.patch.object(workers, 'WORKERS', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(main, 'cache',
+                                    ResultCache(main.CACHE_BYTES))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = TestClient(main.app)
+        self.client.__enter__()
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+    def cache_counts(self, stats=None):
+        if stats is None:
+            stats = self.client.get('/cache').json()
+        return {key: stats[key] for key in ('hits', 'misses', 'entries')}
+
+    def test_identical_analyses_are_answered_from_the_cache(self):
+        first = self.client.post('/', json={'code': GOOD})
+
+        with mock.patch.object(workers, 'analyse_json') as analyse_json:
+            second = self.client.post('/', json={'code': GOOD})
+
+        analyse_json.assert_not_called()
+        self.assertEqual(200, second.status_code)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual('x', second.json()['data']['ast']['stmts'][0]
+                         ['ident']['name'])
+
+    def test_errors_are_cached_and_replayed_unchanged(self):
+        first = self.client.post('/', json={'code': BAD})
+
+        with mock.patch.object(workers, 'analyse_json') as analyse_json:
+            second = self.client.post('/', json={'code': BAD})
+
+        analyse_json.assert_not_called()
+        self.assertEqual(first.status_code, second.status_code)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual({
+            'status_code': 400,
+            'detail': "Invalid types for binary operator '+', expected "
+                      "String and String, but got String and Integer",
+            'headers': None,
+        }, second.json())
+
+    def test_cache_counts_its_hits_and_misses(self):
+        self.assertEqual({'hits': 0, 'misses': 0, 'entries': 0},
+                         self.cache_counts())
+
+        self.client.post('/', json={'code': GOOD})
+        self.assertEqual({'hits': 0, 'misses': 1, 'entries': 1},
+                         self.cache_counts())
+
+        self.client.post('/', json={'code': GOOD})
+        self.client.post('/', json={'code': BAD})
+        self.client.post('/', json={'code': GOOD, 'partial': True})
+        stats = self.client.get('/cache').json()
+        self.assertEqual({'hits': 1, 'misses': 3, 'entries': 3},
+                         self.cache_counts(stats))
+        self.assertEqual(main.cache.size, stats['bytes'])
+        self.assertEqual(main.CACHE_BYTES, stats['max_bytes'])
+
+    def test_binary_analyses_hold_the_result_of_json_ones(self):
+        code = 'const x = 1;\nconst s = "a";'
+        response = self.client.post('/', json={'code': code}, headers={
+            'Accept': binary.MEDIA_TYPE})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(binary.MEDIA_TYPE, response.headers['content-type'])
+        self.assertIn('Accept', response.headers['vary'])
+        program, tokens = binary.loads(response.content)
+        data = self.client.post('/', json={'code': code}).json()['data']
+        self.assertEqual(data['ast'], json.loads(to_json(program)))
+        self.assertEqual(data['tokens'], list(map(str, tokens)))
+
+    def test_binary_analyses_send_errors_as_json(self):
+        response = self.client.post('/', json={'code': BAD}, headers={
+            'Accept': binary.MEDIA_TYPE})
+
+        self.assertEqual('application/json', response.headers['content-type'])
+        self.assertEqual(self.client.post('/', json={'code': BAD}).json(),
+                         response.json())
+
+    def test_metrics_follow_the_analyses(self):
+        before = samples(self.client.get('/metrics'))
+        self.client.post('/', json={'code': GOOD})
+        self.client.post('/', json={'code': GOOD})
+        self.client.post('/', json={'code': BAD})
+        response = self.client.get('/metrics')
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.headers['content-type'].startswith(
+            'text/plain; version=0.0.4'))
+        after = samples(response)
+
+        def added(name):
+            return after[name] - before.get(name, 0)
+
+        self.assertEqual(3, added('lexzig_requests_total{method="POST",'
+                                  'endpoint="analyse",status="200"}'))
+        self.assertEqual(1, added('lexzig_requests_total{method="GET",'
+                                  'endpoint="metrics_text",status="200"}'))
+        # Only the request for the metrics is being served.
+        self.assertEqual(1, after['lexzig_requests_in_flight'])
+        for phase in ('lex', 'parse', 'serialize'):
+            self.assertEqual(
+                1, added(f'lexzig_phase_seconds_count{{phase="{phase}"}}'),
+                phase)
+            self.assertGreater(
+                added(f'lexzig_phase_seconds_sum{{phase="{phase}"}}'), 0,
+                phase)
+        self.assertEqual(
+            1, added('lexzig_analyses_total{result="success"}'))
+        self.assertEqual(
+            1, added('lexzig_analyses_total{result="parser_error"}'))
+        self.assertEqual(1, after['lexzig_cache_hits_total'])
+        self.assertEqual(2, after['lexzig_cache_misses_total'])
+        self.assertEqual(1 / 3, after['lexzig_cache_hit_ratio'])
+
+    def test_partial_analyses_return_every_diagnostic(self):
+        response = self.client.post('/', json={
+            'code': 'const x = 1 +;\nconst y = 2;\nconst z = "a" + 1;',
+            'partial': True})
+
+        self.assertEqual(200, response.status_code)
+        data = response.json()['data']
+        self.assertEqual(['y'], [stmt['ident']['name']
+                                 for stmt in data['ast']['stmts']])
+        self.assertEqual([
+            {'message': 'Error while parsing at token: SEMICOLON',
+             'lineno': 1, 'lexpos': 13, 'length': 1},
+            {'message': "Invalid types for binary operator '+', expected "
+                        "String and String, but got String and Integer",
+             'lineno': 3, 'lexpos': 28, 'length': 18},
+        ], data['diagnostics'])
+        self.assertEqual(18, len(data['tokens']))
+
+    def test_partial_analyses_stop_after_too_many_errors(self):
+        with mock.patch.object(workers, 'MAX_ERRORS', 2):
+            response = self.client.post('/', json={
+                'code': 'x +;\n' * 3, 'partial': True})
+
+        self.assertEqual({
+            'status_code': 400,
+            'detail': 'Too many errors, stopped after 2',
+            'headers': None,
+        }, response.json())
+
+    def test_batch_analyses_each_snippet_once(self):
+        items = [{'id': str(i), 'code': code}
+                 for i, code in enumerate([GOOD, BAD, GOOD, BAD, GOOD])]
+
+        with mock.patch.object(workers, 'analyse_many',
+                               wraps=workers.analyse_many) as analyse_many:
+            response = self.client.post('/batch', json=items)
+
+        self.assertEqual(200, response.status_code)
+        analysed = [code for call in analyse_many.call_args_list
+                    for code in call.args[0]]
+        self.assertEqual([GOOD, BAD], analysed)
+        self.assertEqual(['0', '1', '2', '3', '4'],
+                         [result['id'] for result in response.json()['data']])
+
+    def test_batch_keeps_failures_to_their_own_items(self):
+        response = self.client.post('/batch', json=[
+            {'id': 'good', 'code': GOOD},
+            {'id': 'bad', 'code': BAD},
+            {'id': 'also good', 'code': 'const y = 2;'},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        good, bad, also_good = response.json()['data']
+        self.assertEqual(self.client.post('/', json={'code': GOOD}).json(),
+                         {'data': good['data']})
+        with self.assertRaises(ParserError) as raised:
+            workers.analyse_code(BAD)
+        self.assertEqual({
+            'id': 'bad',
+            'error': {
+                'detail': "Invalid types for binary operator '+', expected "
+                          "String and String, but got String and Integer",
+                'lineno': raised.exception.lineno,
+            },
+        }, bad)
+        self.assertEqual('also good', also_good['id'])
+        self.assertEqual(
+            'y', also_good['data']['ast']['stmts'][0]['ident']['name'])
+
+    def test_batch_of_nothing_returns_nothing(self):
+        response = self.client.post('/batch', json=[])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'data': []}, response.json())
+
+    def test_batch_results_follow_the_order_of_the_items(self):
+        codes = [f'const x{i} = {i};' for i in range(10)]
+        items = [{'id': f'item {i}', 'code': code}
+                 for i, code in reversed(list(enumerate(codes)))]
+
+        with mock.patch.object(workers, 'WORKERS', 3):
+            results = self.client.post('/batch', json=items).json()['data']
+
+        self.assertEqual([item['id'] for item in items],
+                         [result['id'] for result in results])
+        self.assertEqual(
+            [f'x{i}' for i in reversed(range(10))],
+            [result['data']['ast']['stmts'][0]['ident']['name']
+             for result in results])
+
+    def test_stream_sends_each_statement_after_its_tokens(self):
+        response = self.client.post('/stream', json={
+            'code': 'const x = 1;\nconst y = #2;\n'})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/x-ndjson',
+                         response.headers['content-type'])
+        stream = records(response)
+        self.assertEqual([
+            'token', 'token', 'token', 'token', 'token', 'stmt',
+            'token', 'token', 'token', 'diagnostic', 'token', 'token', 'stmt',
+        ], [next(iter(record)) for record in stream])
+        self.assertEqual("LexToken(CONST,'const',1,0)", stream[0]['token'])
+        self.assertEqual('x', stream[5]['stmt']['ident']['name'])
+        self.assertEqual({'message': "Illegal character '#'", 'lineno': 2,
+                          'lexpos': 23, 'length': 1}, stream[9]['diagnostic'])
+        self.assertEqual('y', stream[12]['stmt']['ident']['name'])
+
+    def test_stream_sends_tokens_before_their_statement_ends(self):
+        stream = main.stream_analysis(
+            'const x = .{' + '1, ' * 100000 + '};')
+
+        with mock.patch.object(Parser, 'parse_tokens') as parse_tokens:
+            first = [json.loads(next(stream)) for _ in range(10)]
+
+        parse_tokens.assert_not_called()
+        self.assertEqual({'token': "LexToken(CONST,'const',1,0)"}, first[0])
+        self.assertEqual(['token'] * 10,
+                         [next(iter(record)) for record in first])
+        stream.close()
+
+    def test_stream_ends_with_the_error_that_stopped_it(self):
+        with mock.patch.object(workers, 'MAX_ERRORS', 2):
+            response = self.client.post('/stream', json={
+                'code': 'const x = 1;\nconst y = # $ @;\n'})
+
+        self.assertEqual(200, response.status_code)
+        stream = records(response)
+        self.assertEqual('x', stream[5]['stmt']['ident']['name'])
+        self.assertEqual([
+            "Illegal character '#'", "Illegal character '$'",
+        ], [record['diagnostic']['message']
+            for record in stream if 'diagnostic' in record])
+        self.assertEqual({
+            'error': {'detail': 'Too many errors, stopped after 2',
+                      'lineno': 2},
+        }, stream[-1])
+
+    def test_documents_are_reparsed_as_they_are_edited(self):
+        opened = self.client.post('/documents', json={
+            'code': 'const x = 1;\nconst y = 2;'}).json()
+
+        response = self.client.post(f'/documents/{opened["id"]}/edits', json={
+            'edits': [{'start': 10, 'end': 11, 'text': '3'}]})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            self.client.post('/', json={
+                'code': 'const x = 3;\nconst y = 2;'}).json()['data']['ast'],
+            response.json()['data']['ast'])
+
+    def test_edits_to_unknown_documents_are_not_found(self):
+        response = self.client.post('/documents/unknown/edits', json={
+            'edits': [{'start': 0, 'end': 0, 'text': 'const x = 1;'}]})
+
+        self.assertEqual(404, response.status_code)
+        self.assertEqual({'detail': 'Unknown document'}, response.json())
+
+    def test_edits_out_of_the_document_are_rejected(self):
+        code = 'const x = 1;'
+        opened = self.client.post('/documents', json={'code': code}).json()
+
+        response = self.client.post(f'/documents/{opened["id"]}/edits', json={
+            'edits': [{'start': 10, 'end': 100, 'text': '3'}]})
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual({'detail': 'Invalid range 10:100'}, response.json())
+        unchanged = self.client.post(f'/documents/{opened["id"]}/edits',
+                                     json={'edits': []})
+        self.assertEqual(opened['data'], unchanged.json()['data'])
@@ -0,0 +1,39 @@
+import dataclasses
+import unittest
+
+from lexzig.ast import Identifier, Integer, SwitchElse, WhileStmt
+
+
+class TestAst(unittest.TestCase):
+
+    def test_nodes_keep_their_fields_in_slots(self):
+        node = WhileStmt(Identifier('x'), [], capture=Identifier('i'))
+
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertEqual(Identifier('i'), node.capture)
+        self.assertIsNone(node.post_action)
+
+    def test_node_type_is_a_class_constant(self):
+        self.assertEqual('identifier', Identifier.type)
+        self.assertEqual('integer', Integer(1).type)
+        self.assertNotIn('type', Integer.__slots__)
+
+    def test_node_type_can_be_given_to_the_constructor(self):
+        self.assertEqual(Integer(1), Integer(1, 'integer'))
+        self.assertEqual(WhileStmt(Identifier('x'), []),
+                         WhileStmt(Identifier('x'), [], type='while_stmt'))
+
+        with self.assertRaises(ValueError):
+            Integer(1, 'identifier')
+
+    def test_node_type_is_listed_after_the_fields(self):
+        self.assertEqual({'n': 1, 'type': 'integer'},
+                         dataclasses.asdict(Integer(1)))
+        self.assertEqual({}, dataclasses.asdict(SwitchElse()))
+        self.assertEqual("Identifier(name='x', type='identifier')",
+                         repr(Identifier('x')))
+
+    def test_nodes_are_compared_by_value(self):
+        self.assertEqual(Identifier('x'), Identifier('x'))
+        self.assertNotEqual(Identifier('x'), Identifier('y'))
+        self.assertNotEqual(Integer(1), Identifier(1))
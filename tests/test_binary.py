@@ -0,0 +1,107 @@
+import os
+import sys
+import unittest
+
+import lexzig.ast as ast
+from lexzig import run_analysis
+from lexzig.binary import NODES, BinaryFormatError, dumps, loads
+from lexzig.parser import ParserError
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+
+def fields(tokens):
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in tokens]
+
+
+def every_node():
+    x = ast.Identifier('x')
+    one = ast.Integer(1)
+    method = ast.FunctionDeclStmt(x, [x], [ast.ReturnStmt(one)])
+    return ast.Program([
+        ast.Stmt(),
+        ast.Expr(),
+        ast.AssignmentStmt(x, ast.String('"ñ日"')),
+        ast.AssignmentStmt(x, ast.Char("'c'")),
+        ast.AssignmentStmt(x, ast.BinOp(x, '+', ast.Integer(-300))),
+        ast.AssignmentStmt(x, ast.UnaryOp('&', x)),
+        ast.AssignmentStmt(x, ast.IfExpr(x, one, x)),
+        ast.AssignmentStmt(x, ast.SwitchExpr(x, [
+            ast.SwitchBranch(ast.SwitchRange(1, 2 ** 70), one),
+            ast.SwitchBranch(ast.SwitchList([one, ast.Integer(2)]), one),
+            ast.SwitchBranch(ast.SwitchElse(), x),
+        ])),
+        ast.FunctionCall(ast.FieldAccess(x, x), [x, one]),
+        method,
+        ast.AssignmentStmt(x, ast.EnumDeclaration([x], [method])),
+        ast.AssignmentStmt(x, ast.StructDeclaration([x], [method])),
+        ast.AssignmentStmt(x, ast.StructInstantiation(
+            x, [ast.StructInitializerPair('y', one)])),
+        ast.ForStmt(x, ast.ForStmtCapture(x, None), []),
+        ast.ForStmt(x, ast.ForStmtCapture(x, x), [x]),
+        ast.AssignmentStmt(x, ast.TryExpr(x)),
+        ast.WhileStmt(x, [], ast.AssignmentExpr(x, '+=', one), x),
+        ast.WhileStmt(x, []),
+        ast.AssignmentStmt(x, ast.AnonArray([one, x])),
+    ])
+
+
+def node_types(value):
+    if isinstance(value, list):
+        return set().union(*map(node_types, value))
+    if hasattr(value, '__dataclass_fields__'):
+        return {type(value)}.union(*(node_types(getattr(value, name))
+                                     for name in value.__dataclass_fields__))
+    return set()
+
+
+class TestBinary(unittest.TestCase):
+
+    def test_every_node_round_trips(self):
+        program = every_node()
+        self.assertEqual(set(NODES), node_types(program))
+
+        self.assertEqual((program, []), loads(dumps(program)))
+
+    def test_examples_round_trip_with_their_tokens(self):
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                try:
+                    tokens, program = run_analysis(f.read())
+                except ParserError:
+                    continue
+
+            loaded, loaded_tokens = loads(dumps(program, tokens))
+
+            self.assertEqual(program, loaded)
+            self.assertEqual(fields(tokens), fields(loaded_tokens))
+
+    def test_strings_are_stored_once(self):
+        one = dumps(ast.Program([ast.Identifier('long_identifier')]))
+        many = dumps(ast.Program([ast.Identifier('long_identifier')] * 10))
+
+        self.assertEqual(one.count(b'long_identifier'),
+                         many.count(b'long_identifier'))
+
+    def test_other_data_is_rejected(self):
+        data = dumps(every_node())
+
+        for other in [b'{}', data[:3] + b'\x00' + data[4:], data[:-1],
+                      data + b'\x00']:
+            with self.assertRaises(BinaryFormatError):
+                loads(other)
+
+    def test_data_nested_too_deeply_is_rejected(self):
+        expr = ast.Integer(1)
+        for _ in range(sys.getrecursionlimit()):
+            expr = ast.UnaryOp('-', expr)
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(limit * 10)
+        try:
+            data = dumps(ast.Program([expr]))
+        finally:
+            sys.setrecursionlimit(limit)
+
+        with self.assertRaises(BinaryFormatError):
+            loads(data)
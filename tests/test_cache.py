@@ -0,0 +1,48 @@
+import unittest
+
+from lexzig_api.cache import ResultCache, cache_key
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_cache_counts_hits_and_misses(self):
+        cache = ResultCache(max_bytes=100)
+        cache.put('a', b'result')
+
+        self.assertEqual(b'result', cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((1, 1), (cache.stats()['hits'],
+                                  cache.stats()['misses']))
+
+    def test_cache_evicts_least_recently_used_entries(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put('a', b'aaaa')
+        cache.put('b', b'bbbb')
+        cache.get('a')
+
+        cache.put('c', b'cccc')
+
+        self.assertEqual(b'aaaa', cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(b'cccc', cache.get('c'))
+        self.assertEqual(8, cache.stats()['bytes'])
+
+    def test_cache_skips_entries_larger_than_itself(self):
+        cache = ResultCache(max_bytes=4)
+        cache.put('a', b'aaaaa')
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.stats()['bytes'])
+
+    def test_cache_replaces_entries_with_the_same_key(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put('a', b'aaaa')
+        cache.put('a', b'aa')
+
+        self.assertEqual(b'aa', cache.get('a'))
+        self.assertEqual(2, cache.stats()['bytes'])
+
+    def test_cache_keys_depend_on_the_code(self):
+        self.assertEqual(cache_key('const x = 1;'), cache_key('const x = 1;'))
+        self.assertNotEqual(cache_key('const x = 1;'),
+                            cache_key('const x = 2;'))
@@ -0,0 +1,135 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pprint import pformat
+
+import LexZig
+from lexzig.parser import Parser
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+CLI = os.path.join(ROOT, 'LexZig.py')
+
+
+def python(code, **env):
+    """
+    Run code in a fresh interpreter with its output piped, returning what it
+    printed to stdout and stderr.
+    """
+    environ = {key: value for key, value in os.environ.items()
+               if key != 'FORCE_COLOR'}
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                            env={**environ, **env}, stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, check=True)
+    return result.stdout, result.stderr
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_package_import_is_lazy(self):
+        loaded, _ = python('import sys, lexzig; print(sorted(sys.modules))')
+
+        self.assertNotIn("'lexzig.parser'", loaded)
+        self.assertNotIn("'ply.yacc'", loaded)
+
+    def test_package_exports_are_loaded_on_use(self):
+        output, _ = python('import lexzig; print(lexzig.Parser.__module__, '
+                           'lexzig.Lexer.__module__, lexzig.ast.__name__)')
+
+        self.assertEqual('lexzig.parser lexzig.lexer lexzig.ast\n', output)
+
+    def test_piped_runs_skip_rich_and_the_tables(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'small.zig')
+            with open(filename, 'w') as f:
+                f.write('const x = 1;\n')
+
+            output, loaded = python(
+                'import runpy, sys; '
+                f'sys.argv = ["LexZig.py", "--no-cache", {filename!r}]; '
+                f'runpy.run_path({CLI!r}, run_name="__main__"); '
+                'print(sorted(sys.modules), file=sys.stderr)',
+                COLUMNS='30')
+
+        self.assertEqual(
+            pformat(Parser().parse('const x = 1;'), width=30) + '\n', output)
+        for module in ('rich', 'readline', 'concurrent.futures',
+                       'lexzig.tables.parsetab'):
+            self.assertNotIn(f"'{module}", loaded)
+
+    def test_force_color_prints_with_rich(self):
+        code = 'import sys, LexZig; print(LexZig.uses_rich(sys.stdout))'
+
+        self.assertEqual(('False\n', ''), python(code))
+        self.assertEqual(('True\n', ''), python(code, FORCE_COLOR='1'))
+
+
+class TestAnalyzeFiles(unittest.TestCase):
+
+    def analyze(self, files, jobs):
+        return [(result.program, str(result.error), result.output,
+                 result.rendered)
+                for result in LexZig.analyze_files(files, jobs, None,
+                                                   (80, None, False))]
+
+    def test_jobs_give_the_results_of_a_serial_run_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = []
+            for i, code in enumerate(['const x = 1;', 'const y = ;',
+                                      None, 'const z = #3;'] * 3):
+                filename = os.path.join(directory, f'{i}.zig')
+                if code is not None:
+                    with open(filename, 'w') as f:
+                        f.write(code)
+                files.append(filename)
+
+            serial = self.analyze(files, 1)
+            parallel = self.analyze(files, 3)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(
+            [f'Cannot read {filename}: No such file or directory'
+             if i % 4 == 2 else 'None' for i, filename in enumerate(files)],
+            [error for _, error, _, _ in parallel])
+        self.assertEqual(['', 'Error while parsing at token: SEMICOLON\n',
+                          '', "Illegal character '#'\n"] * 3,
+                         [output for _, _, output, _ in parallel])
+
+    def test_files_with_too_many_errors_do_not_stop_the_others(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = []
+            for i, code in enumerate(['é ' * 150, 'const x = 1;']):
+                filename = os.path.join(directory, f'{i}.zig')
+                with open(filename, 'w') as f:
+                    f.write(code)
+                files.append(filename)
+
+            results = self.analyze(files, 1)
+
+        self.assertEqual(
+            ['Too many errors, stopped after 100', 'None'],
+            [error for _, error, _, _ in results])
+        self.assertIsNotNone(results[1][0])
+
+    def test_cache_that_cannot_be_written_does_not_change_the_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = []
+            for i, code in enumerate(['const x = 1;', 'const s = "a" + 1;']):
+                filename = os.path.join(directory, f'{i}.zig')
+                with open(filename, 'w') as f:
+                    f.write(code)
+                files.append(filename)
+            # A directory under a file cannot be created, even by root.
+            cache = LexZig.ParseCache(os.path.join(files[0], 'cache'))
+
+            results = [LexZig.analyze_file(filename, cache, (80, None, False))
+                       for filename in files]
+            expected = self.analyze(files, 1)
+
+        self.assertEqual(expected, [
+            (result.program, str(result.error), result.output,
+             result.rendered) for result in results])
+        self.assertTrue(str(results[1].error).startswith(
+            "Invalid types for binary operator '+'"))
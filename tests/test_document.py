@@ -0,0 +1,117 @@
+import contextlib
+import io
+import os
+import random
+import unittest
+
+from lexzig.ast import Program, AssignmentStmt, Identifier, Integer
+from lexzig.document import Document, TextEdit
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+SNIPPETS = [
+    '', ';', '}', '{', '(', ')', 'x', ' 1 ', '\n', '&1', 'const y = 2;',
+    'fn f() void {}', '// comment\n', '"str"', ' + ', ' == ', 'while',
+]
+
+
+class TestDocument(unittest.TestCase):
+    parser = Parser()
+
+    def outcome(self, parse):
+        # Syntax errors are reported on stdout while recovering from them.
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                return parse()
+            except ParserError as parser_error:
+                return str(parser_error), parser_error.lineno
+
+    def test_document_parses_its_text(self):
+        document = Document('const x = 1;')
+
+        self.assertEqual(Program(stmts=[
+            AssignmentStmt(Identifier('x'), Integer(1))
+        ]), document.program)
+
+    def test_document_reuses_statements_around_an_edit(self):
+        text = 'const x = 1;\nconst y = 2;\nconst z = 3;\n'
+        document = Document(text)
+        first, _, last = document.program.stmts
+
+        program = document.edit(text.index('2'), text.index('2') + 1, '42')
+
+        self.assertEqual(AssignmentStmt(Identifier('y'), Integer(42)),
+                         program.stmts[1])
+        self.assertIs(first, program.stmts[0])
+        self.assertIs(last, program.stmts[2])
+
+    def test_document_reports_errors_of_the_full_text(self):
+        document = Document('const x = 1;')
+
+        with self.assertRaises(ParserError):
+            document.edit(10, 11, '&1')
+
+        self.assertIsNone(document.program)
+        self.assertIsNotNone(document.error)
+
+    def test_document_moves_errors_with_their_lines(self):
+        document = Document('a\n;\n&1;')
+
+        with self.assertRaises(ParserError) as raised:
+            document.edit(1, 2, '')
+
+        self.assertEqual(self.outcome(lambda: self.parser.parse('a;\n&1;')),
+                         (str(raised.exception), raised.exception.lineno))
+        self.assertEqual(2, raised.exception.lineno)
+
+    def test_document_applies_edits_in_order(self):
+        document = Document('const x = 1;')
+
+        program = document.apply([
+            TextEdit(12, 12, '\nconst y = '),
+            TextEdit(23, 23, '2;'),
+        ])
+
+        self.assertEqual(self.parser.parse('const x = 1;\nconst y = 2;'),
+                         program)
+
+    def test_document_matches_a_full_parse_after_random_edits(self):
+        rng = random.Random(42)
+
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                document = Document(f.read())
+
+            for _ in range(50):
+                start = rng.randint(0, len(document.text))
+                end = min(len(document.text), start + rng.randint(0, 8))
+
+                result = self.outcome(
+                    lambda: document.edit(start, end, rng.choice(SNIPPETS)))
+
+                with self.subTest(filename=filename, text=document.text):
+                    self.assertEqual(
+                        self.outcome(lambda: self.parser.parse(document.text)),
+                        result
+                    )
+
+    def test_document_diagnostics_match_a_full_lex_after_random_edits(self):
+        rng = random.Random(7)
+        snippets = SNIPPETS + ['$', ' ## ', '\n`\n', '€€']
+
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                document = Document(f.read())
+
+            for _ in range(50):
+                start = rng.randint(0, len(document.text))
+                end = min(len(document.text), start + rng.randint(0, 8))
+                self.outcome(
+                    lambda: document.edit(start, end, rng.choice(snippets)))
+
+                lexer = Lexer(max_errors=None)
+                lexer.lex(document.text)
+                with self.subTest(filename=filename, text=document.text):
+                    self.assertEqual(lexer.diagnostics, document.diagnostics)
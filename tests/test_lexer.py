@@ -1,7 +1,15 @@
 from ply.lex import LexToken  # type: ignore
+import ast
+import contextlib
+import glob
+import io
+import os
+import tempfile
 import unittest
-from typing import List, Any, TypedDict
+from typing import List, Any, Tuple, TypedDict
 
+from benchmarks.workloads import WORKLOADS
+from lexzig.diagnostics import Diagnostic, TooManyErrors
 from lexzig.lexer import Lexer
 
 TestCase = TypedDict('TestCase', {'type': str, 'value': Any})
@@ -833,6 +841,227 @@ class TestLexer(unittest.TestCase):
             ]
         )
 
+    def test_lexer_starts_every_input_at_the_first_line(self) -> None:
+        """
+        Test that line numbers do not carry over between inputs.
+        """
+        self.lexer.lex('x;\ny;\nz;')
+        tokens: List[LexToken] = self.lexer.lex('\nx;')
+
+        self.assertEqual(2, tokens[0].lineno)  # type: ignore
+        self.assertEqual(1, tokens[0].lexpos)  # type: ignore
+
+    def test_lexers_do_not_share_state(self) -> None:
+        """
+        Test that lexers cloned from the same template are independent.
+        """
+        first, second = Lexer(), Lexer()
+        first.input('const x = 1;')
+        second.input('var y = 2;')
+
+        self.assertEqual('CONST', first.lexer.token().type)
+        self.assertEqual('VAR', second.lexer.token().type)
+        self.assertEqual('IDENT', first.lexer.token().type)
+
+        rules = [rule for _, rules in first.lexer.lexre for rule in rules
+                 if rule and rule[0]]
+        self.assertTrue(all(rule[0].__self__ is first for rule in rules))
+
+
+    def test_lexer_can_lex_buffers_a_chunk_at_a_time(self) -> None:
+        """
+        Test that lexing bytes in small chunks gives the same tokens as
+        lexing the decoded text at once.
+        """
+        input = 'const s = "ñandú\nü";\n// "x\nfor (xs) |x| { y... }\n' * 3
+        expected = [(t.type, t.value, t.lineno, t.lexpos)
+                    for t in self.lexer.lex(input)]
+
+        for chunk_size in [1, 5, 16, 1 << 20]:
+            lexer = Lexer()
+            lexer.input_buffer(input.encode(), chunk_size=chunk_size)
+            actual = [(t.type, t.value, t.lineno, t.lexpos)
+                      for t in lexer.iter_tokens()]
+
+            self.assertEqual(expected, actual, chunk_size)
+
+    def test_lexer_can_lex_files(self) -> None:
+        """
+        Test that the lexer can lex mapped files, including empty ones.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'input.zig')
+
+            with open(filename, 'w') as f:
+                pass
+            self.assertEqual([], list(Lexer().iter_file(filename)))
+
+            with open(filename, 'w') as f:
+                f.write('const x = 1;')
+            tokens = list(Lexer().iter_file(filename))
+
+        self.assertEqual(['CONST', 'IDENT', 'EQUAL', 'INTEGER', 'SEMICOLON'],
+                         [t.type for t in tokens])
+
+    def test_lexer_lets_errors_out_of_files(self) -> None:
+        """
+        Test that an error raised partway through a mapped file comes out
+        as it is, instead of the file failing to close.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'input.zig')
+
+            with open(filename, 'wb') as f:
+                f.write(b'const x = 1;\n\xff\xfe\n')
+            with self.assertRaises(UnicodeDecodeError):
+                list(Lexer().iter_file(filename))
+
+            with open(filename, 'w') as f:
+                f.write('const x = 1;\n' + '$ ' * 3)
+            tokens = Lexer(max_errors=2).iter_file(filename)
+            self.assertEqual('CONST', next(tokens).type)
+            with self.assertRaises(TooManyErrors):
+                list(tokens)
+
+    def test_lexer_collects_runs_of_illegal_characters(self) -> None:
+        """
+        Test that consecutive illegal characters are reported once, without
+        printing them, and that quotes are reported on their own.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            tokens = self.lexer.lex('x $$$ y;\n' + '€' * 20 + '\n"')
+
+        self.assertEqual(['IDENT', 'IDENT', 'SEMICOLON'],
+                         [t.type for t in tokens])
+        self.assertEqual('', output.getvalue())
+        self.assertEqual([
+            Diagnostic("Illegal characters '$$$'", 1, 2, 3),
+            Diagnostic(f"Illegal characters '{'€' * 16}...'", 2, 9, 20),
+            Diagnostic('Illegal character \'"\'', 3, 30, 1),
+        ], self.lexer.diagnostics)
+
+    def test_lexer_stops_after_too_many_errors(self) -> None:
+        """
+        Test that the lexer gives up once it collects max_errors
+        diagnostics, keeping them in the error it raises.
+        """
+        lexer = Lexer(max_errors=2)
+
+        with self.assertRaises(TooManyErrors) as context:
+            lexer.lex('$ x # y ` z')
+
+        self.assertEqual(2, len(context.exception.diagnostics))
+        self.assertEqual(1, context.exception.lineno)
+        self.assertEqual(3, len(Lexer(max_errors=None).lex('$ x # y ` z')))
+
+    def test_lexer_reports_illegal_characters_in_buffers(self) -> None:
+        """
+        Test that lexing bytes in small chunks gives the same diagnostics
+        as lexing the decoded text at once.
+        """
+        input = 'x $$$$$$$$ y;\n"ab\n€€€€ z' * 3
+        self.lexer.lex(input)
+
+        for chunk_size in [1, 5, 16, 1 << 20]:
+            lexer = Lexer()
+            lexer.input_buffer(input.encode(), chunk_size=chunk_size)
+            list(lexer.iter_tokens())
+
+            self.assertEqual(self.lexer.diagnostics, lexer.diagnostics,
+                             chunk_size)
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def corpus() -> List[str]:
+    """
+    Every example, every string in the tests and a small program of every
+    benchmark workload.
+    """
+    inputs = []
+
+    for filename in sorted(glob.glob(os.path.join(ROOT, 'examples', '*.zig'))):
+        with open(filename) as f:
+            inputs.append(f.read())
+
+    for filename in sorted(glob.glob(os.path.join(ROOT, 'tests', '*.py'))):
+        with open(filename) as f:
+            tree = ast.parse(f.read())
+        inputs += [node.value for node in ast.walk(tree)
+                   if isinstance(node, ast.Constant)
+                   and isinstance(node.value, str)]
+
+    inputs += [generate(20) for generate in WORKLOADS.values()]
+    return inputs
+
+
+class TestFastLexer(unittest.TestCase):
+
+    def lex(self, engine: str,
+            input: str) -> Tuple[List[Any], List[Diagnostic]]:
+        lexer = Lexer(engine=engine, max_errors=None)
+        tokens = lexer.lex(input)
+        return ([(t.type, t.value, t.lineno, t.lexpos)  # type: ignore
+                 for t in tokens], lexer.diagnostics)
+
+    def test_fast_lexer_gives_the_tokens_of_the_ply_lexer(self) -> None:
+        """
+        Test that both engines give the same tokens and errors for the whole
+        corpus.
+        """
+        for input in corpus():
+            self.assertEqual(self.lex('ply', input), self.lex('fast', input),
+                             input)
+
+    def test_fast_lexer_reads_tokens_one_at_a_time(self) -> None:
+        """
+        Test that the fast engine leaves lexpos and lineno where PLY does
+        after every token, and can be moved between tokens.
+        """
+        input = 'const x = 1;\n\n  // c\nf(@"a b", 2) $ ;\n' * 100
+
+        def positions(lexer: Lexer) -> List[Any]:
+            lexer.input(input)
+            result = []
+            while (token := lexer.lexer.token()) is not None:
+                result.append((token.type, token.value,  # type: ignore
+                               lexer.lexer.lexpos, lexer.lexer.lineno))
+                if token.type == 'SEMICOLON':  # type: ignore
+                    # Go back to read the semicolon twice.
+                    lexer.lexer.lexpos -= 1
+                    lexer.lexer.token()
+            result.append(lexer.lexer.lexpos)
+            return result
+
+        self.assertEqual(positions(Lexer()), positions(Lexer(engine='fast')))
+
+    def test_fast_lexer_can_lex_buffers(self) -> None:
+        """
+        Test that the fast engine lexes buffers a chunk at a time.
+        """
+        input = 'const s = "ñandú\nü";\n// "x\nfor (xs) |x| { y... }\n' * 3
+        expected, _ = self.lex('ply', input)
+
+        for chunk_size in [1, 5, 16, 1 << 20]:
+            lexer = Lexer(engine='fast')
+            lexer.input_buffer(input.encode(), chunk_size=chunk_size)
+            actual = [(t.type, t.value, t.lineno, t.lexpos)  # type: ignore
+                      for t in lexer.iter_tokens()]
+
+            self.assertEqual(expected, actual, chunk_size)
+
+    def test_lexer_rejects_unknown_engines(self) -> None:
+        """
+        Test that only known engines can be picked, and that PLY options
+        are not accepted by the fast one.
+        """
+        with self.assertRaises(ValueError):
+            Lexer(engine='slow')
+        with self.assertRaises(ValueError):
+            Lexer(engine='fast', debug=True)
+
 
 if __name__ == '__main__':
     unittest.main()
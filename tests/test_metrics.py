@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+
+from lexzig_api.metrics import (Counter, Gauge, Histogram, Metric,
+                                MetricsMiddleware, Registry)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_counters_are_rendered_per_label(self):
+        counter = Counter('analyses_total', 'Analyses run.', ('result',))
+        counter.inc('success')
+        counter.inc('success')
+        counter.inc('parser_error')
+
+        self.assertEqual([
+            '# HELP analyses_total Analyses run.',
+            '# TYPE analyses_total counter',
+            'analyses_total{result="parser_error"} 1',
+            'analyses_total{result="success"} 2',
+        ], counter.render())
+
+    def test_metrics_can_be_read_from_functions(self):
+        hits = [3]
+        gauge = Gauge('cache_hits', 'Cache hits.', function=lambda: hits[0])
+
+        hits[0] = 5
+
+        self.assertEqual('cache_hits 5', gauge.render()[-1])
+
+    def test_histograms_are_cumulative(self):
+        histogram = Histogram('size', 'Sizes.', buckets=(1, 10))
+        for value in (0.5, 1, 5, 20):
+            histogram.observe(value)
+
+        self.assertEqual([
+            'size_bucket{le="1"} 2',
+            'size_bucket{le="10"} 3',
+            'size_bucket{le="+Inf"} 4',
+            'size_sum 26.5',
+            'size_count 4',
+        ], histogram.render()[2:])
+
+    def test_label_values_are_escaped(self):
+        counter = Counter('c', 'C.', ('path',))
+        counter.inc('a"b\\c\n')
+
+        self.assertEqual('c{path="a\\"b\\\\c\\n"} 1', counter.render()[-1])
+
+    def test_metrics_must_say_what_their_samples_are(self):
+        with self.assertRaises(TypeError):
+            Metric('m', 'M.')
+
+    def test_registry_renders_every_metric(self):
+        registry = Registry()
+        registry.register(Counter('a', 'A.')).inc()
+        registry.register(Gauge('b', 'B.')).set(2)
+
+        self.assertEqual('# HELP a A.\n# TYPE a counter\na 1\n'
+                         '# HELP b B.\n# TYPE b gauge\nb 2\n',
+                         registry.render())
+
+    def test_middleware_counts_requests_by_endpoint_and_status(self):
+        def analyse():
+            pass
+
+        async def app(scope, receive, send):
+            scope['endpoint'] = analyse
+            self.assertEqual({(): 1.0}, in_flight.values)
+            await send({'type': 'http.response.start', 'status': 201})
+
+        async def send(message):
+            pass
+
+        requests = Counter('requests', 'R.', ('method', 'endpoint', 'status'))
+        in_flight = Gauge('in_flight', 'F.')
+        seconds = Histogram('seconds', 'S.', ('endpoint',))
+        middleware = MetricsMiddleware(app, requests, in_flight, seconds)
+
+        asyncio.run(middleware({'type': 'http', 'method': 'POST'}, None, send))
+
+        self.assertEqual({('POST', 'analyse', '201'): 1.0}, requests.values)
+        self.assertEqual({(): 0.0}, in_flight.values)
+        self.assertEqual(1, sum(seconds.values[('analyse',)][0]))
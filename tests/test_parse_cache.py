@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+from lexzig.parse_cache import ParseCache, ParseResult
+from lexzig.parser import Parser, ParserError
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(os.path.join(self.directory.name, 'cache'),
+                                max_bytes=1000)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        filename = os.path.join(self.directory.name, name)
+        with open(filename, 'w') as f:
+            f.write(content)
+        return filename
+
+    def test_cache_keys_depend_on_the_contents(self):
+        first = self.write('a.zig', 'const x = 1;')
+        same = self.write('b.zig', 'const x = 1;')
+        other = self.write('c.zig', 'const x = 2;')
+        empty = self.write('d.zig', '')
+
+        self.assertEqual(self.cache.key(first), self.cache.key(same))
+        self.assertNotEqual(self.cache.key(first), self.cache.key(other))
+        self.assertNotEqual(self.cache.key(first), self.cache.key(empty))
+
+    def test_cache_returns_what_was_stored(self):
+        program = Parser().parse('const x = .{ .a = "ñ" };')
+        result = ParseResult(program, output='Illegal character\n',
+                             rendered={'80': 'Program(...)'})
+        failure = ParseResult(None, ParserError('Bad', 3))
+
+        self.cache.put('ok', result)
+        self.cache.put('failed', failure)
+
+        self.assertEqual(result, self.cache.get('ok'))
+        self.assertIsNone(self.cache.get('failed').program)
+        self.assertEqual(('Bad', 3), (self.cache.get('failed').error.message,
+                                      self.cache.get('failed').error.lineno))
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_cache_ignores_unreadable_entries(self):
+        self.cache.put('key', ParseResult(Parser().parse('x;')))
+        with open(os.path.join(self.cache.directory, 'key.lzc'), 'r+b') as f:
+            f.truncate(os.path.getsize(f.name) - 1)
+
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_cache_ignores_entries_nested_too_deeply(self):
+        self.cache.put('key', ParseResult(Parser().parse('x;')))
+        with open(os.path.join(self.cache.directory, 'key.lzc'), 'wb') as f:
+            f.write(b'[' * 100000 + b'\n')
+
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_cache_skips_directories_it_cannot_write(self):
+        # A directory under a file cannot be created, even by root.
+        cache = ParseCache(os.path.join(self.write('file', ''), 'cache'))
+        result = ParseResult(Parser().parse('x;'))
+
+        cache.put('key', result)
+        cache.trim()
+        cache.clear()
+
+        self.assertIsNone(cache.get('key'))
+
+    def test_cache_trims_least_recently_used_entries(self):
+        rendered = {'display': 'x' * 400}
+        for i, key in enumerate(['a', 'b', 'c']):
+            self.cache.put(key, ParseResult(None, rendered=rendered))
+            path = os.path.join(self.cache.directory, key + '.lzc')
+            os.utime(path, (i, i))
+        os.utime(os.path.join(self.cache.directory, 'a.lzc'), (5, 5))
+
+        self.cache.trim()
+
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertIsNotNone(self.cache.get('c'))
+
+    def test_cache_can_be_cleared(self):
+        self.cache.put('key', ParseResult(None))
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual([], os.listdir(self.cache.directory))
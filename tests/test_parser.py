@@ -1,4 +1,11 @@
+import contextlib
+import io
+import pickle
+import sys
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
 
 from lexzig.ast import (Program, FunctionDeclStmt, Identifier, AssignmentStmt,
                         Integer, IfExpr, BinOp, SwitchExpr, SwitchBranch,
@@ -9,7 +16,13 @@ from lexzig.ast import (Program, FunctionDeclStmt, Identifier, AssignmentStmt,
                         UnaryOp, WhileStmt, AssignmentExpr, EnumDeclaration,
                         Char, AnonArray
                         )
-from lexzig.parser import Parser
+from benchmarks.list_scaling import SHAPES
+from lexzig import run_analysis
+from lexzig.descent import DescentParser
+from lexzig.diagnostics import TooManyErrors
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError, ParserHooks
+from test_lexer import corpus
 
 
 class TestParser(unittest.TestCase):
@@ -352,3 +365,363 @@ class TestParser(unittest.TestCase):
                 ]
             ))
         ]), result)
+
+    def test_parser_can_parse_lexed_tokens(self):
+        input = '''
+        const x = 1;
+        pub fn main() void {
+            std.debug.print("{}", .{x});
+        }
+        '''
+        tokens = Lexer().lex(input)
+
+        result = self.parser.parse_tokens(tokens)
+
+        self.assertEqual(self.parser.parse(input), result)
+
+    def test_parser_reports_lines_of_lexed_tokens(self):
+        input = '''
+        const x = 1;
+        const y = &1;
+        '''
+
+        with self.assertRaises(ParserError) as context:
+            self.parser.parse_tokens(Lexer().lex(input))
+
+        self.assertEqual(3, context.exception.lineno)
+
+    def test_parser_errors_keep_their_line_when_pickled(self):
+        error = pickle.loads(pickle.dumps(ParserError('Unexpected', 3)))
+
+        self.assertEqual('Unexpected', error.message)
+        self.assertEqual(3, error.lineno)
+
+    def test_parser_keeps_the_order_of_list_elements(self):
+        input = '''
+        f(1, 2, 3,);
+        const a = .{4, 5, 6};
+        var x = switch (y) {
+            1, 2 => 3,
+            else => 4,
+        };
+        '''
+        expected = Program(stmts=[
+            FunctionCall(Identifier('f'), [Integer(1), Integer(2), Integer(3)]),
+            AssignmentStmt(Identifier('a'), AnonArray(
+                elems=[Integer(4), Integer(5), Integer(6)])),
+            AssignmentStmt(Identifier('x'), SwitchExpr(
+                target=Identifier('y'),
+                branches=[
+                    SwitchBranch(match=SwitchList(elems=[Integer(1), Integer(2)]),
+                                 body=Integer(3)),
+                    SwitchBranch(match=SwitchElse(), body=Integer(4)),
+                ]
+            )),
+        ])
+
+        result = self.parser.parse(input)
+
+        self.assertEqual(expected, result)
+
+    def test_parser_parses_long_lists_in_linear_time(self):
+        # Copying the list on every element makes the time per element grow
+        # tenfold from the small lists to the large ones.
+        small, large = 2000, 50000
+
+        def seconds_per_element(tokens, repeat):
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                self.parser.parse_tokens(tokens)
+                times.append(time.perf_counter() - start)
+            return min(times) / len(tokens)
+
+        for shape, generate in SHAPES.items():
+            with self.subTest(shape=shape):
+                base = seconds_per_element(Lexer().lex(generate(small)), 5)
+                grown = seconds_per_element(Lexer().lex(generate(large)), 1)
+                self.assertLess(grown, 3 * base)
+
+    def test_parser_can_parse_one_statement_at_a_time(self):
+        input = '''
+        const x = 1;
+        pub fn main() void {
+            while (x < 10) : (x += 1) {}
+        }
+        const y = .{ .a = 2 };
+        '''
+
+        result = list(self.parser.iter_parse(input))
+
+        self.assertEqual(self.parser.parse(input).stmts, result)
+
+    def test_parser_yields_statements_before_reading_the_rest(self):
+        tokens = Lexer().lex('const x = 1; const y = 2;')
+        consumed = []
+
+        def feed():
+            for token in tokens:
+                consumed.append(token)
+                yield token
+
+        first = next(self.parser.iter_parse_tokens(feed()))
+
+        self.assertEqual(AssignmentStmt(Identifier('x'), Integer(1)), first)
+        self.assertEqual(tokens[:5], consumed)
+
+    def test_partial_parse_keeps_the_statements_around_errors(self):
+        input = ('const x = 1 $;\nconst y = 1 +;\nconst z = 2;\n'
+                 'const s = "a" + 1;\nconst w =')
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            program, diagnostics = self.parser.partial_parse(input)
+
+        self.assertEqual(Program(stmts=[
+            AssignmentStmt(Identifier('x'), Integer(1)),
+            AssignmentStmt(Identifier('z'), Integer(2)),
+        ]), program)
+        self.assertEqual([
+            ("Illegal character '$'", 1, 12),
+            ('Error while parsing at token: SEMICOLON', 2, 28),
+            ("Invalid types for binary operator '+', expected String and "
+             "String, but got String and Integer", 4, 43),
+            ('Unexpected end of file while parsing, maybe you forgot a '
+             'semicolon?', 5, 62),
+        ], [(d.message, d.lineno, d.lexpos) for d in diagnostics])
+        self.assertEqual('', output.getvalue())
+
+    def test_parser_collects_what_it_finds_wrong(self):
+        input = 'const x = 1 +;\nconst y $= 2;\n'
+        output = io.StringIO()
+        diagnostics = []
+
+        with contextlib.redirect_stdout(output):
+            self.parser.parse(input, diagnostics=diagnostics)
+
+        self.assertEqual('', output.getvalue())
+        self.assertEqual([
+            ('Error while parsing at token: SEMICOLON', 1, 13),
+            ("Illegal character '$'", 2, 23),
+        ], [(d.message, d.lineno, d.lexpos) for d in diagnostics])
+
+        with contextlib.redirect_stdout(output):
+            self.parser.parse(input)
+
+        self.assertEqual('Error while parsing at token: SEMICOLON\n'
+                         "Illegal character '$'\n", output.getvalue())
+
+    def test_run_analysis_collects_what_it_finds_wrong(self):
+        input = 'const x = 1 +;\nconst y $= 2;\n'
+        diagnostics = []
+
+        tokens, program = run_analysis(input, diagnostics)
+
+        self.assertEqual(11, len(tokens))
+        self.assertEqual(self.parser.parse(input, diagnostics=[]), program)
+        self.assertEqual([13, 23], [d.lexpos for d in diagnostics])
+
+    def test_partial_parses_can_share_a_parser_between_threads(self):
+        inputs = ['const x = 1 +;\nconst y = 2;\n' * n for n in range(20, 28)]
+        expected = [self.parser.partial_parse(input) for input in inputs]
+
+        # Switch threads often, so that parses run into each other.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                actual = list(executor.map(self.parser.partial_parse, inputs))
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(expected, actual)
+
+    def test_partial_parse_stops_after_too_many_errors(self):
+        input = 'x +;\n' * 10
+
+        with self.assertRaises(TooManyErrors) as context:
+            self.parser.partial_parse(input, max_errors=3)
+
+        self.assertEqual(3, len(context.exception.diagnostics))
+        self.assertEqual(4, context.exception.lineno)
+        self.assertEqual(10, len(self.parser.partial_parse(
+            input, max_errors=None)[1]))
+
+
+class RecordingHooks(ParserHooks):
+    def __init__(self):
+        self.events = []
+
+    def token_consumed(self, token):
+        self.events.append(('token', token.type))
+
+    def production_reduced(self, production, seconds):
+        self.events.append(('reduced', production))
+
+    def error_recovered(self, token, skipped):
+        self.events.append(('recovered', token.type, skipped))
+
+
+class TestParserHooks(unittest.TestCase):
+    def test_hooks_see_tokens_and_reductions_in_order(self):
+        hooks = RecordingHooks()
+
+        result = Parser(hooks=hooks).parse('x;')
+
+        self.assertEqual(Program(stmts=[Identifier('x')]), result)
+        self.assertEqual([
+            ('token', 'IDENT'),
+            ('reduced', 'empty -> <empty>'),
+            ('reduced', 'stmts -> empty'),
+            ('token', 'SEMICOLON'),
+            ('reduced', 'value_expression -> IDENT'),
+            ('reduced', 'primary_expression -> value_expression'),
+            ('reduced', 'postfix_expression -> primary_expression'),
+            ('reduced', 'expression -> postfix_expression'),
+            ('reduced', 'expression_stmt -> expression SEMICOLON'),
+            ('reduced', 'stmt -> expression_stmt'),
+            ('reduced', 'stmts -> stmts stmt'),
+            ('reduced', 'program -> stmts'),
+        ], hooks.events)
+
+    def test_hooks_see_error_recovery(self):
+        hooks = RecordingHooks()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            Parser(hooks=hooks).parse_tokens(Lexer().lex('x } y z; w;'))
+
+        self.assertIn(('recovered', 'RCURLY', 2), hooks.events)
+        tokens = [event[1] for event in hooks.events if event[0] == 'token']
+        self.assertEqual(['IDENT', 'RCURLY', 'IDENT', 'IDENT', 'SEMICOLON',
+                          'IDENT', 'SEMICOLON'], tokens)
+
+    def test_hooks_do_not_change_the_result(self):
+        input = '''
+        pub fn main() void {
+            var x = switch (y) { 1...2 => 3, else => 4 };
+            while (x < 10) : (x += 1) {}
+        }
+        '''
+
+        result = Parser(hooks=RecordingHooks()).parse(input)
+
+        self.assertEqual(Parser().parse(input), result)
+
+
+# Inputs where the grammar is ambiguous or has odd corners, for the
+# differential tests of the engines.
+TRICKY = [
+    'x = a + b * c - d % e / f;',
+    'x = a - b - c < d;',
+    'x = a < b < c;',
+    'x = a == b != c;',
+    'x = &a * 2 + &b;',
+    'x = &a.b;',
+    'x = try a + b * c;',
+    'x = a + try b + c;',
+    'x = if (a < 1) b + 1 else c * 2 + d;',
+    'x = if (a) b else if (c) d else e;',
+    'x = y = z + 1;',
+    'x = 1 + "a";',
+    'x = 1 / 0; y } z; w;',
+    'x = a.b.c(1, 2 3,).d(e)(f);',
+    'x = .{1, .{2}, .{ .a = 3 }, "s" \'c\'};',
+    'x = .{ .{1} };',
+    'x = .{1 .{2}};',
+    'x = Point{ .x = 1, .y = a + 2, };',
+    'x = Point{};',
+    'x = switch (y) { 1...5 => a, 6, 7, 8 => b, else => c + 1, };',
+    'x = struct { a: i32, b: [4]u8, pub fn f() void {} fn g() !T {} };',
+    'x = enum { a, b, pub fn f() E!void { return a; } };',
+    'export const a: E!i32 = 1; comptime b: [_]T = undefined;',
+    'export fn f(a: i32 b: []u8,) void { _ = a; }',
+    'pub export fn f() void {} for (xs) |x, _| { y; }',
+    'while (x) |y| { z; } while (a < 1) : (a += 1) { b -= 2; }',
+    'f(x',
+    '} x; y;',
+    'x = 1; x }',
+]
+
+
+class TokenFeed:
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+
+    def token(self):
+        return next(self.tokens, None)
+
+
+class TestDescentParser(unittest.TestCase):
+    def parse(self, engine, parse, input):
+        parser = Parser()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                result = parse(parser, input, engine=engine)
+            except ParserError as e:
+                result = (e.message, e.lineno)
+        return result, output.getvalue(), parser.syntax_errors
+
+    def assertSameResult(self, parse, input):
+        self.assertEqual(self.parse('lalr', parse, input),
+                         self.parse('descent', parse, input), input)
+
+    def test_engines_agree_on_the_corpus(self):
+        for input in corpus():
+            self.assertSameResult(Parser.parse, input)
+
+    def programs(self):
+        """
+        The lexed inputs of the corpus that parse without errors.
+        """
+        programs = []
+        for input in corpus():
+            output = io.StringIO()
+            parser = Parser()
+            try:
+                with contextlib.redirect_stdout(output):
+                    tokens = Lexer().lex(input)
+                    parser.parse_tokens(tokens)
+            except ParserError:
+                continue
+            if tokens and not output.getvalue() and not parser.syntax_errors:
+                programs.append(tokens)
+        return programs
+
+    def test_engines_agree_on_broken_programs(self):
+        random = Random(0)
+        programs = self.programs()
+
+        for _ in range(500):
+            program = random.choice(programs)
+            tokens = list(program)
+            for _ in range(random.randint(1, 3)):
+                i = random.randrange(len(tokens) + 1)
+                if random.random() < 0.5:
+                    del tokens[i:i + 1]
+                else:
+                    tokens.insert(i, random.choice(program))
+            self.assertSameResult(Parser.parse_tokens, tokens)
+
+    def test_descent_engine_parses_programs_on_its_own(self):
+        for tokens in self.programs():
+            program = DescentParser(TokenFeed(tokens)).parse()
+
+            self.assertEqual(Parser().parse_tokens(tokens), program)
+
+    def test_engines_agree_one_statement_at_a_time(self):
+        input = '\n'.join(TRICKY)
+
+        self.assertSameResult(
+            lambda parser, input, engine: list(
+                parser.iter_parse(input, engine=engine)), input)
+
+    def test_engines_agree_on_partial_parses(self):
+        for input in corpus():
+            self.assertSameResult(Parser.partial_parse, input)
+
+    def test_parser_rejects_unknown_engines(self):
+        with self.assertRaises(ValueError):
+            Parser().parse('x;', engine='earley')
+        with self.assertRaises(ValueError):
+            Parser(hooks=ParserHooks()).parse('x;', engine='descent')
@@ -0,0 +1,49 @@
+import contextlib
+import io
+import unittest
+
+from lexzig.ast import Identifier, Program
+from lexzig.profiler import ParseProfiler
+
+
+class TestParseProfiler(unittest.TestCase):
+    def test_profiler_counts_reductions_and_tokens(self):
+        profiler = ParseProfiler()
+
+        result = profiler.profile('x; y;')
+
+        self.assertEqual(Program(stmts=[Identifier('x'), Identifier('y')]),
+                         result)
+        self.assertEqual(2, profiler.productions['value_expression -> IDENT'].count)
+        self.assertEqual(1, profiler.productions['program -> stmts'].count)
+        self.assertEqual(2, profiler.tokens['IDENT'].count)
+        self.assertEqual(2, profiler.tokens['SEMICOLON'].count)
+        self.assertEqual(0, profiler.errors)
+
+    def test_profiler_adds_up_several_inputs(self):
+        profiler = ParseProfiler()
+
+        profiler.profile('x;')
+        with contextlib.redirect_stdout(io.StringIO()):
+            profiler.profile('x } y;')
+
+        self.assertEqual(3, profiler.tokens['IDENT'].count)
+        self.assertEqual(1, profiler.errors)
+
+    def test_profiler_time_is_split_between_token_types(self):
+        profiler = ParseProfiler()
+
+        profiler.profile('const a = .{1, 2, 3};' * 50)
+
+        token_seconds = sum(stat.seconds for stat in profiler.tokens.values())
+        self.assertGreater(token_seconds, 0)
+        self.assertLessEqual(token_seconds, profiler.seconds)
+
+    def test_profiler_report_lists_productions_and_tokens(self):
+        profiler = ParseProfiler()
+        profiler.profile('x;')
+
+        report = profiler.report()
+
+        self.assertIn('program -> stmts', report)
+        self.assertIn('SEMICOLON', report)
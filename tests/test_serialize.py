@@ -0,0 +1,58 @@
+import dataclasses
+import json
+import os
+import unittest
+
+from lexzig import run_analysis
+from lexzig.ast import Identifier, Program
+from lexzig.parser import ParserError
+from lexzig.serialize import to_json
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+
+def plain(value):
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+def reference(value):
+    return json.dumps(plain(value), ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+class TestSerialize(unittest.TestCase):
+
+    def test_programs_are_encoded_like_fastapi_does(self):
+        inputs = ['const s = "ñandú \\\\ 日本";\nconst c = \'x\';']
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                inputs.append(f.read())
+
+        for input in inputs:
+            try:
+                tokens, program = run_analysis(input)
+            except ParserError:
+                continue
+
+            content = {'data': {'tokens': list(map(str, tokens)),
+                                'ast': program}}
+            self.assertEqual(reference(content), to_json(content))
+
+    def test_scalars_are_encoded_like_json_does(self):
+        for value in ['', '"\n\t', 0, -12, 1.5, True, False, None, [], {}]:
+            self.assertEqual(reference(value), to_json(value))
+
+    def test_nodes_are_encoded_with_their_type_last(self):
+        self.assertEqual(b'{"stmts":[{"name":"x","type":"identifier"}],'
+                         b'"type":"program"}',
+                         to_json(Program([Identifier('x')])))
+
+    def test_unknown_objects_are_not_encoded(self):
+        with self.assertRaises(TypeError):
+            to_json(object())
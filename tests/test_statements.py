@@ -0,0 +1,78 @@
+import os
+import unittest
+
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser, ParserError
+from lexzig.statements import split_statements
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+
+class TestStatements(unittest.TestCase):
+    parser = Parser()
+
+    def parse_program(self, input):
+        try:
+            return self.parser.parse(input).stmts
+        except ParserError as parser_error:
+            return str(parser_error)
+
+    def parse_statements(self, input):
+        stmts = []
+        try:
+            for statement in split_statements(Lexer().lex(input)):
+                stmts.extend(self.parser.parse_tokens(statement).stmts)
+        except ParserError as parser_error:
+            return str(parser_error)
+        return stmts
+
+    def test_statements_end_at_top_level_semicolons(self):
+        input = '''
+        const x = .{ 1, 2 };
+        const Circle = struct {
+            x: i32,
+
+            pub fn new(x: i32) Circle {
+                return Circle{ .x = x };
+            }
+        };
+        '''
+
+        groups = list(split_statements(Lexer().lex(input)))
+
+        self.assertEqual(2, len(groups))
+        self.assertEqual(['CONST', 'SEMICOLON'],
+                         [groups[1][0].type, groups[1][-1].type])
+
+    def test_functions_and_loops_end_at_their_body(self):
+        input = '''
+        pub export fn f() void { return 1; }
+        for (xs) |x| { _ = x; }
+        while (x < 10) : (x += 1) { _ = x; }
+        '''
+
+        groups = list(split_statements(Lexer().lex(input)))
+
+        self.assertEqual(['PUB', 'FOR', 'WHILE'],
+                         [group[0].type for group in groups])
+
+    def test_stray_closing_brackets_do_not_split_what_follows(self):
+        input = '''
+        } const S = struct { const y = 1; };
+        const x = 1;
+        '''
+
+        groups = list(split_statements(Lexer().lex(input)))
+
+        self.assertEqual([('RCURLY', 'SEMICOLON'), ('CONST', 'SEMICOLON')],
+                         [(group[0].type, group[-1].type) for group in groups])
+        self.assertEqual(13, len(groups[0]))
+
+    def test_statements_parse_like_the_whole_program(self):
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                input = f.read()
+
+            with self.subTest(filename=filename):
+                self.assertEqual(self.parse_program(input),
+                                 self.parse_statements(input))
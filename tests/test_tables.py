@@ -0,0 +1,82 @@
+import hashlib
+import importlib
+import os
+import unittest
+
+import ply.lex as pylex  # type: ignore
+
+from lexzig.lexer import Lexer, LEXTAB_MODULE
+from lexzig.parser import (Parser, GRAMMAR_VERSION, TABLE_MODULE,
+                           shared_parser)
+
+
+class TestTables(unittest.TestCase):
+
+    def test_shipped_tables_match_the_grammar(self) -> None:
+        """
+        Test that the precompiled tables were generated from the current
+        grammar. Run `make tables` if this fails.
+        """
+        tables = importlib.import_module(TABLE_MODULE)
+        signature = hashlib.sha256(tables._lr_signature.encode()).hexdigest()
+
+        self.assertEqual(GRAMMAR_VERSION, signature[:16])
+
+    def test_shipped_lextab_matches_the_lexer_rules(self) -> None:
+        """
+        Test that the precompiled lextab holds the same master regular
+        expression as a lexer built from the rules. Run `make tables` if this
+        fails.
+        """
+        tables = importlib.import_module(LEXTAB_MODULE)
+        fresh = pylex.lex(module=Lexer())
+
+        self.assertEqual(
+            fresh.lexstateretext['INITIAL'],
+            [pattern for pattern, _ in tables._lexstatere['INITIAL']]
+        )
+
+    def test_parser_does_not_write_files(self) -> None:
+        """
+        Test that building a parser does not write debug output or tables.
+        """
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        before = set(os.listdir(package_dir)) | set(
+            os.listdir(os.path.join(package_dir, 'lexzig')))
+
+        Parser().parse('const x = 1;')
+
+        after = set(os.listdir(package_dir)) | set(
+            os.listdir(os.path.join(package_dir, 'lexzig')))
+        self.assertEqual(before, after)
+
+    def test_parsers_bind_their_own_actions(self) -> None:
+        """
+        Test that parsers sharing the tables run their own grammar actions.
+        """
+        first, second = Parser(), Parser()
+        first.parse('const x = 1;')
+        second.parse('const x = 1;')
+
+        first_action = first.parser.productions[1].callable
+        second_action = second.parser.productions[1].callable
+
+        self.assertIs(first, first_action.__self__)
+        self.assertIs(second, second_action.__self__)
+
+    def test_tables_are_loaded_by_the_lalr_engine(self) -> None:
+        """
+        Test that parsers only bind the tables once the lalr engine runs,
+        which the descent engine does not need for valid input.
+        """
+        parser = Parser()
+        self.assertIsNone(parser.parser)
+
+        parser.parse('const x = 1;', engine='descent')
+        self.assertIsNone(parser.parser)
+
+        parser.parse('const x = 1;')
+        self.assertIsNotNone(parser.parser)
+
+    def test_shared_parser_is_built_once(self) -> None:
+        self.assertIs(shared_parser(), shared_parser())
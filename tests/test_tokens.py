@@ -0,0 +1,63 @@
+import os
+import unittest
+
+from lexzig.lexer import Lexer
+from lexzig.parser import Parser
+from lexzig.tokens import TokenStream
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+
+def fields(tokens):
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in tokens]
+
+
+class TestTokenStream(unittest.TestCase):
+
+    def test_stream_has_the_tokens_of_the_lexer(self):
+        inputs = ['''
+        const @"a b" = @import("std");
+        var _ = @"_" + 42;
+        fn f(x: i32) void { switch (x) { 1...3 => 'c', else => "s" } }
+        ''']
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with open(os.path.join(EXAMPLES_DIR, filename)) as f:
+                inputs.append(f.read())
+
+        for input in inputs:
+            self.assertEqual(fields(Lexer().lex(input)),
+                             fields(TokenStream.lex(input)))
+
+    def test_stream_can_be_indexed_and_sliced(self):
+        stream = TokenStream.lex('const x = 1;\nvar y = x;')
+
+        self.assertEqual(10, len(stream))
+        self.assertEqual('VAR', stream[5].type)
+        self.assertEqual(';', stream[-1].value)
+        self.assertEqual('IDENT', stream.kind(1))
+        self.assertEqual('1', stream.text(3))
+
+        second = stream[5:]
+        self.assertEqual(fields(stream)[5:], fields(second))
+        self.assertEqual(fields(stream)[6:8], fields(second[1:3]))
+        self.assertIs(stream.kinds, second.kinds)
+        self.assertEqual(0, len(stream[8:2]))
+
+        with self.assertRaises(IndexError):
+            second[5]
+        with self.assertRaises(ValueError):
+            stream[::2]
+
+    def test_stream_columns_are_exported_without_copies(self):
+        stream = TokenStream.lex('const x = 1;\nvar y = x;')[5:]
+        columns = stream.columns()
+
+        self.assertIs(stream.lines, columns['lines'].obj)
+        self.assertEqual([2] * 5, columns['lines'].tolist())
+        self.assertEqual([13, 17, 19, 21, 22], columns['starts'].tolist())
+
+    def test_stream_can_be_parsed(self):
+        input = 'const x = .{ .a = 1 };\nfn f() void { return x; }'
+
+        self.assertEqual(Parser().parse(input),
+                         Parser().parse_tokens(TokenStream.lex(input)))
@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+import io
+import sys
+import unittest
+
+from lexzig.parser import ParserError
+from lexzig.serialize import to_json
+from lexzig_api import workers
+
+INPUTS = ['const x = 1 +;\nconst y = 2;\n' * n for n in range(20, 28)] + [
+    'const s = "a" + 1;',
+    'const x = 1 $$;\nconst y = ;',
+    'const x =',
+]
+
+
+def analyse(code, partial):
+    try:
+        tokens, program, diagnostics, _ = workers.analyse_code(code, partial)
+    except ParserError as parser_error:
+        return str(parser_error)
+    return tokens, program, diagnostics
+
+
+class TestThreadWorkers(unittest.TestCase):
+
+    def test_analyses_in_threads_do_not_mix(self):
+        jobs = [(code, partial) for code in INPUTS for partial in (False, True)]
+
+        async def run_all():
+            return await asyncio.gather(*(
+                workers.run(analyse, code, partial) for code, partial in jobs))
+
+        # Switch threads often, so that analyses run into each other.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected = [analyse(code, partial) for code, partial in jobs]
+                self.assertIsNone(workers._pool)
+                actual = asyncio.run(run_all())
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(expected, actual)
+
+    def test_analyses_return_what_they_find_wrong_without_printing(self):
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            _, _, diagnostics = analyse('const x = 1 +;\nconst y $= 2;', False)
+
+        self.assertEqual('', output.getvalue())
+        self.assertEqual(['Error while parsing at token: SEMICOLON',
+                          "Illegal character '$'"],
+                         [diagnostic.message for diagnostic in diagnostics])
+
+    def test_json_analyses_are_encoded_like_the_analysis(self):
+        code = 'const x = 1 +;\nconst y = "ñ";'
+
+        for partial in (False, True):
+            tokens, program, diagnostics, _ = workers.analyse_code(code,
+                                                                   partial)
+            body, phases = workers.analyse_json(code, partial)
+
+            self.assertEqual(to_json({'data': {
+                'tokens': tokens, 'ast': program, 'diagnostics': diagnostics,
+            }}), body, partial)
+            self.assertEqual({'lex', 'parse', 'serialize'}, set(phases))